@@ -5,7 +5,10 @@
 python -m file_classifier 실행 시 호출됩니다.
 """
 
+import multiprocessing
+
 from . import main
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()
     main.main()
@@ -27,6 +27,7 @@ else:
 LOGS_DIR = PROJECT_ROOT / "logs"
 UNDO_HISTORY_FILE = PROJECT_ROOT / "undo_history.json"
 USER_SETTINGS_FILE = PROJECT_ROOT / "user_settings.json"
+USER_RULES_FILE = PROJECT_ROOT / "user_rules.json"  # 사용자 분류 규칙 (수정하면 자동으로 다시 로드)
 ENV_FILE = PROJECT_ROOT / ".env"
 
 # 로그 디렉토리 생성
@@ -40,6 +41,29 @@ OPENAI_BASE_URL = os.getenv("OPENAI_BASE_URL", "https://api.openai.com/v1")
 LLM_MODEL = os.getenv("LLM_MODEL", "gpt-3.5-turbo")
 LLM_TEMPERATURE = 0.7
 LLM_MAX_TOKENS = 500
+STRUCTURED_OUTPUT_ENABLED = True  # 공급자 고유의 JSON 스키마 출력 사용 (미지원 모델은 자동으로 일반 출력)
+
+# 단계별 모델 라우팅: 빠르고 저렴한 모델(LLM_FAST_MODEL)로 먼저 분류하고,
+# 확신도가 LLM_ESCALATION_CONFIDENCE 미만이거나 폴더명이 유효하지 않으면 LLM_MODEL로 재분류
+# (LLM_FAST_MODEL을 직접 지정한 경우에만 사용, 주 공급자에만 적용)
+TIERED_ROUTING_ENABLED = False
+LLM_FAST_MODEL = os.getenv("LLM_FAST_MODEL", "")
+LLM_ESCALATION_CONFIDENCE = 0.7
+
+# 다중 공급자 헤징: 주 공급자 응답이 지연 시간 분위수(HEDGE_QUANTILE)보다 늦으면
+# 다른 공급자로 중복 요청을 보내고 먼저 도착한 응답을 사용 (다른 공급자 자격 증명이 있을 때만)
+HEDGING_ENABLED = True
+HEDGE_PROVIDERS = ["openai", "claude", "gemini"]  # 보조 공급자 우선순위
+HEDGE_MODELS = {
+    "openai": "gpt-4o-mini",
+    "claude": "claude-3-haiku-20240307",
+    "gemini": "gemini-1.5-flash",
+}
+HEDGE_QUANTILE = 0.95
+HEDGE_INITIAL_DELAY = 2.0  # 지연 시간 표본이 충분하지 않을 때의 헤징 대기 시간 (초)
+HEDGE_MIN_DELAY = 0.2  # 최소 헤징 대기 시간 (초)
+CIRCUIT_BREAKER_THRESHOLD = 3  # 연속 실패 시 공급자를 차단하는 횟수
+CIRCUIT_BREAKER_RESET_TIMEOUT = 30.0  # 차단 후 재시도까지 대기 시간 (초)
 
 # 자격 증명 소스 설정 (기본값: 'openai' - 환경변수)
 # options: 'openai', 'gemini', 'claude', 'manual'
@@ -57,6 +81,7 @@ MONITOR_INTERVAL = 5
 # 파일 분류 설정
 # ========================
 DEFAULT_FOLDER_NAME = "기타"
+RULES_RELOAD_INTERVAL = 2.0  # 사용자 규칙 파일 변경 확인 간격 (초)
 
 DEFAULT_CATEGORIES = [
     "문서",
@@ -69,7 +94,7 @@ DEFAULT_CATEGORIES = [
 ]
 
 SUPPORTED_EXTENSIONS = {
-    "document": [".pdf", ".docx", ".doc", ".txt", ".xlsx", ".xls"],
+    "document": [".pdf", ".docx", ".doc", ".odt", ".txt", ".xlsx", ".xls"],
     "image": [".png", ".jpg", ".jpeg", ".gif", ".bmp", ".svg"],
     "video": [".mp4", ".avi", ".mov", ".mkv", ".flv"],
     "audio": [".mp3", ".wav", ".flac", ".aac", ".m4a"],
@@ -82,6 +107,8 @@ SUPPORTED_EXTENSIONS = {
 # ========================
 MONITOR_ENABLED = True
 MONITOR_DEBOUNCE_TIME = 1
+# 감시에서 제외할 파일/폴더 이름 패턴 (glob)
+MONITOR_IGNORE_PATTERNS = ["desktop.ini", "Thumbs.db", ".DS_Store", ".git", "__pycache__"]
 
 # ========================
 # 로깅 설정
@@ -111,6 +138,11 @@ MAX_FILE_SIZE = 100 * 1024 * 1024
 MAX_CONTENT_LENGTH = 2500
 CHUNK_SIZE = 1024 * 1024
 FILE_CONFLICT_STRATEGY = "rename"
+VISION_MAX_IMAGE_DIMENSION = 1024  # Vision API 전송 전 이미지 긴 변 최대 픽셀
+VISION_JPEG_QUALITY = 85  # 축소한 이미지의 JPEG 품질
+# 프롬프트에 넣는 내용의 토큰 예산 (공급자별 토큰 추정 기준, 공백/머리글/반복 줄 정리 후 적용)
+PROMPT_CONTENT_TOKEN_BUDGET = 600
+BATCH_CONTENT_TOKEN_BUDGET = 200  # 배치 분류 시 파일당 예산
 
 # ========================
 # 성능 설정
@@ -119,6 +151,54 @@ MAX_WORKERS = 4  # 동시 처리 스레드 수
 TIMEOUT = 30  # API 요청 타임아웃 (초)
 MAX_CONCURRENT_FILE_PROCESSING = 20 # 동시에 처리할 파일 수 (추출/이동)
 MAX_CONCURRENT_API_CALLS = 5 # 동시에 실행할 API 호출 수
+# CPU 부하가 큰 추출(PDF/DOCX 파싱)을 별도 프로세스에서 실행 (텍스트/이미지는 스레드에서 실행)
+EXTRACTION_PROCESS_POOL_ENABLED = True
+EXTRACTION_PROCESS_WORKERS = 0  # 추출 작업 프로세스 수 (0이면 CPU 코어 수)
+EXTRACTION_TASK_TIMEOUT = 60.0  # 파일 하나의 최대 추출 시간 (초, 넘기면 작업 프로세스를 교체)
+EXTRACTION_MAX_TASKS_PER_WORKER = 200  # 작업 프로세스를 새로 띄우기 전까지 처리할 파일 수
+# 공급자별 API 속도 제한 (rpm: 분당 요청 수, tpm: 분당 토큰 수, 0이면 제한 없음)
+# 429 응답 시 동시 호출 수를 절반으로 줄이고, 성공이 이어지면 MAX_CONCURRENT_API_CALLS까지 다시 늘립니다.
+LLM_RATE_LIMITS = {
+    "openai": {"rpm": 500, "tpm": 200000},
+    "claude": {"rpm": 50, "tpm": 40000},
+    "gemini": {"rpm": 60, "tpm": 120000},
+}
+RATE_LIMIT_DEFAULT_BACKOFF = 2.0  # Retry-After 헤더가 없을 때의 기본 대기 시간 (초)
+
+# LLM 응답 캐시 (공급자/모델/temperature/프롬프트가 같으면 API를 다시 호출하지 않음)
+LLM_CACHE_ENABLED = True
+LLM_CACHE_DB_PATH = "llm_cache.db"  # 디스크 캐시 파일 경로
+LLM_CACHE_MEMORY_SIZE = 2048  # 메모리 LRU 캐시 최대 항목 수
+LLM_CACHE_MAX_DISK_ENTRIES = 50000  # 디스크 캐시 최대 항목 수 (오래된 항목부터 삭제)
+MAX_QUEUE_SIZE = 1000 # 처리 대기열 최대 크기 (가득 차면 스캔이 대기)
+SCAN_CHUNK_SIZE = 512 # 폴더 스캔 시 한 번에 캐시 조회/대기열에 넣는 최대 파일 수
+
+# 배치 분류 설정 (여러 파일을 하나의 LLM 요청으로 묶어 처리)
+BATCH_CLASSIFICATION_ENABLED = True
+BATCH_MAX_SIZE = 10  # 배치당 최대 파일 수
+BATCH_MAX_WAIT = 0.5  # 배치를 채우기 위해 대기하는 최대 시간 (초)
+BATCH_CONTENT_LENGTH = 800  # 배치 내 파일당 최대 내용 길이
+
+# 처리 이력 기반 유사 파일 분류 (규칙 검사 다음, API 호출 전 단계)
+KNN_CLASSIFIER_ENABLED = True
+KNN_SIMILARITY_THRESHOLD = 0.75  # 가장 가까운 이력과의 최소 코사인 유사도
+KNN_NEIGHBORS = 5  # 투표에 참여하는 이웃 수
+KNN_MIN_VOTE_RATIO = 0.6  # 한 폴더가 차지해야 하는 최소 투표 비율
+KNN_MAX_DOCUMENTS = 20000  # 색인에 넣는 최대 이력 수 (최신순)
+KNN_SNIPPET_LENGTH = 300  # 이력에 저장하고 특징으로 쓰는 내용 길이
+
+# 반복되는 LLM 분류 결과를 규칙으로 자동 승격 (파일명 토큰 + 확장자 -> 폴더)
+RULE_MINING_ENABLED = True
+RULE_MINING_INTERVAL = 600.0  # 이력을 다시 채굴하는 간격 (초)
+RULE_MIN_SUPPORT = 20  # 승격에 필요한 최소 이력 수
+RULE_MIN_CONSISTENCY = 0.95  # 같은 폴더로 분류된 비율의 최소값
+RULE_MINING_MAX_ROWS = 50000  # 채굴에 사용하는 최대 이력 수 (최신순)
+
+# 기존 대상 폴더 어휘 (관련 폴더를 프롬프트에 넣고, 비슷한 새 폴더명은 기존 이름으로 통일)
+FOLDER_VOCABULARY_ENABLED = True
+FOLDER_VOCABULARY_TOP_K = 20  # 프롬프트에 넣는 최대 기존 폴더 수
+FOLDER_SNAP_THRESHOLD = 0.85  # 기존 폴더명으로 맞추는 최소 정규화 문자열 유사도 (숫자가 다르면 맞추지 않음)
+FOLDER_VOCABULARY_REFRESH_INTERVAL = 5.0  # 대상 폴더 목록 변경 확인 간격 (초)
 
 # ========================
 # 초기화 함수
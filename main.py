@@ -8,6 +8,7 @@ Supports both GUI and CLI modes.
 
 import sys
 import argparse
+import multiprocessing
 import signal
 from pathlib import Path
 
@@ -95,4 +96,6 @@ def main():
 
 
 if __name__ == "__main__":
+    # Frozen (PyInstaller) builds: let spawned extraction workers run their task instead of main()
+    multiprocessing.freeze_support()
     main()
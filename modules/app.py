@@ -29,6 +29,7 @@ from modules.undo_manager import UndoManager
 from modules.watcher import FolderMonitor
 from modules.worker import FileProcessingWorker
 from modules.cli import CLIHandler
+from modules.scanner import iter_files, next_chunk
 
 # UI import (Optional)
 try:
@@ -46,6 +47,9 @@ class FileClassifierApp:
     Supports both GUI and CLI modes.
     """
 
+    # How often a paused scan checks whether it may continue (seconds)
+    PAUSE_POLL_INTERVAL = 0.2
+
     def __init__(self, gui_mode: bool = True):
         """
         Initialize FileClassifierApp
@@ -99,9 +103,10 @@ class FileClassifierApp:
         # Async Initialization
         self.loop = asyncio.new_event_loop()
         asyncio.set_event_loop(self.loop)
-        self.queue = asyncio.Queue()
+        self.queue = asyncio.Queue(maxsize=getattr(cfg, 'MAX_QUEUE_SIZE', 0))
         self.worker_task = None
 
+        # Extraction worker processes start on the first PDF/DOCX, not at launch
         self.extractor = FileExtractor()
         self.classifier: Optional[FileClassifier] = None
         self.mover = FileMover(
@@ -149,10 +154,14 @@ class FileClassifierApp:
             import importlib
             importlib.reload(cfg)
 
+            if self.classifier and self.classifier.rule_miner:
+                self.classifier.rule_miner.stop()
+
             self.classifier = FileClassifier(
                 api_key=cfg.OPENAI_API_KEY,
                 base_url=cfg.OPENAI_BASE_URL,
-                model=cfg.LLM_MODEL
+                model=cfg.LLM_MODEL,
+                destination_root=str(self.mover.base_path)
             )
 
             # Update worker classifier reference if worker exists
@@ -237,31 +246,76 @@ class FileClassifierApp:
              future = asyncio.run_coroutine_threadsafe(self.worker.run(), self.loop)
              self.worker_task = future
 
-        # Scan files
-        count = 0
-        try:
-            # Handle recursion based on config
-            if cfg.RECURSIVE_SEARCH:
-                files = [f for f in folder_path.rglob('*') if f.is_file()]
-            else:
-                files = [f for f in folder_path.glob('*') if f.is_file()]
+        # Stream the folder on the worker loop; the bounded queue throttles the scan
+        asyncio.run_coroutine_threadsafe(self._scan_folder_async(str(folder_path)), self.loop)
 
-            for file_path in files:
-                # Skip hidden files or system files if needed
-                if file_path.name.startswith('.'):
-                    continue
+        if self.gui:
+            self.gui.update_status(f"Scanning {folder_path.name}...")
 
-                self._on_file_created(str(file_path))
-                count += 1
+    async def _scan_folder_async(self, folder: str) -> None:
+        """
+        Stream files from a folder into the processing queue.
+
+        Chunks start small so the first files reach the worker right away,
+        then grow up to SCAN_CHUNK_SIZE to amortize the bulk cache lookup.
+        """
+        scanner = iter_files(folder, recursive=cfg.RECURSIVE_SEARCH)
+        max_chunk = max(1, getattr(cfg, 'SCAN_CHUNK_SIZE', 512))
+        chunk_size = min(32, max_chunk)
+        count = 0
+
+        try:
+            while self.is_running:
+                chunk = await asyncio.to_thread(next_chunk, scanner, chunk_size)
+                if not chunk:
+                    break
+                await self._enqueue_files_async(dict(chunk))
+                count += len(chunk)
+                chunk_size = min(chunk_size * 2, max_chunk)
 
             if self.gui:
-                self.gui.update_status(f"Queued {count} files for classification.")
+                self.gui.safe_update_ui(self.gui.update_status, (f"Queued {count} files for classification.",))
             self.logger.info(f"Queued {count} files from {folder}")
 
         except Exception as e:
-            self.logger.error(f"Error scanning folder: {e}")
+            self.logger.error(f"Error scanning folder: {e}", exc_info=True)
             if self.gui:
-                self.gui.show_error_dialog("Error", f"Failed to scan folder: {e}")
+                self.gui.safe_update_ui(self.gui.show_error_dialog, ("Error", f"Failed to scan folder: {e}"))
+
+    async def _enqueue_files_async(self, signatures: Dict[str, tuple]) -> None:
+        """
+        Queue scanned files, sending cache hits straight to the mover.
+
+        Cached classifications are looked up in bulk by stat signature so
+        that only the misses go through extraction and the LLM; misses are
+        queued as plain paths without being read here. Waits while the queue is
+        full, and holds the chunk while paused instead of dropping it.
+
+        Args:
+            signatures: File path -> stat signature from the scanner.
+        """
+        while self.is_running and self.is_paused:
+            await asyncio.sleep(self.PAUSE_POLL_INTERVAL)
+        if not self.is_running:
+            self.logger.debug(f"Scan skipped: {len(signatures)} files")
+            return
+
+        file_paths = list(signatures)
+        cached = {}
+        if self.classifier:
+            try:
+                # Stat-signature hits only: misses go to the worker, which hashes from its single read
+                cached = await self.classifier.lookup_cached_bulk_async(file_paths, signatures, hash_misses=False)
+            except Exception as e:
+                self.logger.error(f"Bulk cache lookup failed: {e}", exc_info=True)
+
+        for file_path in file_paths:
+            if file_path in cached:
+                await self.queue.put((file_path, cached[file_path]))
+            else:
+                await self.queue.put(file_path)
+
+        self.logger.debug(f"Scan chunk queued: {len(file_paths)} files ({len(cached)} cache hits)")
 
     def _on_start_monitoring(self, folder: str) -> None:
         """Start file monitoring"""
@@ -280,7 +334,8 @@ class FileClassifierApp:
             return
 
         try:
-            self.monitor = FolderMonitor(folder)
+            # Skip the category folders the mover writes into, so moved files are not re-queued
+            self.monitor = FolderMonitor(folder, ignored_dirs=self.mover.destination_folders)
             self.monitor.start(on_file_created=self._on_file_created)
             self.is_running = True
             self.logger.info(f"Monitoring started: {folder}")
@@ -314,7 +369,8 @@ class FileClassifierApp:
             self.logger.debug(f"File skipped: {file_path}")
             return
 
-        self.loop.call_soon_threadsafe(self.queue.put_nowait, file_path)
+        # put() waits for room in the bounded queue instead of dropping the file
+        asyncio.run_coroutine_threadsafe(self.queue.put(file_path), self.loop)
         self.logger.info(f"File queued: {file_path}")
 
     def _on_undo(self) -> None:
@@ -420,6 +476,14 @@ class FileClassifierApp:
                 self.monitor.stop()
                 self.logger.info("Monitoring stopped")
 
+            if self.classifier:
+                if self.classifier.rule_miner:
+                    self.classifier.rule_miner.stop()
+                # Commit any queued history writes before exit
+                self.classifier.history_db.close()
+
+            self.extractor.shutdown()
+
             elapsed_time = (datetime.now() - self.stats['start_time']).total_seconds()
             self.logger.info(f"Final Stats: Processed {self.stats['total_processed']}, "
                            f"Success {self.stats['successful']}, Failed {self.stats['failed']}, "
@@ -5,12 +5,12 @@
 OpenAI LLM API를 사용하여 파일 내용을 분석하고 적절한 폴더 이름을 생성합니다.
 """
 
-import json
+import io
 import re
 import base64
 import logging
 import asyncio
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from enum import Enum
 from pathlib import Path
 import os
@@ -20,12 +20,37 @@ try:
 except ImportError:
     pass
 
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
 import config.config as cfg
 from modules.history_db import ProcessingHistory
-from modules.llm.factory import create_llm_client
+from modules.knn_classifier import NearestNeighborClassifier
+from modules.rule_engine import RuleEngine
+from modules.rule_miner import RuleMiner
+from modules.llm.factory import (
+    create_hedged_llm_client,
+    create_tiered_llm_client,
+    discover_secondary_credentials,
+)
+from modules.llm.base import LLMClient
+from modules.llm.hedging import HedgedLLMClient
 from modules.llm.openai_client import OpenAIClient
-from modules.prompts import CLASSIFICATION_PROMPT, VISION_PROMPT
-from modules.file_rules import FILE_TYPE_MAPPING, EXTENSION_RULES, KEYWORD_RULES
+from modules.llm.rate_limiter import RateLimitExceeded
+from modules.llm.router import TieredLLMClient, TIER_FAST, TIER_STRONG
+from modules.llm.structured import BATCH_CLASSIFICATION_SCHEMA, CLASSIFICATION_SCHEMA, parse_json_lenient
+from modules.prompts import (
+    CLASSIFICATION_PROMPT,
+    VISION_PROMPT,
+    BATCH_CLASSIFICATION_PROMPT,
+    BATCH_FILE_ENTRY,
+    EXISTING_FOLDERS_HINT,
+)
+from modules.folder_vocabulary import FolderVocabulary
+from modules.prompt_builder import PromptBuilder
+from modules.file_rules import FILE_TYPE_MAPPING
 
 logger = logging.getLogger(__name__)
 
@@ -36,6 +61,13 @@ class ClassificationStatus(Enum):
     ERROR = "error"
 
 
+# 관련 기존 폴더를 고를 때 보는 파일명 + 내용 길이
+FOLDER_HINT_TEXT_LENGTH = 500
+
+# 폴백 결과의 사유 접두어 (유사 파일 분류기 학습에서 제외)
+FALLBACK_REASON_PREFIX = "폴백 분류"
+
+
 class FileClassifier:
     """
     OpenAI LLM 기반 파일 분류 클래스
@@ -62,8 +94,20 @@ class FileClassifier:
     # 금지된 문자
     FORBIDDEN_CHARS = r'[\\/:\*\?"<>|]'
 
-    def __init__(self, api_key: Optional[str] = None, base_url: Optional[str] = None, model: Optional[str] = None):
-        """FileClassifier 초기화"""
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        base_url: Optional[str] = None,
+        model: Optional[str] = None,
+        destination_root: Optional[str] = None,
+    ):
+        """
+        FileClassifier 초기화
+
+        Args:
+            destination_root (Optional[str]): 대상 폴더들이 만들어지는 경로 (FileMover.base_path).
+                기존 폴더명을 프롬프트에 넣고 새 폴더명을 기존 폴더명에 맞추는 데 사용합니다.
+        """
         self.api_key = api_key or cfg.OPENAI_API_KEY
         if not self.api_key:
             logger.error("OPENAI_API_KEY가 설정되지 않았습니다")
@@ -73,30 +117,148 @@ class FileClassifier:
         self.temperature = cfg.LLM_TEMPERATURE
         self.max_tokens = cfg.LLM_MAX_TOKENS
         self.timeout = cfg.TIMEOUT
+        self.escalation_confidence = getattr(cfg, 'LLM_ESCALATION_CONFIDENCE', 0.7)
 
         try:
-            self.llm_client = create_llm_client(
-                cfg.CREDENTIAL_SOURCE,
-                self.api_key,
-                self.base_url,
-                self.model,
-                self.temperature,
-                self.max_tokens,
-                self.timeout
-            )
+            self.llm_client = self._create_llm_client()
         except Exception as e:
             logger.error(f"Failed to initialize LLM Client: {e}")
             self.llm_client = None
 
+        # 공급자별 토큰 추정으로 내용을 예산에 맞춰 압축
+        self.prompt_builder = PromptBuilder(
+            getattr(self.llm_client, 'provider', None),
+            token_budget=getattr(cfg, 'PROMPT_CONTENT_TOKEN_BUDGET', 600),
+            max_chars=cfg.MAX_CONTENT_LENGTH,
+        )
+        self.batch_content_budget = getattr(cfg, 'BATCH_CONTENT_TOKEN_BUDGET', 200)
+
         self.history_db = ProcessingHistory()
         self.max_concurrent_requests = getattr(cfg, 'MAX_CONCURRENT_API_CALLS', 5)
         self.semaphore = asyncio.Semaphore(self.max_concurrent_requests)
+        # 진행 중인 분류 작업 (file_hash -> Future), 같은 내용의 동시 요청이 결과를 공유합니다
+        self._inflight: Dict[str, asyncio.Future] = {}
+
+        # 컴파일된 규칙 엔진 (기본 규칙 + 사용자 규칙 파일, 변경 시 자동 재로드)
+        self.rule_engine = RuleEngine(
+            getattr(cfg, 'USER_RULES_FILE', None),
+            reload_interval=getattr(cfg, 'RULES_RELOAD_INTERVAL', 2.0),
+            default_category=cfg.DEFAULT_FOLDER_NAME,
+        )
+
+        # 처리 이력 기반 유사 파일 분류기 (규칙 검사와 API 호출 사이 단계)
+        self.knn_classifier: Optional[NearestNeighborClassifier] = None
+        if getattr(cfg, 'KNN_CLASSIFIER_ENABLED', False):
+            self.knn_classifier = NearestNeighborClassifier(
+                threshold=getattr(cfg, 'KNN_SIMILARITY_THRESHOLD', 0.75),
+                k=getattr(cfg, 'KNN_NEIGHBORS', 5),
+                min_vote_ratio=getattr(cfg, 'KNN_MIN_VOTE_RATIO', 0.6),
+                max_documents=getattr(cfg, 'KNN_MAX_DOCUMENTS', 20000),
+                snippet_length=getattr(cfg, 'KNN_SNIPPET_LENGTH', 300),
+            )
+            self.knn_classifier.load_in_background(self.history_db, FALLBACK_REASON_PREFIX)
+
+        # 기존 대상 폴더 어휘 (프롬프트 후보 + 비슷한 폴더명 통일)
+        self.folder_vocabulary: Optional[FolderVocabulary] = None
+        if getattr(cfg, 'FOLDER_VOCABULARY_ENABLED', False):
+            self.folder_vocabulary = FolderVocabulary(
+                destination_root,
+                top_k=getattr(cfg, 'FOLDER_VOCABULARY_TOP_K', 20),
+                snap_threshold=getattr(cfg, 'FOLDER_SNAP_THRESHOLD', 0.85),
+                refresh_interval=getattr(cfg, 'FOLDER_VOCABULARY_REFRESH_INTERVAL', 5.0),
+            )
+
+        # 반복된 LLM 분류를 규칙으로 승격하는 백그라운드 채굴기
+        self.rule_miner: Optional[RuleMiner] = None
+        if getattr(cfg, 'RULE_MINING_ENABLED', False):
+            self.rule_miner = RuleMiner(
+                self.history_db,
+                min_support=getattr(cfg, 'RULE_MIN_SUPPORT', 20),
+                min_consistency=getattr(cfg, 'RULE_MIN_CONSISTENCY', 0.95),
+                max_rows=getattr(cfg, 'RULE_MINING_MAX_ROWS', 50000),
+                exclude_reason_prefix=FALLBACK_REASON_PREFIX,
+            )
+            self.rule_miner.start(getattr(cfg, 'RULE_MINING_INTERVAL', 600.0), self.rule_engine.set_promoted_rules)
 
         logger.info(f"FileClassifier 초기화됨 - 모델: {self.model}, Base URL: {self.base_url}, Max Concurrent: {self.max_concurrent_requests}")
 
+    def _create_llm_client(self):
+        """
+        LLM 클라이언트를 생성합니다.
+
+        주 공급자(CREDENTIAL_SOURCE) 클라이언트를 만들고, 다른 공급자의 자격 증명이 있으면
+        응답이 느릴 때 보조 공급자로 중복 요청(헤징)하는 클라이언트로 감쌉니다.
+        """
+        primary = self._create_provider_client(cfg.CREDENTIAL_SOURCE, self.api_key, self.base_url, self.model)
+        if not primary or not getattr(cfg, 'HEDGING_ENABLED', False):
+            return primary
+
+        secondaries = []
+        for source, api_key in discover_secondary_credentials(cfg.CREDENTIAL_SOURCE, self.api_key):
+            model = getattr(cfg, 'HEDGE_MODELS', {}).get(source, self.model)
+            try:
+                client = self._create_provider_client(source, api_key, None, model)
+            except Exception as e:
+                logger.warning(f"보조 공급자 클라이언트 생성 실패 ({source}): {e}")
+                continue
+            if client:
+                secondaries.append(client)
+        return create_hedged_llm_client(primary, secondaries)
+
+    def _create_provider_client(self, source: str, api_key: str, base_url: Optional[str], model: str):
+        """공급자 하나의 클라이언트 (빠른 모델이 있으면 단계별 라우팅 포함)"""
+        return create_tiered_llm_client(
+            source,
+            api_key,
+            base_url,
+            model,
+            self._resolve_fast_model(source, model),
+            self.temperature,
+            self.max_tokens,
+            self.timeout,
+            accept=self._accept_fast_response,
+        )
+
+    def _resolve_fast_model(self, source: str, model: str) -> Optional[str]:
+        """1차 분류에 사용할 빠른 모델명 (비활성화되었거나 LLM_FAST_MODEL이 없으면 None)"""
+        if not getattr(cfg, 'TIERED_ROUTING_ENABLED', False) or source != cfg.CREDENTIAL_SOURCE:
+            return None
+        # 공급자/엔드포인트마다 모델 이름이 다르므로 기본 모델을 추측하지 않음
+        fast_model = getattr(cfg, 'LLM_FAST_MODEL', "")
+        if not fast_model or fast_model == model:
+            return None
+        return fast_model
+
+    def _accept_fast_response(self, response_text: str) -> bool:
+        """빠른 모델의 응답을 그대로 사용할지 판단합니다 (False면 상위 모델로 재분류)."""
+        return self._is_confident(self._parse_response(response_text))
+
+    def _is_confident(self, result: Dict[str, Any]) -> bool:
+        """확신도가 기준 이상이고 폴더명이 유효한지 확인합니다."""
+        try:
+            confidence = float(result.get("confidence", 0))
+        except (TypeError, ValueError):
+            return False
+        if confidence < self.escalation_confidence:
+            return False
+        return self._validate_folder_name(result.get("folder_name", "")) is not None
+
+    def _primary_client(self):
+        """헤징 래퍼를 제외한 주 공급자 클라이언트"""
+        if isinstance(self.llm_client, HedgedLLMClient):
+            return self.llm_client.primary
+        return self.llm_client
+
+    def _vision_client(self):
+        """Vision 호출에 사용할 클라이언트 (단계별 라우팅 시 상위 모델)"""
+        client = self._primary_client()
+        if isinstance(client, TieredLLMClient):
+            return client.strong
+        return client
+
     def _prepare_classification_prompt(self, filename: str, file_type: str, content: str) -> str:
         """Helper to prepare the prompt string."""
-        truncated_content = content[:cfg.MAX_CONTENT_LENGTH] if content else ""
+        truncated_content = self.prompt_builder.compress(content)
         content_length = len(content) if content else 0
 
         return CLASSIFICATION_PROMPT.format(
@@ -104,8 +266,25 @@ class FileClassifier:
             file_type=file_type,
             content_length=content_length,
             content=truncated_content,
+            existing_folders=self._existing_folders_hint(f"{filename} {truncated_content[:FOLDER_HINT_TEXT_LENGTH]}"),
         )
 
+    def _schema_kwargs(self, schema: Dict[str, Any]) -> Dict[str, Any]:
+        """공급자 고유의 구조화 출력(JSON 스키마)을 요청하는 호출 인자"""
+        # 스키마 인자를 아는 LLMClient 구현에만 전달 (그 외 클라이언트는 프롬프트의 JSON 형식만 사용)
+        if not getattr(cfg, 'STRUCTURED_OUTPUT_ENABLED', False) or not isinstance(self.llm_client, LLMClient):
+            return {}
+        return {"response_schema": schema}
+
+    def _existing_folders_hint(self, text: str) -> str:
+        """text와 관련 있는 기존 폴더 목록 (프롬프트용, 없으면 빈 문자열)"""
+        if not self.folder_vocabulary:
+            return ""
+        folders = self.folder_vocabulary.relevant(text)
+        if not folders:
+            return ""
+        return EXISTING_FOLDERS_HINT.format(folders=", ".join(folders))
+
     def _check_cache_common(self, file_hash: str, filename: str) -> Optional[Dict[str, Any]]:
         """Common logic for cache checking."""
         if not file_hash:
@@ -119,14 +298,47 @@ class FileClassifier:
 
     # --- Sync/Async Shared Logic Extraction ---
 
-    def _execute_rule_check(self, filename: str, file_type: str) -> Optional[Dict[str, Any]]:
+    def _execute_rule_check(self, filename: str, file_type: str, file_path: Optional[str] = None) -> Optional[Dict[str, Any]]:
         """Execute rule-based checks."""
-        rule_based_result = self.check_rules(filename, file_type)
+        rule_based_result = self.check_rules(filename, file_type, file_path)
         if rule_based_result:
             logger.info(f"규칙 기반 분류 성공: {filename} -> {rule_based_result['folder_name']}")
             return rule_based_result
         return None
 
+    def _execute_knn_check(self, filename: str, file_type: str, content: str) -> Optional[Dict[str, Any]]:
+        """처리 이력에서 비슷한 파일을 찾아 분류합니다 (확신할 수 없으면 None)."""
+        if not self.knn_classifier:
+            return None
+        result = self.knn_classifier.classify(filename, content)
+        if not result:
+            return None
+        folder_name = self._validate_folder_name(result["folder_name"])
+        if not folder_name:
+            return None
+        logger.info(f"유사 파일 기반 분류 성공: {filename} -> {folder_name} ({result['reason']})")
+        return {**result, "folder_name": folder_name, "status": ClassificationStatus.SUCCESS.value}
+
+    async def _execute_knn_check_async(self, filename: str, file_type: str, content: str) -> Optional[Dict[str, Any]]:
+        """비동기 유사 파일 분류 (색인 검색은 CPU를 쓰므로 스레드에서 실행)"""
+        if not self.knn_classifier:
+            return None
+        return await asyncio.to_thread(self._execute_knn_check, filename, file_type, content)
+
+    def _snippet(self, content: Optional[str]) -> Optional[str]:
+        """이력에 함께 저장할 내용 발췌"""
+        if not content:
+            return None
+        return content[:getattr(cfg, 'KNN_SNIPPET_LENGTH', 300)]
+
+    def _learn_result(self, filename: str, content: Optional[str], result: Dict[str, Any]) -> None:
+        """API로 얻은 분류 결과를 유사 파일 분류기에 추가합니다 (폴백 결과 제외)."""
+        if not self.knn_classifier or result.get("status") != ClassificationStatus.SUCCESS.value:
+            return
+        if str(result.get("reason", "")).startswith(FALLBACK_REASON_PREFIX):
+            return
+        self.knn_classifier.add(filename, self._snippet(content), result.get("folder_name", ""), result.get("category", ""))
+
     def _prepare_api_call(self, filename: str, file_type: str, content: str) -> str:
         """Prepare prompt and validate client state before API call."""
         if not filename or not file_type:
@@ -137,66 +349,459 @@ class FileClassifier:
 
         return self._prepare_classification_prompt(filename, file_type, content)
 
+    def _prepare_batch_prompt(self, items: List[Dict[str, Any]]) -> str:
+        """여러 파일 요약을 하나의 배치 프롬프트로 묶습니다."""
+        if not self.llm_client:
+            raise ValueError("LLM Client not initialized")
+
+        max_length = getattr(cfg, 'BATCH_CONTENT_LENGTH', cfg.MAX_CONTENT_LENGTH)
+        entries = []
+        hint_text = []
+        for index, item in enumerate(items):
+            content = item.get("content") or ""
+            compressed = self.prompt_builder.compress(content, self.batch_content_budget)[:max_length]
+            hint_text.append(f"{item['filename']} {compressed[:FOLDER_HINT_TEXT_LENGTH // len(items)]}")
+            entries.append(BATCH_FILE_ENTRY.format(
+                index=index,
+                filename=item["filename"],
+                file_type=item["file_type"],
+                content=compressed,
+            ))
+
+        return BATCH_CLASSIFICATION_PROMPT.format(
+            files="\n".join(entries),
+            count=len(items),
+            existing_folders=self._existing_folders_hint(" ".join(hint_text)),
+        )
+
     # --- Async Methods ---
 
+    async def _lookup_cache_async(self, file_path: Optional[str]) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
+        """
+        캐시된 결과를 조회합니다 (비동기)
+
+        stat 시그니처가 저장 당시와 같으면 파일을 읽지 않고 바로 반환하며,
+        다를 때만 해시를 다시 계산합니다.
+        """
+        if not file_path:
+            return None, None
+
+        stat_hit = await self.history_db.get_result_by_stat_async(file_path)
+        if stat_hit:
+            file_hash, cached = stat_hit
+            logger.info(f"캐시된 결과 사용 (stat): {Path(file_path).name} -> {cached['folder_name']}")
+            return file_hash, {**cached, "status": ClassificationStatus.SUCCESS.value}
+
+        file_hash = await self.history_db.get_file_hash_async(file_path)
+        if file_hash:
+            cached = await self.history_db.get_result_async(file_hash)
+            if cached:
+                logger.info(f"캐시된 결과 사용: {Path(file_path).name} -> {cached['folder_name']}")
+                await asyncio.to_thread(self.history_db.update_signature, file_hash, file_path)
+                return file_hash, {**cached, "status": ClassificationStatus.SUCCESS.value}
+        return file_hash, None
+
+    def lookup_cached_bulk(
+        self,
+        file_paths: List[str],
+        known_signatures: Optional[Dict[str, Tuple[int, int, int]]] = None,
+        hash_misses: bool = True,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        여러 파일의 캐시된 결과를 한 번에 조회합니다.
+
+        stat 시그니처 일괄 조회 후, 남은 파일만 해시를 계산하여 해시 일괄 조회를 수행합니다.
+
+        Args:
+            file_paths: 조회할 파일 경로 목록
+            known_signatures: 스캐너가 이미 구한 경로 -> stat 시그니처 (없는 경로만 stat 호출)
+            hash_misses: stat 조회에서 빠진 파일의 해시를 계산해 다시 조회할지 여부
+                (False면 파일을 읽지 않고, 빠진 파일은 작업자가 추출과 함께 해시를 계산)
+
+        Returns:
+            Dict[str, Dict[str, Any]]: 캐시 적중한 경로 -> 분류 결과
+        """
+        return self._lookup_cache_bulk(file_paths, known_signatures, hash_misses)[1]
+
+    def _lookup_cache_bulk(
+        self,
+        file_paths: List[str],
+        known_signatures: Optional[Dict[str, Tuple[int, int, int]]] = None,
+        hash_misses: bool = True,
+    ) -> Tuple[Dict[str, str], Dict[str, Dict[str, Any]]]:
+        """일괄 캐시 조회 본체 (경로 -> 해시, 경로 -> 캐시 적중 결과)"""
+        known_signatures = known_signatures or {}
+        signatures = {}
+        for file_path in file_paths:
+            signature = known_signatures.get(file_path) or self.history_db.get_stat_signature(file_path)
+            if signature is not None:
+                signatures[file_path] = signature
+
+        hashes: Dict[str, str] = {}
+        hits: Dict[str, Dict[str, Any]] = {}
+        for file_path, (file_hash, cached) in self.history_db.get_results_by_stat_bulk(signatures).items():
+            hashes[file_path] = file_hash
+            hits[file_path] = {**cached, "status": ClassificationStatus.SUCCESS.value}
+
+        missed = {}
+        if hash_misses:
+            for file_path in signatures:
+                if file_path not in hits:
+                    file_hash = self.history_db.get_file_hash(file_path)
+                    if file_hash:
+                        missed[file_path] = hashes[file_path] = file_hash
+
+        hash_results = self.history_db.get_results_bulk(missed.values()) if missed else {}
+        for file_path, file_hash in missed.items():
+            cached = hash_results.get(file_hash)
+            if cached:
+                hits[file_path] = {**cached, "status": ClassificationStatus.SUCCESS.value}
+                self.history_db.update_signature(file_hash, file_path, signatures[file_path])
+
+        logger.debug(f"일괄 캐시 조회: {len(hits)}/{len(file_paths)}개 적중")
+        return hashes, hits
+
+    async def lookup_cached_bulk_async(
+        self,
+        file_paths: List[str],
+        known_signatures: Optional[Dict[str, Tuple[int, int, int]]] = None,
+        hash_misses: bool = True,
+    ) -> Dict[str, Dict[str, Any]]:
+        """비동기 일괄 캐시 조회 (stat/해시 계산은 스레드에서 실행)"""
+        return await asyncio.to_thread(self.lookup_cached_bulk, file_paths, known_signatures, hash_misses)
+
+    async def _save_history_async(
+        self,
+        file_path: Optional[str],
+        file_hash: Optional[str],
+        filename: str,
+        result: Dict[str, Any],
+        content: Optional[str] = None
+    ) -> None:
+        """성공한 분류 결과를 이력 DB에 저장하고 유사 파일 분류기에 학습시킵니다 (비동기)"""
+        if result.get("status") != ClassificationStatus.SUCCESS.value:
+            return
+        self._learn_result(filename, content, result)
+        if file_path and file_hash:
+            signature = await asyncio.to_thread(self.history_db.get_stat_signature, file_path)
+            if signature is None:
+                raise FileNotFoundError(f"파일을 찾을 수 없습니다: {file_path}")
+            await self.history_db.save_result_async(
+                file_hash, filename, signature[0], result,
+                file_path=file_path, signature=signature, snippet=self._snippet(content)
+            )
+
     async def classify_file_async(
         self, filename: str, file_type: str, content: str, file_path: str = None
     ) -> Dict[str, Any]:
         """비동기 파일 분류"""
         try:
             # 1. Cache Check
-            file_hash = None
-            if file_path:
-                file_hash = await self.history_db.get_file_hash_async(file_path)
-                if file_hash:
-                    cached = await self.history_db.get_result_async(file_hash)
-                    if cached:
-                        logger.info(f"캐시된 결과 사용: {Path(file_path).name} -> {cached['folder_name']}")
-                        return {**cached, "status": ClassificationStatus.SUCCESS.value}
+            file_hash, cached = await self._lookup_cache_async(file_path)
+            if cached:
+                return cached
 
             # 2. Rule Check
-            rule_result = self._execute_rule_check(filename, file_type)
+            rule_result = self._execute_rule_check(filename, file_type, file_path)
             if rule_result: return rule_result
 
-            # 3. API Call
-            async with self.semaphore:
-                result = await self._classify_file_api_async(filename, file_type, content)
+            # 3. Similar File Check (history based, no network)
+            knn_result = await self._execute_knn_check_async(filename, file_type, content)
+            if knn_result: return knn_result
 
-            # 4. Save History
-            if file_path and file_hash and result.get("status") == ClassificationStatus.SUCCESS.value:
-                file_size = Path(file_path).stat().st_size
-                await self.history_db.save_result_async(file_hash, filename, file_size, result)
+            # 4. API Call + 5. Save History
+            async def classify_and_save() -> Dict[str, Any]:
+                async with self.semaphore:
+                    result = await self._classify_file_api_async(filename, file_type, content)
+                await self._save_history_async(file_path, file_hash, filename, result, content)
+                return result
 
-            return result
+            if not file_hash:
+                return await classify_and_save()
+            return await self._single_flight(file_hash, classify_and_save, file_path)
 
         except Exception as e:
             return self._handle_classification_error(e, filename, file_type)
 
-    async def _classify_file_api_async(self, filename: str, file_type: str, content: str) -> Dict[str, Any]:
-        """실제 API 호출 로직 (비동기)"""
+    async def _single_flight(self, file_hash: str, factory, file_path: Optional[str] = None) -> Dict[str, Any]:
+        """
+        같은 해시의 분류를 한 번만 실행합니다.
+
+        이미 진행 중인 작업이 있으면 그 결과를 기다려 공유하고, 없으면 factory를 실행하여
+        결과를 다른 대기자들에게 전달합니다. 선행 작업이 실패하거나 취소되면 대기자 중
+        하나가 작업을 이어받습니다. 결과를 공유받은 대기자의 경로(file_path)도 stat
+        시그니처와 함께 기록합니다.
+        """
+        while True:
+            shared = self._inflight.get(file_hash)
+            if shared is None:
+                break
+            try:
+                result = dict(await asyncio.shield(shared))
+            except asyncio.CancelledError:
+                if not shared.cancelled():
+                    raise
+                continue
+            await self._record_shared_result(file_hash, file_path, result)
+            return result
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[file_hash] = future
         try:
-            prompt = self._prepare_api_call(filename, file_type, content)
+            result = await factory()
+        except BaseException:
+            future.cancel()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            if self._inflight.get(file_hash) is future:
+                del self._inflight[file_hash]
+
+    async def _record_shared_result(self, file_hash: str, file_path: Optional[str], result: Dict[str, Any]) -> None:
+        """공유받은 결과의 경로와 stat 시그니처를 기록합니다 (다음 스캔에서 해시 없이 조회)."""
+        if not file_path or result.get("status") != ClassificationStatus.SUCCESS.value:
+            return
+        try:
+            await asyncio.to_thread(self.history_db.update_signature, file_hash, file_path)
+        except Exception as e:
+            logger.error(f"경로 기록 실패 ({file_path}): {e}")
 
-            for attempt in range(3):
-                try:
-                    response_text = await self.llm_client.call_async(prompt)
-                    return self._process_llm_response(response_text, filename, file_type)
+    def _claim_inflight(self, file_hash: Optional[str]) -> Tuple[Optional[asyncio.Future], bool]:
+        """
+        배치 분류용 in-flight 등록
 
-                except Exception as e:
-                    if "rate limit" in str(e).lower():
-                        if attempt == 2: raise
-                        await asyncio.sleep(2 ** attempt)
-                    else:
-                        logger.error(f"API 호출 중 오류 ({attempt+1}/3): {e}")
-                        if attempt == 2: raise
+        Returns:
+            Tuple[Optional[asyncio.Future], bool]: (Future, 직접 처리해야 하는지 여부)
+        """
+        if not file_hash:
+            return None, True
+        shared = self._inflight.get(file_hash)
+        if shared is not None:
+            return shared, False
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[file_hash] = future
+        return future, True
+
+    async def classify_files_batch_async(self, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        비동기 배치 파일 분류
+
+        캐시/규칙으로 해결되지 않은 파일들을 하나의 LLM 요청으로 묶어 분류합니다.
+
+        Args:
+            items: 분류할 파일 목록
+                [{"filename": ..., "file_type": ..., "content": ..., "file_path": ...(선택)}, ...]
+
+        Returns:
+            List[Dict[str, Any]]: items와 같은 순서의 분류 결과 목록
+        """
+        results: List[Optional[Dict[str, Any]]] = [None] * len(items)
+        file_hashes: List[Optional[str]] = [None] * len(items)
+        pending: List[int] = []
+        owned: Dict[int, asyncio.Future] = {}
+        followers: List[Tuple[int, asyncio.Future]] = []
+
+        # 1. 캐시: 배치 전체를 stat/해시 일괄 조회 한 번으로 확인
+        file_paths = [item["file_path"] for item in items if item.get("file_path")]
+        hashes: Dict[str, str] = {}
+        hits: Dict[str, Dict[str, Any]] = {}
+        if file_paths:
+            try:
+                hashes, hits = await asyncio.to_thread(self._lookup_cache_bulk, file_paths)
+            except Exception as e:
+                logger.error(f"배치 캐시 조회 실패: {e}")
+
+        # 2. 규칙: 메모리 안에서 끝나므로 항목별로 바로 확인
+        knn_indices: List[int] = []
+        for index, item in enumerate(items):
+            file_path = item.get("file_path")
+            file_hashes[index] = hashes.get(file_path) if file_path else None
+            if file_path in hits:
+                logger.info(f"캐시된 결과 사용: {item['filename']} -> {hits[file_path]['folder_name']}")
+                results[index] = hits[file_path]
+                continue
+            try:
+                results[index] = self._execute_rule_check(item["filename"], item["file_type"], file_path)
+            except Exception as e:
+                results[index] = self._handle_classification_error(e, item["filename"], item["file_type"])
+            if results[index] is None:
+                knn_indices.append(index)
+
+        # 3. 유사 파일: 남은 항목을 동시에 확인
+        knn_results = await asyncio.gather(*(
+            self._execute_knn_check_async(items[i]["filename"], items[i]["file_type"], items[i].get("content", ""))
+            for i in knn_indices
+        ), return_exceptions=True)
+
+        try:
+            for index, knn_result in zip(knn_indices, knn_results):
+                item = items[index]
+                if isinstance(knn_result, Exception):
+                    results[index] = self._handle_classification_error(knn_result, item["filename"], item["file_type"])
+                    continue
+                if knn_result:
+                    results[index] = knn_result
+                    continue
+
+                # 같은 내용이 이미 분류 중이면 (배치 내 중복 포함) 그 결과를 공유
+                future, is_owner = self._claim_inflight(file_hashes[index])
+                if not is_owner:
+                    followers.append((index, future))
+                    continue
+                if future is not None:
+                    owned[index] = future
+
+                pending.append(index)
+
+            if pending:
+                api_results = await self._classify_batch_api_async([items[i] for i in pending])
+                for index, result in zip(pending, api_results):
+                    item = items[index]
+                    results[index] = result
+                    try:
+                        await self._save_history_async(
+                            item.get("file_path"), file_hashes[index], item["filename"], result, item.get("content")
+                        )
+                    except Exception as e:
+                        logger.error(f"배치 결과 저장 실패 ({item['filename']}): {e}")
+                    if index in owned:
+                        owned[index].set_result(result)
+        finally:
+            for index, future in owned.items():
+                if not future.done():
+                    future.cancel()
+                if self._inflight.get(file_hashes[index]) is future:
+                    del self._inflight[file_hashes[index]]
+
+        for index, future in followers:
+            item = items[index]
+            try:
+                results[index] = dict(await asyncio.shield(future))
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    raise
+                results[index] = await self.classify_file_async(
+                    item["filename"], item["file_type"], item.get("content", ""), item.get("file_path")
+                )
+                continue
+            await self._record_shared_result(file_hashes[index], item.get("file_path"), results[index])
+
+        return results
+
+    async def _call_llm_with_retry_async(self, prompt: str, **call_kwargs) -> str:
+        """
+        LLM을 호출하고 실패 시 재시도합니다 (최대 3회)
+
+        속도 제한(429) 시의 대기는 공급자별 공유 리미터가 Retry-After에 맞춰 처리하므로
+        여기서는 별도로 sleep하지 않고 바로 재시도합니다.
+        """
+        for attempt in range(3):
+            try:
+                return await self.llm_client.call_async(prompt, **call_kwargs)
+            except RateLimitExceeded as e:
+                logger.warning(f"API 속도 제한 ({attempt+1}/3), {e.retry_after or 0:.1f}초 후 재시도")
+                if attempt == 2: raise
+            except Exception as e:
+                logger.error(f"API 호출 중 오류 ({attempt+1}/3): {e}")
+                if attempt == 2: raise
+
+    async def _classify_file_api_async(self, filename: str, file_type: str, content: str, **call_kwargs) -> Dict[str, Any]:
+        """실제 API 호출 로직 (비동기)"""
+        try:
+            prompt = self._prepare_api_call(filename, file_type, content)
+            response_text = await self._call_llm_with_retry_async(
+                prompt, **self._schema_kwargs(CLASSIFICATION_SCHEMA), **call_kwargs
+            )
+            return self._process_llm_response(response_text, filename, file_type, (prompt,))
 
         except Exception as e:
             logger.error(f"비동기 분류 실패: {e}")
             return self._create_fallback_result(filename, file_type, str(e))
 
-    async def classify_image_async(self, image_path: str) -> Dict[str, Any]:
-        """비동기 이미지 분류"""
-        return await asyncio.to_thread(self.classify_image, image_path)
+    async def _classify_batch_api_async(self, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        배치 API 호출 로직 (비동기)
+
+        응답에서 누락되었거나 해석할 수 없는 항목은 개별 API 호출로 폴백합니다.
+        단계별 라우팅 시 배치는 빠른 모델로만 분류하고, 확신도가 낮은 항목만 상위 모델로 개별 재분류합니다.
+        """
+        if len(items) == 1:
+            item = items[0]
+            async with self.semaphore:
+                return [await self._classify_file_api_async(item["filename"], item["file_type"], item.get("content", ""))]
+
+        tiered = isinstance(self._primary_client(), TieredLLMClient)
+        entries: List[Optional[Dict[str, Any]]] = [None] * len(items)
+        escalated: set = set()
+        try:
+            prompt = self._prepare_batch_prompt(items)
+            async with self.semaphore:
+                response_text = await self._call_llm_with_retry_async(
+                    prompt, **self._schema_kwargs(BATCH_CLASSIFICATION_SCHEMA), **({"tier": TIER_FAST} if tiered else {})
+                )
+            try:
+                entries = self._parse_batch_response(response_text, len(items))
+            except ValueError:
+                self._discard_cached_response((prompt,))
+                raise
+            if tiered:
+                for index, entry in enumerate(entries):
+                    if entry is not None and not self._is_confident(entry):
+                        entries[index] = None
+                        escalated.add(index)
+            logger.info(f"배치 분류 완료: {sum(e is not None for e in entries)}/{len(items)}개 항목")
+        except Exception as e:
+            logger.error(f"배치 분류 실패, 개별 분류로 전환: {e}")
+
+        async def resolve(index: int, item: Dict[str, Any], entry: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+            if entry is None:
+                call_kwargs = {"tier": TIER_STRONG} if index in escalated else {}
+                async with self.semaphore:
+                    return await self._classify_file_api_async(
+                        item["filename"], item["file_type"], item.get("content", ""), **call_kwargs
+                    )
+            return self._finalize_llm_result(entry, item["filename"], item["file_type"])
+
+        return list(await asyncio.gather(*(
+            resolve(index, item, entry) for index, (item, entry) in enumerate(zip(items, entries))
+        )))
+
+    async def classify_image_async(self, image_path: str, file_type: Optional[str] = None) -> Dict[str, Any]:
+        """
+        비동기 이미지 분류
+
+        이미지 축소/인코딩만 스레드에서 수행하고, Vision API는 비동기로 호출합니다.
+        API 호출은 분류기 세마포어로 동시 실행 수가 제한됩니다.
+        file_type(내용으로 판별한 형식)이 없으면 확장자를 사용합니다.
+        """
+        logger.info(f"이미지 분류 시작: {image_path}")
+
+        try:
+            file_type = (file_type or Path(image_path).suffix.lstrip(".")).lower()
+            precheck = self._precheck_image(image_path, file_type)
+            if precheck:
+                return precheck
+
+            filename = Path(image_path).name
+
+            image_data, mime_type = await asyncio.to_thread(self._prepare_image_payload, image_path, file_type)
+            prompt = VISION_PROMPT.format(
+                filename=filename, file_type=file_type, existing_folders=self._existing_folders_hint(filename)
+            )
+
+            async with self.semaphore:
+                response = await self._vision_client().call_vision_async(
+                    prompt, image_data, mime_type, **self._schema_kwargs(CLASSIFICATION_SCHEMA)
+                )
+            return self._process_llm_response(response, filename, file_type, (prompt, mime_type, image_data))
+
+        except Exception as e:
+            error_msg = f"이미지 분류 중 오류: {str(e)}"
+            logger.error(error_msg, exc_info=True)
+            filename = Path(image_path).name if image_path else "unknown"
+            return self._create_fallback_result(filename, "image", error_msg)
 
     # --- Sync Methods ---
 
@@ -210,64 +815,70 @@ class FileClassifier:
             # 1. Cache Check
             file_hash = None
             if file_path:
+                stat_hit = self.history_db.get_result_by_stat(file_path)
+                if stat_hit:
+                    logger.info(f"캐시된 결과 사용 (stat): {Path(file_path).name} -> {stat_hit[1]['folder_name']}")
+                    return {**stat_hit[1], "status": ClassificationStatus.SUCCESS.value}
+
                 file_hash = self.history_db.get_file_hash(file_path)
                 if file_hash:
                     cached = self.history_db.get_result(file_hash)
                     if cached:
                         logger.info(f"캐시된 결과 사용: {Path(file_path).name} -> {cached['folder_name']}")
+                        self.history_db.update_signature(file_hash, file_path)
                         return {**cached, "status": ClassificationStatus.SUCCESS.value}
 
             # 2. Rule Check
-            rule_result = self._execute_rule_check(filename, file_type)
+            rule_result = self._execute_rule_check(filename, file_type, file_path)
             if rule_result: return rule_result
 
-            # 3. API Call
-            prompt = self._prepare_api_call(filename, file_type, content)
-            response = self.llm_client.call(prompt)
-            result = self._process_llm_response(response, filename, file_type)
+            # 3. Similar File Check
+            knn_result = self._execute_knn_check(filename, file_type, content)
+            if knn_result: return knn_result
 
-            # 4. Save History
-            if file_path and file_hash and result.get("status") == ClassificationStatus.SUCCESS.value:
-                file_size = Path(file_path).stat().st_size
-                self.history_db.save_result(file_hash, filename, file_size, result)
+            # 4. API Call
+            prompt = self._prepare_api_call(filename, file_type, content)
+            response = self.llm_client.call(prompt, **self._schema_kwargs(CLASSIFICATION_SCHEMA))
+            result = self._process_llm_response(response, filename, file_type, (prompt,))
+
+            # 5. Save History
+            if result.get("status") == ClassificationStatus.SUCCESS.value:
+                self._learn_result(filename, content, result)
+                if file_path and file_hash:
+                    signature = self.history_db.get_stat_signature(file_path)
+                    if signature is None:
+                        raise FileNotFoundError(f"파일을 찾을 수 없습니다: {file_path}")
+                    self.history_db.save_result(
+                        file_hash, filename, signature[0], result,
+                        file_path=file_path, signature=signature, snippet=self._snippet(content)
+                    )
 
             return result
 
         except Exception as e:
             return self._handle_classification_error(e, filename, file_type)
 
-    def classify_image(self, image_path: str) -> Dict[str, Any]:
-        """이미지 분류"""
+    def classify_image(self, image_path: str, file_type: Optional[str] = None) -> Dict[str, Any]:
+        """이미지 분류 (file_type이 없으면 확장자 사용)"""
         logger.info(f"이미지 분류 시작: {image_path}")
 
         try:
-            if not Path(image_path).exists():
-                return self._create_error_result(f"파일을 찾을 수 없습니다: {image_path}")
+            file_type = (file_type or Path(image_path).suffix.lstrip(".")).lower()
+            precheck = self._precheck_image(image_path, file_type)
+            if precheck:
+                return precheck
 
             filename = Path(image_path).name
-            file_type = Path(image_path).suffix.lstrip(".").lower()
-
-            rule_based_result = self.check_rules(filename, file_type)
-            if rule_based_result:
-                 return rule_based_result
 
-            if not self.is_image_file(file_type):
-                return self._create_fallback_result(filename, file_type, "이미지 파일이 아닙니다")
-
-            if not isinstance(self.llm_client, OpenAIClient):
-                 return self._create_fallback_result(filename, file_type, "Vision API not supported by current provider")
-
-            image_data = self._encode_image_to_base64(image_path)
-            prompt = VISION_PROMPT.format(filename=filename, file_type=file_type)
-
-            mime_types = {
-                "jpg": "image/jpeg", "jpeg": "image/jpeg", "png": "image/png",
-                "gif": "image/gif", "webp": "image/webp",
-            }
-            mime_type = mime_types.get(file_type, "image/jpeg")
+            image_data, mime_type = self._prepare_image_payload(image_path, file_type)
+            prompt = VISION_PROMPT.format(
+                filename=filename, file_type=file_type, existing_folders=self._existing_folders_hint(filename)
+            )
 
-            response = self.llm_client.call_vision(prompt, image_data, mime_type)
-            return self._process_llm_response(response, filename, file_type)
+            response = self._vision_client().call_vision(
+                prompt, image_data, mime_type, **self._schema_kwargs(CLASSIFICATION_SCHEMA)
+            )
+            return self._process_llm_response(response, filename, file_type, (prompt, mime_type, image_data))
 
         except Exception as e:
             error_msg = f"이미지 분류 중 오류: {str(e)}"
@@ -277,16 +888,59 @@ class FileClassifier:
 
     # --- Helpers ---
 
+    def _precheck_image(self, image_path: str, file_type: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        이미지 분류 전 검사
+
+        Returns:
+            Optional[Dict[str, Any]]: API 호출 없이 반환할 결과 (Vision 호출이 필요하면 None)
+        """
+        if not Path(image_path).exists():
+            return self._create_error_result(f"파일을 찾을 수 없습니다: {image_path}")
+
+        filename = Path(image_path).name
+        file_type = (file_type or Path(image_path).suffix.lstrip(".")).lower()
+
+        rule_based_result = self.check_rules(filename, file_type, image_path)
+        if rule_based_result:
+            return rule_based_result
+
+        if not self.is_image_file(file_type):
+            return self._create_fallback_result(filename, file_type, "이미지 파일이 아닙니다")
+
+        if not isinstance(self._vision_client(), OpenAIClient):
+            return self._create_fallback_result(filename, file_type, "Vision API not supported by current provider")
+
+        return None
+
     def _handle_classification_error(self, error: Exception, filename: str, file_type: str) -> Dict[str, Any]:
         """Centralized error handling."""
         error_msg = f"분류 중 오류 발생: {str(error)}"
         logger.error(error_msg, exc_info=True)
         return self._create_fallback_result(filename, file_type, error_msg)
 
-    def _process_llm_response(self, response_text: str, filename: str, file_type: str) -> Dict[str, Any]:
-        """Helper to process LLM response and validate folder name."""
-        result = self._parse_response(response_text)
+    def _process_llm_response(
+        self, response_text: str, filename: str, file_type: str, cache_parts: Tuple[str, ...] = ()
+    ) -> Dict[str, Any]:
+        """Helper to process LLM response and validate folder name.
 
+        cache_parts identifies the cached response (prompt and any extra key parts)
+        so that an unparseable reply is evicted instead of being served again.
+        """
+        try:
+            result = self._parse_response(response_text)
+        except ValueError:
+            self._discard_cached_response(cache_parts)
+            raise
+        return self._finalize_llm_result(result, filename, file_type)
+
+    def _discard_cached_response(self, cache_parts: Tuple[str, ...]):
+        """해석할 수 없는 LLM 응답을 응답 캐시에서 제거합니다."""
+        if cache_parts and self.llm_client:
+            self.llm_client.invalidate_cached(*cache_parts)
+
+    def _finalize_llm_result(self, result: Dict[str, Any], filename: str, file_type: str) -> Dict[str, Any]:
+        """Validate folder name of a parsed result, falling back when invalid."""
         folder_name = result.get("folder_name", "")
         validated_folder_name = self._validate_folder_name(folder_name)
 
@@ -294,54 +948,103 @@ class FileClassifier:
             if result.get("status", "") != "error":
                 logger.warning(f"폴더명 검증 실패: {folder_name}, 폴백 사용")
             validated_folder_name = self._create_fallback_folder_name(filename, file_type)
+        elif self.folder_vocabulary:
+            validated_folder_name = self.folder_vocabulary.snap(validated_folder_name)
+            self.folder_vocabulary.record(validated_folder_name)
 
         result["folder_name"] = validated_folder_name
         result["status"] = ClassificationStatus.SUCCESS.value
         return result
 
-    def check_rules(self, filename: str, file_type: str) -> Optional[Dict[str, Any]]:
-        """규칙 기반 분류 (Hierarchical Filtering)"""
-        file_type_lower = file_type.lower()
-        filename_lower = filename.lower()
-
-        for keyword, folder in KEYWORD_RULES.items():
-            if keyword in filename_lower:
-                return {
-                    "status": ClassificationStatus.SUCCESS.value,
-                    "folder_name": folder,
-                    "category": FILE_TYPE_MAPPING.get(file_type_lower, cfg.DEFAULT_FOLDER_NAME),
-                    "confidence": 1.0,
-                    "reason": f"파일명 키워드 매칭 ('{keyword}')"
-                }
-
-        if file_type_lower in EXTENSION_RULES:
-            folder_name = EXTENSION_RULES[file_type_lower]
-            return {
-                "status": ClassificationStatus.SUCCESS.value,
-                "folder_name": folder_name,
-                "category": FILE_TYPE_MAPPING.get(file_type_lower, cfg.DEFAULT_FOLDER_NAME),
-                "confidence": 0.95,
-                "reason": f"확장자 기반 규칙 ('{file_type}')"
-            }
+    def check_rules(self, filename: str, file_type: str, file_path: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        규칙 기반 분류 (Hierarchical Filtering)
 
-        return None
+        기본 규칙(키워드 > 확장자)과 사용자 규칙 파일을 컴파일한 규칙 엔진으로 검사합니다.
+        file_path가 있으면 파일 크기 규칙도 적용됩니다.
+        """
+        matched = self.rule_engine.match(filename, file_type, file_path=file_path)
+        if not matched:
+            return None
+        return {"status": ClassificationStatus.SUCCESS.value, **matched[1]}
+
+    def list_promoted_rules(self, include_revoked: bool = True) -> List[Dict[str, Any]]:
+        """처리 이력에서 승격된 규칙 목록 (감사용)"""
+        return self.history_db.get_promoted_rules(include_revoked=include_revoked)
+
+    def revoke_promoted_rule(self, rule_id: int) -> bool:
+        """
+        승격된 규칙을 취소하고 규칙 엔진에서 바로 제외합니다.
+
+        Returns:
+            bool: 취소했으면 True
+        """
+        revoked = self.history_db.revoke_promoted_rule(rule_id)
+        if revoked:
+            logger.info(f"승격 규칙 취소: #{rule_id}")
+            if self.rule_miner:
+                self.rule_engine.set_promoted_rules(self.rule_miner.active_rules())
+        return revoked
 
     def _parse_response(self, response_text: str) -> Dict[str, Any]:
+        """
+        단일 분류 응답(JSON 객체)을 파싱합니다.
+
+        코드블록/앞뒤 설명/마지막 쉼표를 허용하고, 잘린 응답은 완전한 필드까지만 사용합니다.
+        """
         try:
-            cleaned = re.sub(r"```(?:json)?\n?", "", response_text)
-            cleaned = cleaned.strip()
-            result = json.loads(cleaned)
-
-            required_fields = ["folder_name", "category", "confidence", "reason"]
-            for field in required_fields:
-                if field not in result:
-                    if field == "confidence": result[field] = 0.5
-                    else: result[field] = ""
-            return result
-        except json.JSONDecodeError as e:
+            parsed = parse_json_lenient(response_text or "")
+        except ValueError as e:
             logger.error(f"JSON 파싱 실패: {str(e)}")
             raise ValueError(f"JSON 파싱 실패: {str(e)}")
 
+        if isinstance(parsed, dict) and isinstance(parsed.get("results"), list) and "folder_name" not in parsed:
+            parsed = parsed["results"][0] if parsed["results"] else None
+        elif isinstance(parsed, list):
+            parsed = parsed[0] if parsed else None
+        if not isinstance(parsed, dict) or not parsed.get("folder_name"):
+            logger.error("JSON 파싱 실패: folder_name이 없습니다")
+            raise ValueError("JSON 파싱 실패: folder_name이 없습니다")
+        return self._fill_required_fields(parsed)
+
+    def _parse_batch_response(self, response_text: str, count: int) -> List[Optional[Dict[str, Any]]]:
+        """
+        배치 응답({"results": [...]} 또는 JSON 배열)을 파싱합니다.
+
+        Returns:
+            List[Optional[Dict[str, Any]]]: 입력 순서에 맞춘 결과 (누락/손상 항목은 None)
+        """
+        try:
+            parsed = parse_json_lenient(response_text or "")
+        except ValueError as e:
+            logger.error(f"배치 JSON 파싱 실패: {str(e)}")
+            raise ValueError(f"배치 JSON 파싱 실패: {str(e)}")
+
+        if isinstance(parsed, dict):
+            parsed = parsed["results"] if isinstance(parsed.get("results"), list) else [parsed]
+        if not isinstance(parsed, list):
+            raise ValueError("배치 응답이 JSON 배열이 아닙니다")
+
+        entries: List[Optional[Dict[str, Any]]] = [None] * count
+        for position, entry in enumerate(parsed):
+            # 잘린 응답에서 복구된 불완전한 항목은 개별 분류로 넘김
+            if not isinstance(entry, dict) or not entry.get("folder_name"):
+                continue
+            index = entry.pop("index", position)
+            if not isinstance(index, int) or not 0 <= index < count or entries[index] is not None:
+                index = position
+            if index < count and entries[index] is None:
+                entries[index] = self._fill_required_fields(entry)
+        return entries
+
+    def _fill_required_fields(self, result: Dict[str, Any]) -> Dict[str, Any]:
+        required_fields = ["folder_name", "category", "confidence", "reason"]
+        for field in required_fields:
+            if field not in result:
+                if field == "confidence": result[field] = 0.5
+                else: result[field] = ""
+        return result
+
     def _validate_folder_name(self, folder_name: str) -> Optional[str]:
         if not folder_name: return None
         cleaned = re.sub(self.FORBIDDEN_CHARS, "", folder_name).strip()
@@ -374,7 +1077,7 @@ class FileClassifier:
             "folder_name": folder_name,
             "category": category,
             "confidence": 0.5,
-            "reason": f"폴백 분류 (오류: {error_msg})",
+            "reason": f"{FALLBACK_REASON_PREFIX} (오류: {error_msg})",
         }
 
     def is_image_file(self, file_type: str) -> bool:
@@ -383,3 +1086,42 @@ class FileClassifier:
     def _encode_image_to_base64(self, image_path: str) -> str:
         with open(image_path, "rb") as image_file:
             return base64.b64encode(image_file.read()).decode("utf-8")
+
+    def _prepare_image_payload(self, image_path: str, file_type: str) -> Tuple[str, str]:
+        """
+        Vision API로 보낼 이미지를 준비합니다.
+
+        긴 변이 VISION_MAX_IMAGE_DIMENSION을 넘으면 Pillow로 축소 후 다시 인코딩하여
+        토큰, 전송량, 메모리 사용량을 줄입니다. JPEG는 디코딩 단계에서부터 축소(draft)합니다.
+
+        Returns:
+            Tuple[str, str]: (base64 데이터, MIME 타입)
+        """
+        mime_types = {
+            "jpg": "image/jpeg", "jpeg": "image/jpeg", "png": "image/png",
+            "gif": "image/gif", "webp": "image/webp",
+        }
+        mime_type = mime_types.get(file_type, "image/jpeg")
+        max_dimension = getattr(cfg, 'VISION_MAX_IMAGE_DIMENSION', 0)
+
+        if Image and max_dimension and file_type in mime_types:
+            try:
+                with Image.open(image_path) as img:
+                    if max(img.size) > max_dimension:
+                        img.draft("RGB", (max_dimension, max_dimension))
+                        img.thumbnail((max_dimension, max_dimension))
+
+                        buffer = io.BytesIO()
+                        if img.mode in ("RGBA", "LA", "P"):
+                            img.save(buffer, format="PNG", optimize=True)
+                            mime_type = "image/png"
+                        else:
+                            img.convert("RGB").save(
+                                buffer, format="JPEG", quality=getattr(cfg, 'VISION_JPEG_QUALITY', 85)
+                            )
+                            mime_type = "image/jpeg"
+                        return base64.b64encode(buffer.getbuffer()).decode("ascii"), mime_type
+            except Exception as e:
+                logger.warning(f"이미지 축소 실패, 원본 사용 ({image_path}): {e}")
+
+        return self._encode_image_to_base64(image_path), mime_type
@@ -45,7 +45,7 @@ class CLIHandler:
 
         try:
             while True:
-                print("\nCommands: classify, monitor, stats, quit")
+                print("\nCommands: classify, monitor, stats, rules, revoke, quit")
                 command = input("> ").strip().lower()
 
                 if command == "quit":
@@ -56,6 +56,10 @@ class CLIHandler:
                     self._monitor_folder()
                 elif command == "stats":
                     self._show_statistics()
+                elif command == "rules":
+                    self._show_promoted_rules()
+                elif command == "revoke":
+                    self._revoke_promoted_rule()
                 else:
                     print("Unknown command.")
         except KeyboardInterrupt:
@@ -184,3 +188,37 @@ class CLIHandler:
             print(f"\n[Categories]")
             for cat, count in sorted(stats['categories'].items()):
                 print(f"  {cat}: {count}")
+
+    def _show_promoted_rules(self) -> None:
+        """CLI: List rules promoted from processing history (audit)."""
+        if not self.app.classifier:
+            print("Error: Classifier not initialized.")
+            return
+
+        rules = self.app.classifier.list_promoted_rules(include_revoked=True)
+        if not rules:
+            print("No promoted rules yet.")
+            return
+
+        print(f"\n[Promoted Rules]")
+        for rule in rules:
+            status = rule['status'] if rule['status'] == 'active' else f"{rule['status']} {rule['revoked_at']}"
+            print(f"  #{rule['id']} '{rule['keyword']}' .{rule['extension']} -> {rule['folder_name']} "
+                  f"(support {rule['support']}, consistency {rule['consistency']:.0%}, "
+                  f"since {rule['created_at']}, {status})")
+
+    def _revoke_promoted_rule(self) -> None:
+        """CLI: Revoke a promoted rule so files go back to the LLM."""
+        if not self.app.classifier:
+            print("Error: Classifier not initialized.")
+            return
+
+        rule_id = input("Rule id: ").strip().lstrip('#')
+        if not rule_id.isdigit():
+            print("Error: Invalid rule id.")
+            return
+
+        if self.app.classifier.revoke_promoted_rule(int(rule_id)):
+            print(f"Rule #{rule_id} revoked.")
+        else:
+            print(f"Error: No active rule #{rule_id}.")
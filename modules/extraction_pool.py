@@ -0,0 +1,201 @@
+# -*- coding: utf-8 -*-
+"""
+추출 프로세스 풀 모듈
+
+PDF/DOCX 파싱처럼 GIL을 쥐고 CPU를 쓰는 추출을 별도 프로세스에서 실행해
+여러 코어를 쓰고, 이벤트 루프가 추출에 막히지 않게 합니다.
+
+- 미리 띄우기: warm_up()으로 작업 프로세스를 시작하고 추출 모듈을 미리 import합니다.
+- 작업 시간 제한: 동시에 보내는 작업을 작업 프로세스 수로 제한해 시간은 실행 시간만 재고,
+  task_timeout을 넘긴 작업은 실패로 처리한 뒤 멈춘 프로세스를 정리하기 위해 풀을 새로 만듭니다.
+- 프로세스 교체: 작업 프로세스는 max_tasks_per_worker개를 처리한 뒤 새 프로세스로 바뀝니다
+  (파서의 메모리 누수/단편화 방지, Python 3.11 이상).
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import os
+import sys
+import threading
+from concurrent.futures import ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+# ProcessPoolExecutor(max_tasks_per_child=...)와 Task.cancelling()은 Python 3.11부터 지원
+_HAS_TASK_RECYCLING = sys.version_info >= (3, 11)
+
+# 작업 프로세스마다 하나씩 만드는 FileExtractor (프로세스 풀을 쓰지 않는 인스턴스)
+_worker_extractor = None
+
+
+def _init_worker():
+    """작업 프로세스 초기화: 추출기와 파서 모듈을 미리 불러옵니다."""
+    global _worker_extractor
+    from modules.extractor import FileExtractor
+    _worker_extractor = FileExtractor(use_process_pool=False)
+
+
+def _ping() -> int:
+    return os.getpid()
+
+
+def _run_handler(handler: Union[str, Callable[[str], Dict[str, Any]]], file_path: str) -> Optional[Dict[str, Any]]:
+    """작업 프로세스에서 핸들러 실행 (문자열이면 FileExtractor의 메서드 이름)"""
+    if isinstance(handler, str):
+        handler = getattr(_worker_extractor, handler)
+    return handler(file_path)
+
+
+class ExtractionTimeout(Exception):
+    """추출 작업이 제한 시간을 넘김"""
+    pass
+
+
+class ExtractionProcessPool:
+    """
+    CPU 부하가 큰 추출 핸들러용 프로세스 풀
+
+    풀은 처음 사용할 때(또는 warm_up) 만들어지며, 작업 프로세스는 spawn으로 시작합니다
+    (이벤트 루프/DB 스레드가 있는 부모 프로세스를 fork하지 않음).
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        task_timeout: float = 60.0,
+        max_tasks_per_worker: Optional[int] = 200,
+        start_method: str = "spawn",
+    ):
+        """
+        ExtractionProcessPool 초기화
+
+        Args:
+            max_workers (Optional[int]): 작업 프로세스 수 (없거나 0이면 CPU 코어 수)
+            task_timeout (float): 파일 하나의 최대 추출 시간 (초)
+            max_tasks_per_worker (Optional[int]): 작업 프로세스 교체 주기 (없거나 0이면 교체하지 않음)
+            start_method (str): multiprocessing 시작 방식 (fork에서는 프로세스 교체를 쓸 수 없음)
+        """
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.task_timeout = task_timeout
+        self.max_tasks_per_worker = max_tasks_per_worker or None
+        self.start_method = start_method
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+        # 이벤트 루프별 동시 작업 제한 (대기열에 쌓인 시간이 제한 시간에 포함되지 않도록)
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._slots_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _ensure_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                options = {}
+                if _HAS_TASK_RECYCLING and self.max_tasks_per_worker:
+                    options["max_tasks_per_child"] = self.max_tasks_per_worker
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context(self.start_method),
+                    initializer=_init_worker,
+                    **options,
+                )
+                logger.info(f"추출 프로세스 풀 시작: 작업 프로세스 {self.max_workers}개")
+            return self._executor
+
+    def warm_up(self, wait_ready: bool = False, timeout: Optional[float] = None):
+        """
+        작업 프로세스를 미리 띄웁니다 (첫 파일의 프로세스 시작/모듈 import 지연 제거).
+
+        Args:
+            wait_ready (bool): 모든 작업 프로세스가 준비될 때까지 기다릴지 여부
+            timeout (Optional[float]): 기다릴 최대 시간 (초)
+        """
+        executor = self._ensure_executor()
+        futures = [executor.submit(_ping) for _ in range(self.max_workers)]
+        if wait_ready:
+            wait(futures, timeout=timeout)
+
+    def _get_slots(self) -> asyncio.Semaphore:
+        """현재 이벤트 루프에서 쓸 동시 작업 제한 세마포어"""
+        loop = asyncio.get_running_loop()
+        if self._slots is None or self._slots_loop is not loop:
+            self._slots = asyncio.Semaphore(self.max_workers)
+            self._slots_loop = loop
+        return self._slots
+
+    async def run(self, handler: Union[str, Callable[[str], Dict[str, Any]]], file_path: str) -> Optional[Dict[str, Any]]:
+        """
+        작업 프로세스에서 핸들러를 실행합니다.
+
+        작업 프로세스 수만큼만 동시에 보내므로, 보낸 작업은 곧바로 실행되고 제한 시간은
+        실행 시간에만 적용됩니다.
+
+        Args:
+            handler: FileExtractor 메서드 이름 또는 pickle 가능한 모듈 수준 함수
+            file_path (str): 추출할 파일 경로
+
+        Raises:
+            ExtractionTimeout: 제한 시간을 넘긴 경우
+        """
+        async with self._get_slots():
+            for attempt in range(2):
+                executor = self._ensure_executor()
+                submitted = None
+                try:
+                    submitted = executor.submit(_run_handler, handler, file_path)
+                    return await asyncio.wait_for(asyncio.wrap_future(submitted), self.task_timeout)
+                except asyncio.TimeoutError:
+                    # 멈춘 작업 프로세스는 취소할 수 없으므로 풀을 교체
+                    self._restart(executor)
+                    raise ExtractionTimeout(f"추출 시간 초과 ({self.task_timeout:.0f}초): {file_path}")
+                except BrokenProcessPool:
+                    # 다른 작업의 시간 초과로 풀이 교체되었거나 작업 프로세스가 죽음: 새 풀에서 한 번 더 시도
+                    self._restart(executor)
+                    if attempt:
+                        raise
+                except asyncio.CancelledError:
+                    # 풀 교체로 대기 중이던 작업이 취소됨 (호출한 작업 자체의 취소는 그대로 전달)
+                    if not self._cancelled_by_restart(executor, submitted):
+                        raise
+                    if attempt:
+                        raise BrokenProcessPool("추출 프로세스 풀이 교체되어 작업이 취소되었습니다")
+
+    def _cancelled_by_restart(self, executor: ProcessPoolExecutor, submitted) -> bool:
+        """CancelledError가 호출한 작업의 취소가 아니라 풀 교체 때문인지 확인합니다."""
+        if submitted is None or not submitted.cancelled() or self._executor is executor:
+            return False
+        task = asyncio.current_task()
+        if _HAS_TASK_RECYCLING and task is not None and task.cancelling():
+            return False
+        return True
+
+    def _restart(self, executor: ProcessPoolExecutor):
+        """executor의 작업 프로세스를 종료하고, 다음 작업부터 새 풀을 사용합니다."""
+        with self._lock:
+            if self._executor is not executor:
+                return
+            self._executor = None
+        logger.warning("추출 프로세스 풀을 다시 시작합니다")
+        self._terminate(executor)
+
+    @staticmethod
+    def _terminate(executor: ProcessPoolExecutor):
+        # shutdown()은 실행 중인 작업을 기다리므로 프로세스를 직접 종료
+        for process in list((getattr(executor, "_processes", None) or {}).values()):
+            try:
+                process.terminate()
+            except Exception:
+                pass
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    def shutdown(self, wait_workers: bool = True):
+        """풀을 종료합니다 (대기 중인 작업은 취소)."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is None:
+            return
+        if wait_workers:
+            executor.shutdown(wait=True, cancel_futures=True)
+        else:
+            self._terminate(executor)
@@ -9,18 +9,20 @@ PDF, DOCX, 이미지 등 다양한 파일 형식에서 텍스트와 메타데이
 import logging
 import asyncio
 from pathlib import Path
-from typing import Dict, Any, Optional, Callable, Set
+from typing import Dict, Any, Optional, Callable, Set, Tuple
+
+import config.config as cfg
+from modules.extraction_pool import ExtractionProcessPool
+from modules.file_buffer import BufferData, as_stream
+from modules.file_sniffer import FileTypeSniffer
+from modules.office_reader import read_paragraphs
+from modules.pdf_reader import LazyPdfReader
 
 try:
     import PyPDF2
 except ImportError:
     PyPDF2 = None
 
-try:
-    import docx
-except ImportError:
-    docx = None
-
 try:
     from PIL import Image
 except ImportError:
@@ -35,16 +37,40 @@ class FileExtractor:
     
     지원 형식:
     - PDF
-    - DOCX (Word 문서)
+    - DOCX (Word 문서), ODT (OpenDocument 텍스트)
     - TXT (텍스트 및 코드)
     - 이미지 (PNG, JPG, etc. - 메타데이터)
 
     새로운 파일 형식을 지원하려면 register_handler()를 사용하세요.
+    핸들러는 확장자 대신 내용으로 판별한 형식(detect_type)으로도 고를 수 있습니다.
+    cpu_bound로 등록한 핸들러(PDF, DOCX)는 extract_async에서 프로세스 풀로 실행됩니다.
     """
     
-    def __init__(self):
-        """FileExtractor 초기화 및 기본 핸들러 등록"""
+    def __init__(self, use_process_pool: Optional[bool] = None, process_pool: Optional[ExtractionProcessPool] = None):
+        """
+        FileExtractor 초기화 및 기본 핸들러 등록
+
+        Args:
+            use_process_pool (Optional[bool]): CPU 부하가 큰 핸들러를 프로세스 풀에서 실행할지 여부
+                (없으면 EXTRACTION_PROCESS_POOL_ENABLED 설정)
+            process_pool (Optional[ExtractionProcessPool]): 사용할 프로세스 풀 (없으면 설정값으로 생성)
+        """
         self._handlers: Dict[str, Callable[[str], Dict[str, Any]]] = {}
+        # 프로세스 풀에서 실행할 확장자
+        self._process_extensions: Set[str] = set()
+        # 이미 읽은 버퍼(data)를 받을 수 있는 확장자
+        self._buffer_extensions: Set[str] = set()
+
+        if use_process_pool is None:
+            use_process_pool = getattr(cfg, 'EXTRACTION_PROCESS_POOL_ENABLED', False)
+        if process_pool is None and use_process_pool:
+            process_pool = ExtractionProcessPool(
+                max_workers=getattr(cfg, 'EXTRACTION_PROCESS_WORKERS', 0),
+                task_timeout=getattr(cfg, 'EXTRACTION_TASK_TIMEOUT', 60.0),
+                max_tasks_per_worker=getattr(cfg, 'EXTRACTION_MAX_TASKS_PER_WORKER', 200),
+            )
+        self.process_pool: Optional[ExtractionProcessPool] = process_pool if use_process_pool else None
+        self.sniffer = FileTypeSniffer()
 
         # 텍스트 파일 확장자 목록
         self.text_extensions: Set[str] = {
@@ -60,49 +86,129 @@ class FileExtractor:
 
     def _register_default_handlers(self):
         """기본 파일 핸들러 등록"""
+        # 기본 핸들러는 모두 이미 읽은 버퍼(data)를 받을 수 있음
         # 텍스트 핸들러 등록
         for ext in self.text_extensions:
-            self.register_handler(ext, self.extract_text_from_txt)
+            self.register_handler(ext, self.extract_text_from_txt, accepts_buffer=True)
 
         # 이미지 핸들러 등록
         for ext in self.image_extensions:
-            self.register_handler(ext, self.extract_text_from_image)
+            self.register_handler(ext, self.extract_text_from_image, accepts_buffer=True)
 
-        # 문서 핸들러 등록
-        self.register_handler('.pdf', self.extract_text_from_pdf)
-        self.register_handler('.docx', self.extract_text_from_docx)
-        self.register_handler('.doc', self.extract_text_from_docx)
+        # 문서 핸들러 등록 (파싱이 CPU를 쓰므로 프로세스 풀에서 실행)
+        self.register_handler('.pdf', self.extract_text_from_pdf, cpu_bound=True, accepts_buffer=True)
+        self.register_handler('.docx', self.extract_text_from_docx, cpu_bound=True, accepts_buffer=True)
+        self.register_handler('.doc', self.extract_text_from_docx, cpu_bound=True, accepts_buffer=True)
+        self.register_handler('.odt', self.extract_text_from_docx, cpu_bound=True, accepts_buffer=True)
 
-    def register_handler(self, extension: str, handler: Callable[[str], Dict[str, Any]]):
+    def register_handler(self, extension: str, handler: Callable[[str], Dict[str, Any]], cpu_bound: bool = False,
+                         accepts_buffer: bool = False):
         """
         특정 확장자에 대한 핸들러를 등록합니다.
 
         Args:
             extension (str): 파일 확장자 (예: '.pdf')
             handler (Callable): 처리 함수
+            cpu_bound (bool): 프로세스 풀에서 실행할지 여부
+                (FileExtractor 메서드가 아니면 pickle 가능한 모듈 수준 함수여야 함)
+            accepts_buffer (bool): handler(path, data=...)로 이미 읽은 파일 내용을 받을 수 있는지 여부
         """
         if not extension.startswith('.'):
             extension = '.' + extension
-        self._handlers[extension.lower()] = handler
+        extension = extension.lower()
+        self._handlers[extension] = handler
+        if cpu_bound:
+            self._process_extensions.add(extension)
+        else:
+            self._process_extensions.discard(extension)
+        if accepts_buffer:
+            self._buffer_extensions.add(extension)
+        else:
+            self._buffer_extensions.discard(extension)
 
     @property
     def supported_extensions(self) -> list:
         """지원되는 모든 확장자 목록 반환"""
         return list(self._handlers.keys())
 
-    async def extract_async(self, file_path: str) -> Optional[Dict[str, Any]]:
+    def detect_type(self, file_path: str, head: Optional[bytes] = None) -> str:
+        """
+        파일 앞부분의 매직 넘버로 판별한 파일 형식 (점 없는 소문자, 확장자와 같은 계열이면 확장자)
+
+        확장자가 없거나 틀린 파일, .tmp/.download 같은 임시 이름에도 알맞은 형식을 돌려줍니다.
+        이미 읽은 앞부분(head)을 넘기면 파일을 다시 읽지 않습니다.
+        """
+        return self.sniffer.file_type(file_path, head)
+
+    def _resolve_handler(self, file_path: str, file_type: Optional[str] = None) -> Tuple[str, Optional[Callable[[str], Dict[str, Any]]]]:
+        """
+        사용할 (확장자 키, 핸들러)를 찾습니다.
+
+        file_type(판별한 형식)이 있으면 그 형식으로, 없으면 확장자로 찾고, 그래도 없으면
+        내용으로 판별한 형식의 핸들러를 사용합니다.
+        """
+        key = '.' + file_type.lower() if file_type else Path(file_path).suffix.lower()
+        handler = self._handlers.get(key)
+        if handler is None:
+            detected = self.sniffer.detect(file_path)
+            if detected and '.' + detected in self._handlers:
+                key = '.' + detected
+                handler = self._handlers[key]
+        return key, handler
+
+    async def extract_async(self, file_path: str, file_type: Optional[str] = None,
+                            data: Optional[BufferData] = None) -> Optional[Dict[str, Any]]:
         """
         비동기적으로 파일 내용을 추출합니다.
-        블로킹 작업을 스레드 풀에서 실행합니다.
+        CPU 부하가 큰 핸들러는 프로세스 풀에서, 나머지는 스레드 풀에서 실행합니다.
+
+        Args:
+            file_path (str): 추출할 파일 경로
+            file_type (Optional[str]): 판별한 파일 형식 (없으면 확장자 사용)
+            data (Optional[BufferData]): 이미 읽은 파일 내용 (FileBuffer.data)
+                프로세스 풀로 보내는 핸들러에는 넘기지 않습니다 (mmap은 pickle할 수 없으므로
+                작업 프로세스가 경로로 필요한 부분만 읽음).
         """
-        return await asyncio.to_thread(self.extract, file_path)
+        if self.process_pool is not None:
+            key = '.' + file_type.lower() if file_type else Path(file_path).suffix.lower()
+            if key in self._process_extensions:
+                return await self._extract_in_process(file_path, self._handlers[key])
+        return await asyncio.to_thread(self.extract, file_path, file_type, data)
+
+    async def _extract_in_process(self, file_path: str, handler: Callable[[str], Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """프로세스 풀에서 핸들러를 실행합니다 (오류는 extract와 같이 None으로 처리)."""
+        # 자신의 메서드는 이름으로 보내 작업 프로세스의 FileExtractor에서 실행
+        target = handler.__name__ if getattr(handler, '__self__', None) is self else handler
+        logger.info(f"파일 추출 시작 (프로세스 풀): {file_path}")
+        try:
+            return await self.process_pool.run(target, file_path)
+        except FileNotFoundError:
+            logger.error(f"파일을 찾을 수 없습니다: {file_path}")
+            return None
+        except Exception as e:
+            logger.error(f"추출 중 오류 발생 ({file_path}): {e}")
+            return None
+
+    def warm_up(self):
+        """프로세스 풀의 작업 프로세스를 미리 띄웁니다 (기다리지 않음)."""
+        if self.process_pool is not None:
+            self.process_pool.warm_up()
+
+    def shutdown(self):
+        """프로세스 풀을 종료합니다."""
+        if self.process_pool is not None:
+            self.process_pool.shutdown()
     
-    def extract(self, file_path: str) -> Optional[Dict[str, Any]]:
+    def extract(self, file_path: str, file_type: Optional[str] = None,
+                data: Optional[BufferData] = None) -> Optional[Dict[str, Any]]:
         """
         파일에서 내용 추출
         
         Args:
             file_path (str): 추출할 파일 경로
+            file_type (Optional[str]): 판별한 파일 형식 (없으면 확장자 사용)
+            data (Optional[BufferData]): 이미 읽은 파일 내용 (FileBuffer.data)
+                버퍼를 받는 핸들러는 파일을 다시 열지 않고 이 내용을 읽습니다.
             
         Returns:
             Dict[str, Any]: 추출된 내용과 메타데이터
@@ -116,8 +222,7 @@ class FileExtractor:
             logger.error(f"파일을 찾을 수 없습니다: {file_path}")
             return None
         
-        suffix = path.suffix.lower()
-        handler = self._handlers.get(suffix)
+        suffix, handler = self._resolve_handler(str(path), file_type)
 
         if not handler:
             logger.warning(f"지원하지 않는 파일 형식입니다: {suffix}")
@@ -126,18 +231,21 @@ class FileExtractor:
         logger.info(f"파일 추출 시작: {file_path}")
 
         try:
+            if data is not None and suffix in self._buffer_extensions:
+                return handler(str(path), data=data)
             return handler(str(path))
         except Exception as e:
             logger.error(f"추출 중 오류 발생 ({file_path}): {e}")
             return None
     
-    def extract_text_from_txt(self, file_path: str) -> Dict[str, Any]:
+    def extract_text_from_txt(self, file_path: str, data: Optional[BufferData] = None) -> Dict[str, Any]:
         """
         텍스트 파일에서 텍스트 추출 (Smart Summary: Front 1000 + Rear 1000)
         대용량 파일의 경우 전체를 읽지 않고 앞뒤 부분만 읽습니다.
+        data가 있으면 파일 대신 그 내용에서 읽습니다.
         """
         try:
-            file_size = Path(file_path).stat().st_size
+            file_size = len(data) if data is not None else Path(file_path).stat().st_size
             encodings = ['utf-8', 'cp949', 'euc-kr', 'latin-1']
 
             content = ""
@@ -145,9 +253,11 @@ class FileExtractor:
 
             # 작은 파일은 한번에 읽기 (2500바이트 이하)
             if file_size <= 2500:
-                raw_data = b""
-                with open(file_path, 'rb') as f:
-                    raw_data = f.read()
+                if data is not None:
+                    raw_data = bytes(data)
+                else:
+                    with open(file_path, 'rb') as f:
+                        raw_data = f.read()
 
                 for enc in encodings:
                     try:
@@ -173,13 +283,17 @@ class FileExtractor:
             rear_text = ""
             encoding_used = "utf-8" # 기본 가정
 
-            with open(file_path, 'rb') as f:
-                front_bytes = f.read(1500)
-                f.seek(0, 2)
-                file_end_pos = f.tell()
-                seek_pos = max(0, file_end_pos - 1500)
-                f.seek(seek_pos)
-                rear_bytes = f.read()
+            if data is not None:
+                front_bytes = bytes(data[:1500])
+                rear_bytes = bytes(data[max(0, file_size - 1500):])
+            else:
+                with open(file_path, 'rb') as f:
+                    front_bytes = f.read(1500)
+                    f.seek(0, 2)
+                    file_end_pos = f.tell()
+                    seek_pos = max(0, file_end_pos - 1500)
+                    f.seek(seek_pos)
+                    rear_bytes = f.read()
 
             for enc in encodings:
                 try:
@@ -214,30 +328,41 @@ class FileExtractor:
             logger.error(f"텍스트 추출 오류: {e}")
             raise
 
-    def extract_text_from_pdf(self, file_path: str) -> Optional[Dict[str, Any]]:
-        """PDF 파일에서 텍스트 추출 (Smart Summary 적용)"""
+    def extract_text_from_pdf(self, file_path: str, data: Optional[BufferData] = None) -> Optional[Dict[str, Any]]:
+        """
+        PDF 파일에서 텍스트 추출 (Smart Summary 적용)
+
+        문서 전체를 읽지 않고 앞쪽 페이지(5쪽 이하는 전체, 그 이상은 앞 2쪽)와
+        뒤쪽 페이지(뒤 2쪽)만 읽으며, 앞/뒤 각각 MAX_CONTENT_LENGTH의 절반이 모이면 멈춥니다.
+        data가 있으면 파일을 다시 매핑하지 않고 그 내용을 읽습니다.
+        """
         if not PyPDF2:
             logger.warning("PyPDF2가 설치되지 않았습니다.")
             return None
 
         try:
-            text = ""
-            page_count = 0
+            half_budget = max(1, getattr(cfg, 'MAX_CONTENT_LENGTH', 2500) // 2)
 
-            with open(file_path, 'rb') as f:
-                reader = PyPDF2.PdfReader(f)
-                page_count = len(reader.pages)
+            stream = as_stream(data) if data is not None else None
+            with LazyPdfReader(file_path, stream) as pdf:
+                page_count = pdf.page_count
 
                 if page_count <= 5:
-                    for page in reader.pages:
-                        text += page.extract_text() + "\n"
+                    front_indices = range(page_count)
+                    rear_indices = range(page_count - 1, -1, -1)
                 else:
-                    for i in range(2):
-                        text += reader.pages[i].extract_text() + "\n"
-                    text += "\n\n...[중간 페이지 생략]...\n\n"
-                    for i in range(page_count - 2, page_count):
-                        if i >= 2:
-                             text += reader.pages[i].extract_text() + "\n"
+                    front_indices = range(2)
+                    rear_indices = range(page_count - 1, page_count - 3, -1)
+
+                front = pdf.extract_pages(front_indices, max_chars=half_budget)
+                read = {index for index, _ in front}
+                rear = pdf.extract_pages((i for i in rear_indices if i not in read), max_chars=half_budget)
+                rear.reverse()
+
+            text = "".join(page_text + "\n" for _, page_text in front)
+            if front and rear and rear[0][0] > front[-1][0] + 1:
+                text += "\n\n...[중간 페이지 생략]...\n\n"
+            text += "".join(page_text + "\n" for _, page_text in rear)
 
             if len(text) > 2500:
                 text = text[:1000] + "\n...[내용 생략]...\n" + text[-1000:]
@@ -245,34 +370,29 @@ class FileExtractor:
             return {
                 "content": text,
                 "metadata": {"page_count": page_count},
-                "size": Path(file_path).stat().st_size
+                "size": len(data) if data is not None else Path(file_path).stat().st_size
             }
 
         except Exception as e:
             logger.error(f"PDF 추출 오류: {e}")
             raise
     
-    def extract_text_from_docx(self, file_path: str) -> Optional[Dict[str, Any]]:
-        """DOCX 파일에서 텍스트 추출 (Smart Summary 적용)"""
-        if not docx:
-            logger.warning("python-docx가 설치되지 않았습니다.")
-            return None
+    def extract_text_from_docx(self, file_path: str, data: Optional[BufferData] = None) -> Optional[Dict[str, Any]]:
+        """
+        DOCX/ODT 파일에서 텍스트 추출 (Smart Summary 적용)
 
+        본문 XML을 흘려 읽으며 앞 50개와 뒤 50개 문단만 보관합니다.
+        data가 있으면 파일 대신 그 내용에서 읽습니다.
+        """
         try:
-            doc = docx.Document(file_path)
-            paragraphs = doc.paragraphs
-            total_paragraphs = len(paragraphs)
-            full_text = []
+            source = as_stream(data) if data is not None else file_path
+            paragraphs = read_paragraphs(source, head=50, tail=50)
+            total_paragraphs = paragraphs.total
 
             if total_paragraphs <= 100:
-                for para in paragraphs:
-                    full_text.append(para.text)
+                full_text = paragraphs.head + paragraphs.tail
             else:
-                for i in range(50):
-                    full_text.append(paragraphs[i].text)
-                full_text.append("\n...[중간 문단 생략]...\n")
-                for i in range(total_paragraphs - 50, total_paragraphs):
-                    full_text.append(paragraphs[i].text)
+                full_text = paragraphs.head + ["\n...[중간 문단 생략]...\n"] + paragraphs.tail
 
             text = '\n'.join(full_text)
 
@@ -282,21 +402,21 @@ class FileExtractor:
             return {
                 "content": text,
                 "metadata": {"paragraph_count": total_paragraphs},
-                "size": Path(file_path).stat().st_size
+                "size": len(data) if data is not None else Path(file_path).stat().st_size
             }
 
         except Exception as e:
             logger.error(f"DOCX 추출 오류: {e}")
             return None
     
-    def extract_text_from_image(self, file_path: str) -> Optional[Dict[str, Any]]:
-        """이미지 파일에서 메타데이터 추출"""
+    def extract_text_from_image(self, file_path: str, data: Optional[BufferData] = None) -> Optional[Dict[str, Any]]:
+        """이미지 파일에서 메타데이터 추출 (data가 있으면 파일 대신 그 내용에서 읽음)"""
         if not Image:
             logger.warning("Pillow가 설치되지 않았습니다.")
             return None
 
         try:
-            with Image.open(file_path) as img:
+            with Image.open(as_stream(data) if data is not None else file_path) as img:
                 width, height = img.size
                 format_ = img.format
                 mode = img.mode
@@ -311,7 +431,7 @@ class FileExtractor:
                         "format": format_,
                         "mode": mode
                     },
-                    "size": Path(file_path).stat().st_size
+                    "size": len(data) if data is not None else Path(file_path).stat().st_size
                 }
 
         except Exception as e:
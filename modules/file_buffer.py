@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+"""
+공유 파일 버퍼 모듈
+
+파일을 한 번 열어 읽기 전용으로 메모리 매핑하고, 형식 판별/해시/내용 추출이 같은 버퍼를
+읽게 합니다. 디스크에서는 각 페이지를 한 번만 읽고, 이후의 접근은 페이지 캐시에서 처리됩니다.
+"""
+
+import io
+import logging
+import mmap
+import os
+from typing import BinaryIO, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+# 매핑한 파일 내용 (빈 파일은 b"")
+BufferData = Union[mmap.mmap, bytes]
+
+
+class _MappedStream(io.RawIOBase):
+    """
+    매핑한 내용을 읽는 읽기 전용 파일 객체
+
+    mmap 자체는 seekable()이 없어 zipfile 등에 바로 넘길 수 없고, 읽기 위치도 공유되므로
+    위치를 따로 가지는 얇은 래퍼를 씁니다 (닫아도 매핑은 닫지 않음).
+    """
+
+    def __init__(self, data: mmap.mmap):
+        super().__init__()
+        self._data = data
+        self._pos = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def readinto(self, b) -> int:
+        chunk = self._data[self._pos:self._pos + len(b)]
+        memoryview(b)[:len(chunk)] = chunk
+        self._pos += len(chunk)
+        return len(chunk)
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self._pos
+        elif whence == io.SEEK_END:
+            offset += len(self._data)
+        if offset < 0:
+            raise ValueError(f"음수 위치로 이동할 수 없습니다: {offset}")
+        self._pos = offset
+        return self._pos
+
+    def tell(self) -> int:
+        return self._pos
+
+
+def as_stream(data: BufferData) -> BinaryIO:
+    """버퍼를 처음부터 읽는 파일 객체로 돌려줍니다 (mmap은 복사하지 않음)."""
+    if isinstance(data, mmap.mmap):
+        return _MappedStream(data)
+    return io.BytesIO(data)
+
+
+class FileBuffer:
+    """
+    읽기 전용으로 매핑한 파일 (컨텍스트 매니저)
+
+    data는 슬라이싱할 수 있는 mmap 객체입니다 (빈 파일은 b"").
+    파일 객체가 필요한 곳에는 as_stream(data)를 넘기세요.
+    """
+
+    def __init__(self, file_path: str):
+        """
+        파일을 열고 매핑합니다.
+
+        Args:
+            file_path (str): 파일 경로
+
+        Raises:
+            OSError: 파일을 열 수 없는 경우
+        """
+        self.file_path = file_path
+        self._file = open(file_path, 'rb')
+        try:
+            stat = os.fstat(self._file.fileno())
+            self.size = stat.st_size
+            # ProcessingHistory.get_stat_signature와 같은 형식
+            self.signature: Tuple[int, int, int] = (stat.st_size, stat.st_mtime_ns, stat.st_ino)
+            self.data: BufferData = (
+                mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if self.size else b""
+            )
+        except Exception:
+            self._file.close()
+            raise
+
+    @classmethod
+    def open(cls, file_path: str) -> Optional["FileBuffer"]:
+        """파일을 매핑합니다 (열 수 없으면 None)."""
+        try:
+            return cls(file_path)
+        except (OSError, ValueError) as e:
+            logger.warning(f"파일을 매핑할 수 없습니다 ({file_path}): {e}")
+            return None
+
+    def head(self, length: int) -> bytes:
+        """앞부분 length 바이트"""
+        return bytes(self.data[:length])
+
+    def close(self):
+        """매핑과 파일을 닫습니다 (이동/삭제 전에 호출해야 함)."""
+        if isinstance(self.data, mmap.mmap):
+            try:
+                self.data.close()
+            except BufferError:
+                # 아직 참조 중인 버퍼가 있으면 GC에 맡김
+                pass
+        self.data = b""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self) -> "FileBuffer":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
@@ -12,6 +12,7 @@ FILE_TYPE_MAPPING = {
     "pdf": "문서",
     "docx": "문서",
     "doc": "문서",
+    "odt": "문서",
     "xlsx": "스프레드시트",
     "xls": "스프레드시트",
     "csv": "데이터",
@@ -0,0 +1,246 @@
+# -*- coding: utf-8 -*-
+"""
+파일 형식 판별 모듈
+
+확장자 대신 파일 앞부분(최대 SNIFF_BYTES)의 매직 넘버로 실제 형식을 판별합니다.
+확장자가 없거나 틀린 파일, .tmp/.download처럼 임시 이름인 파일도 알맞은 추출기와
+규칙으로 처리할 수 있습니다.
+
+- 판별 결과는 (장치, inode, 수정 시각, 크기)별로 캐시하므로, 같은 파일을 다시 판별할 때는
+  stat 한 번만 합니다 (이름만 바뀐 파일도 캐시를 그대로 사용).
+- 판별 형식은 확장자가 없거나 임시 이름일 때, 또는 확장자가 다른 계열의 알려진 형식일 때만
+  사용합니다. 같은 계열이거나(텍스트 파일의 .py, zip 기반의 .docx 등) 알 수 없는 확장자(.hwpx,
+  .srt 등)는 확장자가 더 구체적이므로 확장자를 그대로 사용합니다.
+"""
+
+import codecs
+import logging
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 판별에 읽는 최대 바이트 수
+SNIFF_BYTES = 8192
+
+# (오프셋, 매직 넘버, 형식) - 앞에 있는 항목이 먼저 검사됨
+SIGNATURES: Tuple[Tuple[int, bytes, str], ...] = (
+    (0, b"%PDF-", "pdf"),
+    (0, b"\x89PNG\r\n\x1a\n", "png"),
+    (0, b"\xff\xd8\xff", "jpg"),
+    (0, b"GIF87a", "gif"),
+    (0, b"GIF89a", "gif"),
+    (0, b"II*\x00", "tiff"),
+    (0, b"MM\x00*", "tiff"),
+    (0, b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1", "doc"),  # OLE 복합 문서 (doc/xls/ppt)
+    (0, b"{\\rtf", "rtf"),
+    (0, b"7z\xbc\xaf\x27\x1c", "7z"),
+    (0, b"Rar!\x1a\x07", "rar"),
+    (0, b"\x1f\x8b", "gz"),
+    (257, b"ustar", "tar"),
+    (0, b"fLaC", "flac"),
+    (0, b"OggS", "ogg"),
+    (0, b"\x1a\x45\xdf\xa3", "mkv"),
+    (0, b"FLV\x01", "flv"),
+)
+
+# RIFF 컨테이너의 형식 (오프셋 8)
+RIFF_TYPES = {b"WEBP": "webp", b"WAVE": "wav", b"AVI ": "avi"}
+
+# ISO 기본 미디어 파일(ftyp)의 브랜드별 형식 (그 외는 mp4)
+FTYP_BRANDS = {b"qt  ": "mov", b"M4A ": "m4a", b"M4B ": "m4a", b"heic": "heic", b"heix": "heic"}
+
+# zip 기반 문서: ODF mimetype 값 / OOXML 내부 경로
+ODF_MIMETYPES = {
+    b"application/vnd.oasis.opendocument.text": "odt",
+    b"application/vnd.oasis.opendocument.spreadsheet": "ods",
+    b"application/vnd.oasis.opendocument.presentation": "odp",
+}
+OOXML_PARTS = ((b"word/", "docx"), (b"xl/", "xlsx"), (b"ppt/", "pptx"))
+
+# 판별 형식과 같은 계열의 확장자 (이 확장자면 확장자를 그대로 사용)
+TYPE_FAMILIES = {
+    "txt": {
+        "txt", "py", "js", "ts", "java", "c", "cpp", "h", "cs", "go", "rs", "rb", "php", "sh",
+        "html", "htm", "css", "md", "json", "xml", "yml", "yaml", "csv", "tsv", "svg", "log", "ini", "cfg",
+        "toml", "sql", "bat", "ps1",
+    },
+    "zip": {"zip", "docx", "xlsx", "pptx", "odt", "ods", "odp", "jar", "apk", "epub"},
+    "doc": {"doc", "xls", "ppt", "msg", "hwp"},
+    "mp4": {"mp4", "m4v", "m4a", "mov", "3gp"},
+    "mp3": {"mp3"},
+    "jpg": {"jpg", "jpeg", "jfif"},
+    "tiff": {"tif", "tiff"},
+    "gz": {"gz", "tgz"},
+}
+
+# 내용만으로는 구체적인 형식을 알 수 없는 판별 결과 (zip 기반 문서, 각종 텍스트 파일)
+GENERIC_TYPES = {"zip", "txt"}
+
+# 다운로드/저장 중인 임시 이름의 확장자 (실제 형식을 나타내지 않음)
+TEMP_SUFFIXES = {"tmp", "temp", "part", "partial", "download", "crdownload", "opdownload", "!ut"}
+
+# 판별 결과나 형식 계열에 나오는 알려진 형식 (이 밖의 확장자는 판별 결과로 바꾸지 않음)
+KNOWN_TYPES = (
+    {file_type for _, _, file_type in SIGNATURES}
+    | set(RIFF_TYPES.values()) | set(FTYP_BRANDS.values()) | {"mp4"}
+    | set(ODF_MIMETYPES.values()) | {file_type for _, file_type in OOXML_PARTS}
+    | {"bmp", "mp3", "svg", "html", "xml"}
+    | set(TYPE_FAMILIES) | set().union(*TYPE_FAMILIES.values())
+)
+
+
+def sniff_bytes(head: bytes) -> Optional[str]:
+    """
+    파일 앞부분으로 형식을 판별합니다.
+
+    Returns:
+        Optional[str]: 점 없는 확장자 형식 (예: 'pdf', 'docx', 'txt'), 알 수 없으면 None
+    """
+    if not head:
+        return None
+
+    if head.startswith(b"PK\x03\x04"):
+        return _sniff_zip(head)
+    if head[:4] == b"RIFF":
+        return RIFF_TYPES.get(head[8:12])
+    if head[4:8] == b"ftyp":
+        return FTYP_BRANDS.get(head[8:12], "mp4")
+    for offset, magic, file_type in SIGNATURES:
+        if head[offset:offset + len(magic)] == magic:
+            return file_type
+    # 짧은 매직 넘버는 텍스트와 겹치지 않도록 뒤따르는 필드까지 확인
+    if head[:2] == b"BM" and head[6:10] == b"\x00\x00\x00\x00":
+        return "bmp"
+    if head[:3] == b"ID3" and head[3:4] in (b"\x02", b"\x03", b"\x04"):
+        return "mp3"
+    # UTF-16 BOM (MP3 프레임 동기 비트와 겹치므로 먼저 검사)
+    if head.startswith((b"\xff\xfe", b"\xfe\xff")):
+        return "txt"
+    # 프레임 동기 비트로 시작하는 ID3 태그 없는 MP3
+    if len(head) >= 2 and head[0] == 0xFF and head[1] & 0xE0 == 0xE0 and head[1] & 0x06:
+        return "mp3"
+    return _sniff_text(head)
+
+
+def _sniff_zip(head: bytes) -> str:
+    # ODF는 첫 항목이 압축하지 않은 'mimetype' 파일
+    if head[30:38] == b"mimetype":
+        for mimetype, file_type in ODF_MIMETYPES.items():
+            if head[38:38 + len(mimetype)] == mimetype:
+                return file_type
+    # OOXML은 앞쪽 로컬 헤더의 파일 이름으로 판별
+    if b"[Content_Types].xml" in head or b"_rels/.rels" in head:
+        for part, file_type in OOXML_PARTS:
+            if part in head:
+                return file_type
+    return "zip"
+
+
+def _sniff_text(head: bytes) -> Optional[str]:
+    """NUL 바이트가 없고 UTF-8/CP949로 읽히면 텍스트"""
+    if b"\x00" in head:
+        return None
+    sample = head.lstrip()[:256].lower()
+    if sample.startswith(b"<svg") or (sample.startswith(b"<?xml") and b"<svg" in head[:1024].lower()):
+        return "svg"
+    if sample.startswith((b"<!doctype html", b"<html")):
+        return "html"
+    if sample.startswith(b"<?xml"):
+        return "xml"
+    for encoding in ("utf-8", "cp949"):
+        try:
+            # 끝부분은 멀티바이트 문자가 잘렸을 수 있으므로 final=False로 디코딩
+            codecs.getincrementaldecoder(encoding)().decode(head, final=False)
+            return "txt"
+        except UnicodeDecodeError:
+            continue
+    return None
+
+
+def resolve_file_type(detected: Optional[str], suffix: str) -> str:
+    """
+    판별 형식과 확장자 중 사용할 형식을 고릅니다.
+
+    확장자가 없거나 임시 이름이면 판별 형식을 사용합니다. 그 밖에는 확장자가 다른 계열의
+    알려진 형식이고 판별 형식이 zip/txt처럼 일반적인 형식이 아닐 때만 판별 형식을 사용합니다.
+    """
+    suffix = suffix.lstrip(".").lower()
+    if not detected or not suffix:
+        return detected or suffix
+    if suffix in TEMP_SUFFIXES:
+        return detected
+    if suffix == detected or suffix in TYPE_FAMILIES.get(detected, ()):
+        return suffix
+    if any(suffix in members and detected in members for members in TYPE_FAMILIES.values()):
+        return suffix
+    if detected in GENERIC_TYPES or suffix not in KNOWN_TYPES:
+        return suffix
+    return detected
+
+
+class FileTypeSniffer:
+    """
+    매직 넘버 기반 파일 형식 판별기 (스레드 안전, LRU 캐시)
+    """
+
+    def __init__(self, max_entries: int = 10000, sniff_bytes: int = SNIFF_BYTES):
+        """
+        FileTypeSniffer 초기화
+
+        Args:
+            max_entries (int): 캐시할 최대 파일 수
+            sniff_bytes (int): 판별에 읽는 최대 바이트 수
+        """
+        self.max_entries = max_entries
+        self.sniff_bytes = sniff_bytes
+        self._cache: "OrderedDict[tuple, Optional[str]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def detect(self, file_path: str, head: Optional[bytes] = None) -> Optional[str]:
+        """
+        파일 내용으로 판별한 형식 (읽을 수 없거나 알 수 없으면 None)
+
+        head(이미 읽은 파일 앞부분)를 넘기면 파일을 다시 열지 않고 그 내용으로 판별합니다.
+        """
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return None
+        key = (stat.st_dev, stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+        with self._lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                return self._cache[key]
+
+        if head is not None:
+            detected = sniff_bytes(head[:self.sniff_bytes])
+        else:
+            try:
+                with open(file_path, 'rb') as f:
+                    detected = sniff_bytes(f.read(self.sniff_bytes))
+            except OSError as e:
+                logger.debug(f"형식 판별 실패 ({file_path}): {e}")
+                return None
+
+        with self._lock:
+            self._cache[key] = detected
+            while len(self._cache) > self.max_entries:
+                self._cache.popitem(last=False)
+        return detected
+
+    def file_type(self, file_path: str, head: Optional[bytes] = None) -> str:
+        """
+        처리에 사용할 파일 형식 (점 없는 소문자 확장자 형식)
+
+        확장자가 없거나 임시 이름, 또는 다른 계열의 알려진 형식이면 판별 형식을 사용합니다.
+        """
+        suffix = Path(file_path).suffix
+        resolved = resolve_file_type(self.detect(file_path, head), suffix)
+        if resolved != suffix.lstrip(".").lower():
+            logger.info(f"파일 형식 판별: {Path(file_path).name} -> {resolved}")
+        return resolved
@@ -0,0 +1,209 @@
+# -*- coding: utf-8 -*-
+"""
+폴더 어휘 모듈
+
+정리 대상 폴더(FileMover.base_path) 아래의 기존 대상 폴더를 색인하여
+- 파일과 관련 있는 기존 폴더 상위 K개를 프롬프트에 넣고,
+- LLM이 만든 새 폴더명을 정규화 문자열 유사도로 기존 폴더명에 맞춥니다.
+
+'청구서', '청구서류', '청구 서'처럼 거의 같은 폴더가 늘어나는 것을 막아
+폴더 수와 이동할 때마다 하는 폴더 생성/권한 확인 작업을 일정하게 유지합니다.
+"""
+
+import difflib
+import logging
+import os
+import re
+import threading
+import time
+import unicodedata
+from collections import Counter
+from typing import Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# 정규화 시 떼어 내는 접미사 (남는 글자가 2자 이상일 때만)
+FOLDER_NAME_SUFFIXES = ("류", "들", "모음", "파일", "폴더", "files", "folder")
+
+_SEPARATORS = re.compile(r"[\s_\-.·,()\[\]{}]+")
+_NUMBERS = re.compile(r"\d+")
+
+
+def normalize_folder_name(name: str) -> str:
+    """비교용 폴더명 (NFKC, 소문자, 구분자 제거, 흔한 접미사 제거)"""
+    normalized = _SEPARATORS.sub("", unicodedata.normalize("NFKC", name).lower())
+    for suffix in FOLDER_NAME_SUFFIXES:
+        if normalized.endswith(suffix) and len(normalized) - len(suffix) >= 2:
+            return normalized[:-len(suffix)]
+    return normalized
+
+
+def _bigrams(text: str) -> set:
+    return {text[i:i + 2] for i in range(len(text) - 1)} or ({text} if text else set())
+
+
+class FolderVocabulary:
+    """
+    기존 대상 폴더 색인
+
+    base_path 아래의 하위 폴더를 주기적으로(폴더 mtime이 바뀌었을 때만) 다시 읽고,
+    분류 결과로 쓰인 폴더명도 바로 기억하여 같은 실행 안에서도 일관된 이름을 사용합니다.
+    """
+
+    def __init__(
+        self,
+        base_path: Optional[str] = None,
+        top_k: int = 20,
+        snap_threshold: float = 0.85,
+        refresh_interval: float = 5.0,
+    ):
+        """
+        FolderVocabulary 초기화
+
+        Args:
+            base_path (Optional[str]): 대상 폴더들이 만들어지는 경로 (없으면 기억한 이름만 사용)
+            top_k (int): 프롬프트에 넣는 최대 폴더 수
+            snap_threshold (float): 기존 폴더명으로 맞추기 위한 최소 유사도 (0~1)
+            refresh_interval (float): base_path 변경 여부를 확인하는 최소 간격 (초)
+        """
+        self.base_path = str(base_path) if base_path else None
+        self.top_k = top_k
+        self.snap_threshold = snap_threshold
+        self.refresh_interval = refresh_interval
+
+        self._lock = threading.Lock()
+        # 정규화된 이름 -> 실제 폴더명 (디스크의 폴더 + 분류에 쓰인 폴더)
+        self._folders: Dict[str, str] = {}
+        self._recorded: Dict[str, str] = {}
+        self._usage: Counter = Counter()
+        self._base_mtime: Optional[int] = None
+        self._next_check = 0.0
+
+    def __len__(self) -> int:
+        self.refresh()
+        return len(self._folders)
+
+    @property
+    def folders(self) -> List[str]:
+        self.refresh()
+        with self._lock:
+            return sorted(self._folders.values())
+
+    def refresh(self, force: bool = False) -> bool:
+        """
+        base_path의 하위 폴더 목록이 바뀌었으면 다시 읽습니다.
+
+        Returns:
+            bool: 다시 읽었으면 True
+        """
+        if not self.base_path:
+            return False
+        now = time.monotonic()
+        if not force and now < self._next_check:
+            return False
+        self._next_check = now + self.refresh_interval
+
+        try:
+            mtime = os.stat(self.base_path).st_mtime_ns
+        except OSError:
+            return False
+        if not force and mtime == self._base_mtime:
+            return False
+
+        try:
+            with os.scandir(self.base_path) as entries:
+                names = [entry.name for entry in entries
+                         if not entry.name.startswith(".") and entry.is_dir(follow_symlinks=False)]
+        except OSError as e:
+            logger.warning(f"대상 폴더 목록 읽기 실패: {e}")
+            return False
+
+        with self._lock:
+            self._base_mtime = mtime
+            folders: Dict[str, str] = {}
+            for name in names:
+                folders.setdefault(normalize_folder_name(name), name)
+            # 지워진 폴더는 빠지고, 아직 만들어지지 않은 분류 결과 폴더는 유지
+            for key, name in self._recorded.items():
+                folders.setdefault(key, name)
+            self._folders = folders
+        logger.debug(f"폴더 어휘 갱신: {len(self._folders)}개")
+        return True
+
+    def add(self, names: Iterable[str]) -> None:
+        """폴더명을 어휘에 추가합니다."""
+        with self._lock:
+            for name in names:
+                if name:
+                    key = normalize_folder_name(name)
+                    self._recorded.setdefault(key, self._folders.setdefault(key, name))
+
+    def record(self, name: str) -> None:
+        """분류 결과로 쓰인 폴더명을 기억합니다 (사용 빈도는 프롬프트 순위에 반영)."""
+        if not name:
+            return
+        with self._lock:
+            key = normalize_folder_name(name)
+            self._recorded.setdefault(key, self._folders.setdefault(key, name))
+            self._usage[key] += 1
+
+    def snap(self, name: str) -> str:
+        """
+        새 폴더명을 가장 비슷한 기존 폴더명으로 맞춥니다.
+
+        숫자(연도, 분기 등)가 다른 폴더는 유사도와 관계없이 맞추지 않습니다
+        ('회의록2024'를 '회의록2023'으로 바꾸지 않음).
+
+        Returns:
+            str: 숫자가 같고 유사도가 snap_threshold 이상인 기존 폴더명, 없으면 원래 이름
+        """
+        if not name:
+            return name
+        self.refresh()
+        key = normalize_folder_name(name)
+        with self._lock:
+            existing = self._folders.get(key)
+            if existing is not None:
+                return existing
+
+            best_name, best_score = None, self.snap_threshold
+            numbers = _NUMBERS.findall(key)
+            matcher = difflib.SequenceMatcher(None, "", key)
+            for other_key, other_name in self._folders.items():
+                if _NUMBERS.findall(other_key) != numbers:
+                    continue
+                matcher.set_seq1(other_key)
+                if matcher.real_quick_ratio() < best_score or matcher.quick_ratio() < best_score:
+                    continue
+                score = matcher.ratio()
+                if score >= best_score:
+                    best_name, best_score = other_name, score
+
+        if best_name is None:
+            return name
+        logger.info(f"폴더명 통일: {name} -> {best_name} (유사도 {best_score:.2f})")
+        return best_name
+
+    def relevant(self, text: str, k: Optional[int] = None) -> List[str]:
+        """
+        text(파일명, 내용 일부)와 관련 있는 기존 폴더 상위 k개
+
+        글자 바이그램이 많이 겹치는 폴더를 먼저, 그다음 자주 쓰인 폴더 순으로 고릅니다.
+        """
+        k = self.top_k if k is None else k
+        self.refresh()
+        with self._lock:
+            items = list(self._folders.items())
+            usage = dict(self._usage)
+        if k <= 0 or not items:
+            return []
+
+        text_grams = _bigrams(normalize_folder_name(text or ""))
+
+        def score(item):
+            key, name = item
+            grams = _bigrams(key)
+            overlap = len(grams & text_grams) / len(grams) if grams else 0.0
+            return (-overlap, -usage.get(key, 0), name)
+
+        return [name for _, name in sorted(items, key=score)[:k]]
@@ -8,18 +8,61 @@
 import sqlite3
 import hashlib
 import logging
+import queue
+import threading
+import time
 from pathlib import Path
-from typing import Optional, Dict, Any
+from collections import OrderedDict
+from typing import Optional, Dict, Any, List, Tuple, Iterable
 import json
 import asyncio
 import os
 
+from modules.file_buffer import FileBuffer
+
 logger = logging.getLogger(__name__)
 
 class ProcessingHistory:
     """
     파일 처리 이력을 관리하는 클래스 (SQLite 기반)
+
+    조회는 WAL 모드의 장기 연결 하나를 재사용하고, 저장은 전용 쓰기 스레드가
+    짧은 간격으로 모아서 하나의 트랜잭션으로 커밋합니다.
+    """
+
+    # 쓰기 스레드가 행을 모으는 시간 (초)
+    WRITE_BATCH_INTERVAL = 0.005
+    # 쓰기 대기열이 비어 있을 때 쓰기 스레드가 종료되기까지의 시간 (초)
+    WRITER_IDLE_TIMEOUT = 5.0
+    # 일괄 조회 시 IN (...) 절 하나에 넣는 최대 값 개수 (SQLite 변수 한도 999 이하)
+    BULK_QUERY_CHUNK = 500
+    # 계산한 해시를 stat 시그니처와 함께 기억하는 최대 파일 수
+    HASH_MEMO_SIZE = 10000
+
+    _SELECT_RESULT_SQL = "SELECT folder_name, category, reason FROM processed_files WHERE file_hash = ?"
+    _SELECT_BY_PATH_SQL = """
+        SELECT p.file_hash, p.st_size, p.st_mtime_ns, p.st_ino, f.folder_name, f.category, f.reason
+        FROM file_paths p JOIN processed_files f ON f.file_hash = p.file_hash
+        WHERE p.path = ?
     """
+    _UPSERT_SQL = """
+        INSERT OR REPLACE INTO processed_files
+        (file_hash, filename, file_size, folder_name, category, reason, path, st_size, st_mtime_ns, st_ino, snippet)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """
+    _UPSERT_PATH_SQL = """
+        INSERT OR REPLACE INTO file_paths (path, file_hash, st_size, st_mtime_ns, st_ino)
+        VALUES (?, ?, ?, ?, ?)
+    """
+
+    # 기존 DB에 추가되는 컬럼 (stat 시그니처, 유사 파일 분류용 내용 발췌)
+    _ADDED_COLUMNS = {
+        "path": "TEXT",
+        "st_size": "INTEGER",
+        "st_mtime_ns": "INTEGER",
+        "st_ino": "INTEGER",
+        "snippet": "TEXT",
+    }
 
     def __init__(self, db_path: str = "processed_files.db"):
         """
@@ -29,14 +72,42 @@ class ProcessingHistory:
             db_path (str): 데이터베이스 파일 경로
         """
         self.db_path = db_path
+        self._read_conn: Optional[sqlite3.Connection] = None
+        self._read_lock = threading.Lock()
+
+        # 쓰기 스레드 및 아직 커밋되지 않은 행 (file_hash -> row)
+        self._write_queue: "queue.Queue" = queue.Queue()
+        self._writer_lock = threading.Lock()
+        self._writer_thread: Optional[threading.Thread] = None
+        self._pending: Dict[str, tuple] = {}
+        # 아직 커밋되지 않은 경로 행 (path -> (path, file_hash, st_size, st_mtime_ns, st_ino))
+        self._pending_paths: Dict[str, tuple] = {}
+
+        # 경로 -> (stat 시그니처, 해시): 스캔 중 계산한 해시를 작업자가 재사용
+        self._hash_memo: "OrderedDict[str, Tuple[Tuple[int, int, int], str]]" = OrderedDict()
+        self._hash_memo_lock = threading.Lock()
+        self._pending_lock = threading.Lock()
+
         self._init_db()
 
+    def _connect(self) -> sqlite3.Connection:
+        """WAL 모드가 설정된 연결을 생성합니다."""
+        conn = sqlite3.connect(
+            self.db_path,
+            timeout=30,
+            check_same_thread=False,
+            cached_statements=128
+        )
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
     def _init_db(self):
         """데이터베이스 및 테이블 초기화"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute("""
+            self._read_conn = self._connect()
+            with self._read_conn:
+                self._read_conn.execute("""
                     CREATE TABLE IF NOT EXISTS processed_files (
                         file_hash TEXT PRIMARY KEY,
                         filename TEXT,
@@ -44,20 +115,109 @@ class ProcessingHistory:
                         folder_name TEXT,
                         category TEXT,
                         reason TEXT,
-                        timestamp DATETIME DEFAULT CURRENT_TIMESTAMP
+                        timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
+                        path TEXT,
+                        st_size INTEGER,
+                        st_mtime_ns INTEGER,
+                        st_ino INTEGER,
+                        snippet TEXT
+                    )
+                """)
+                # 이전 버전 DB에 새 컬럼 추가
+                existing = {row[1] for row in self._read_conn.execute("PRAGMA table_info(processed_files)")}
+                for column, column_type in self._ADDED_COLUMNS.items():
+                    if column not in existing:
+                        self._read_conn.execute(f"ALTER TABLE processed_files ADD COLUMN {column} {column_type}")
+                self._read_conn.execute("CREATE INDEX IF NOT EXISTS idx_path ON processed_files(path)")
+                # 경로별 stat 시그니처 (내용이 같은 파일이 여러 경로에 있어도 경로마다 따로 기록)
+                has_path_table = self._read_conn.execute(
+                    "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'file_paths'"
+                ).fetchone()
+                self._read_conn.execute("""
+                    CREATE TABLE IF NOT EXISTS file_paths (
+                        path TEXT PRIMARY KEY,
+                        file_hash TEXT NOT NULL,
+                        st_size INTEGER,
+                        st_mtime_ns INTEGER,
+                        st_ino INTEGER
+                    )
+                """)
+                if not has_path_table:
+                    # 이전 버전 DB: processed_files에 기록된 경로를 옮김
+                    self._read_conn.execute("""
+                        INSERT OR IGNORE INTO file_paths (path, file_hash, st_size, st_mtime_ns, st_ino)
+                        SELECT path, file_hash, st_size, st_mtime_ns, st_ino FROM processed_files
+                        WHERE path IS NOT NULL AND st_size IS NOT NULL
+                    """)
+                # 처리 이력에서 자동 승격된 규칙 (취소된 규칙도 감사용으로 보관)
+                self._read_conn.execute("""
+                    CREATE TABLE IF NOT EXISTS promoted_rules (
+                        id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        keyword TEXT NOT NULL,
+                        extension TEXT NOT NULL,
+                        folder_name TEXT NOT NULL,
+                        category TEXT,
+                        support INTEGER,
+                        consistency REAL,
+                        status TEXT DEFAULT 'active',
+                        created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+                        revoked_at DATETIME,
+                        UNIQUE (keyword, extension)
                     )
                 """)
                 # 성능을 위한 추가 인덱스 (필요 시 활성화)
                 # cursor.execute("CREATE INDEX IF NOT EXISTS idx_filename ON processed_files(filename)")
-                conn.commit()
         except Exception as e:
             logger.error(f"DB 초기화 실패: {e}")
 
+    # 이 크기보다 큰 파일은 앞/중간/뒤 64KB만 해시 (부분 해시)
+    PARTIAL_HASH_THRESHOLD = 10 * 1024 * 1024
+    HASH_BLOCK_SIZE = 65536
+
+    @classmethod
+    def hash_content(cls, data, file_size: int) -> str:
+        """
+        파일 내용의 해시를 계산합니다 (get_file_hash와 같은 값).
+
+        Args:
+            data: 파일 전체 내용 (bytes 또는 mmap처럼 슬라이싱할 수 있는 버퍼)
+            file_size (int): 파일 크기
+
+        Returns:
+            str: 파일 해시값
+        """
+        sha256_hash = hashlib.sha256()
+        block = cls.HASH_BLOCK_SIZE
+        with memoryview(data) as view:
+            # 대용량 파일 (10MB 이상) 최적화: 부분 해시
+            if file_size > cls.PARTIAL_HASH_THRESHOLD:
+                # 처음, 중간, 마지막 64KB
+                sha256_hash.update(view[:block])
+                sha256_hash.update(view[file_size // 2:file_size // 2 + block])
+                sha256_hash.update(view[file_size - block:file_size])
+                # 파일 크기 추가 (충돌 방지)
+                sha256_hash.update(str(file_size).encode('utf-8'))
+            else:
+                # 작은 파일: 전체 해시 (64KB 단위)
+                for offset in range(0, file_size, block):
+                    sha256_hash.update(view[offset:offset + block])
+        return sha256_hash.hexdigest()
+
+    def _remember_hash(self, file_path: str, signature: Tuple[int, int, int], file_hash: str):
+        memo_key = os.path.abspath(file_path)
+        with self._hash_memo_lock:
+            self._hash_memo[memo_key] = (signature, file_hash)
+            self._hash_memo.move_to_end(memo_key)
+            while len(self._hash_memo) > self.HASH_MEMO_SIZE:
+                self._hash_memo.popitem(last=False)
+
     def get_file_hash(self, file_path: str) -> str:
         """
         파일의 해시를 계산합니다.
         대용량 파일(>10MB)의 경우 성능 최적화를 위해 부분 해시를 사용합니다.
 
+        같은 stat 시그니처로 이미 계산한 해시가 있으면 파일을 다시 읽지 않습니다.
+
         Args:
             file_path (str): 파일 경로
 
@@ -65,40 +225,187 @@ class ProcessingHistory:
             str: 파일 해시값
         """
         try:
-            file_size = os.path.getsize(file_path)
-            sha256_hash = hashlib.sha256()
+            signature = self.get_stat_signature(file_path)
+            if signature is None:
+                raise FileNotFoundError(file_path)
+            with self._hash_memo_lock:
+                memo = self._hash_memo.get(os.path.abspath(file_path))
+            if memo and memo[0] == signature:
+                return memo[1]
 
-            # 대용량 파일 (10MB 이상) 최적화: 부분 해시
-            if file_size > 10 * 1024 * 1024:
-                with open(file_path, "rb") as f:
-                    # 처음 64KB (최적화: 4KB -> 64KB)
-                    sha256_hash.update(f.read(65536))
-                    # 중간 64KB
-                    f.seek(file_size // 2)
-                    sha256_hash.update(f.read(65536))
-                    # 마지막 64KB
-                    f.seek(-65536, 2)
-                    sha256_hash.update(f.read(65536))
-                    # 파일 크기 추가 (충돌 방지)
-                    sha256_hash.update(str(file_size).encode('utf-8'))
-            else:
-                # 작은 파일: 전체 해시
-                # 버퍼 크기 64KB로 증가 (기본값보다 큼)
-                with open(file_path, "rb") as f:
-                    for byte_block in iter(lambda: f.read(65536), b""):
-                        sha256_hash.update(byte_block)
-
-            return sha256_hash.hexdigest()
+            with FileBuffer(file_path) as buffer:
+                file_hash = self.hash_content(buffer.data, buffer.size)
+                signature = buffer.signature
+            self._remember_hash(file_path, signature, file_hash)
+            return file_hash
         except Exception as e:
             logger.error(f"해시 계산 실패 ({file_path}): {e}")
             return ""
 
+    def get_file_hash_from_buffer(self, buffer: FileBuffer) -> str:
+        """
+        이미 매핑한 파일 버퍼로 해시를 계산합니다 (파일을 다시 열지 않음).
+
+        계산한 해시는 기억해 두므로, 같은 파일의 get_file_hash는 파일을 읽지 않습니다.
+        """
+        try:
+            with self._hash_memo_lock:
+                memo = self._hash_memo.get(os.path.abspath(buffer.file_path))
+            if memo and memo[0] == buffer.signature:
+                return memo[1]
+            file_hash = self.hash_content(buffer.data, buffer.size)
+            self._remember_hash(buffer.file_path, buffer.signature, file_hash)
+            return file_hash
+        except Exception as e:
+            logger.error(f"해시 계산 실패 ({buffer.file_path}): {e}")
+            return ""
+
     async def get_file_hash_async(self, file_path: str) -> str:
         """
         비동기적으로 파일 해시를 계산합니다.
         """
         return await asyncio.to_thread(self.get_file_hash, file_path)
 
+    @staticmethod
+    def get_stat_signature(file_path: str) -> Optional[Tuple[int, int, int]]:
+        """
+        파일의 stat 시그니처 (st_size, st_mtime_ns, st_ino)를 반환합니다.
+
+        Returns:
+            Optional[Tuple[int, int, int]]: 시그니처 (파일이 없으면 None)
+        """
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            return None
+        return (st.st_size, st.st_mtime_ns, st.st_ino)
+
+    def get_result_by_stat(self, file_path: str) -> Optional[Tuple[str, Dict[str, Any]]]:
+        """
+        파일을 열지 않고 stat 시그니처로 저장된 결과를 조회합니다.
+
+        경로와 (st_size, st_mtime_ns, st_ino)가 모두 저장 당시와 같을 때만
+        결과를 반환하며, 그 외에는 해시를 다시 계산해야 합니다.
+
+        Args:
+            file_path (str): 파일 경로
+
+        Returns:
+            Optional[Tuple[str, Dict[str, Any]]]: (파일 해시, 저장된 결과) 또는 None
+        """
+        signature = self.get_stat_signature(file_path)
+        if signature is None:
+            return None
+        path = os.path.abspath(file_path)
+
+        with self._pending_lock:
+            path_row = self._pending_paths.get(path)
+        if path_row is not None:
+            if tuple(path_row[2:5]) != signature:
+                return None
+            result = self.get_result(path_row[1])
+            return (path_row[1], result) if result else None
+
+        try:
+            with self._read_lock:
+                found = self._read_conn.execute(self._SELECT_BY_PATH_SQL, (path,)).fetchone()
+        except Exception as e:
+            logger.error(f"DB 조회 실패: {e}")
+            return None
+        if not found or tuple(found[1:4]) != signature:
+            return None
+        return found[0], self._row_to_result(found[4:7])
+
+    async def get_result_by_stat_async(self, file_path: str) -> Optional[Tuple[str, Dict[str, Any]]]:
+        """비동기 stat 시그니처 조회 (stat 호출이 네트워크 드라이브에서 블로킹될 수 있어 스레드에서 실행)"""
+        return await asyncio.to_thread(self.get_result_by_stat, file_path)
+
+    def get_results_by_stat_bulk(
+        self, signatures: Dict[str, Tuple[int, int, int]]
+    ) -> Dict[str, Tuple[str, Dict[str, Any]]]:
+        """
+        여러 파일을 stat 시그니처로 한 번에 조회합니다.
+
+        Args:
+            signatures (Dict[str, Tuple[int, int, int]]): 파일 경로 -> (st_size, st_mtime_ns, st_ino)
+
+        Returns:
+            Dict[str, Tuple[str, Dict[str, Any]]]: 시그니처가 일치한 경로 -> (파일 해시, 저장된 결과)
+        """
+        by_abspath = {os.path.abspath(path): path for path in signatures}
+        hits: Dict[str, Tuple[str, Dict[str, Any]]] = {}
+
+        pending_hashes: Dict[str, str] = {}
+        with self._pending_lock:
+            for path, original in by_abspath.items():
+                path_row = self._pending_paths.get(path)
+                if path_row and tuple(path_row[2:5]) == signatures[original]:
+                    pending_hashes[original] = path_row[1]
+        if pending_hashes:
+            results = self.get_results_bulk(pending_hashes.values())
+            for original, file_hash in pending_hashes.items():
+                if file_hash in results:
+                    hits[original] = (file_hash, results[file_hash])
+
+        remaining = [path for path, original in by_abspath.items() if original not in pending_hashes]
+        try:
+            for start in range(0, len(remaining), self.BULK_QUERY_CHUNK):
+                chunk = remaining[start:start + self.BULK_QUERY_CHUNK]
+                placeholders = ",".join("?" * len(chunk))
+                with self._read_lock:
+                    rows = self._read_conn.execute(
+                        "SELECT p.path, p.file_hash, f.folder_name, f.category, f.reason, "
+                        "p.st_size, p.st_mtime_ns, p.st_ino "
+                        "FROM file_paths p JOIN processed_files f ON f.file_hash = p.file_hash "
+                        f"WHERE p.path IN ({placeholders})",
+                        chunk
+                    ).fetchall()
+                for row in rows:
+                    original = by_abspath[row[0]]
+                    if tuple(row[5:8]) == signatures[original]:
+                        hits[original] = (row[1], self._row_to_result(row[2:5]))
+        except Exception as e:
+            logger.error(f"DB 일괄 조회 실패: {e}")
+        return hits
+
+    def get_results_bulk(self, file_hashes: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        여러 해시를 한 번에 조회합니다.
+
+        BULK_QUERY_CHUNK 개씩 WHERE file_hash IN (...) 쿼리로 나누어 조회합니다.
+
+        Args:
+            file_hashes (Iterable[str]): 파일 해시 목록
+
+        Returns:
+            Dict[str, Dict[str, Any]]: 해시 -> 저장된 결과 (없는 해시는 제외)
+        """
+        unique_hashes = list(dict.fromkeys(h for h in file_hashes if h))
+        results: Dict[str, Dict[str, Any]] = {}
+
+        with self._pending_lock:
+            for file_hash in unique_hashes:
+                row = self._pending.get(file_hash)
+                if row:
+                    results[file_hash] = self._row_to_result(row[3:6])
+
+        remaining = [h for h in unique_hashes if h not in results]
+        try:
+            for start in range(0, len(remaining), self.BULK_QUERY_CHUNK):
+                chunk = remaining[start:start + self.BULK_QUERY_CHUNK]
+                placeholders = ",".join("?" * len(chunk))
+                with self._read_lock:
+                    rows = self._read_conn.execute(
+                        "SELECT file_hash, folder_name, category, reason "
+                        f"FROM processed_files WHERE file_hash IN ({placeholders})",
+                        chunk
+                    ).fetchall()
+                for row in rows:
+                    results[row[0]] = self._row_to_result(row[1:4])
+        except Exception as e:
+            logger.error(f"DB 일괄 조회 실패: {e}")
+        return results
+
     def get_result(self, file_hash: str) -> Optional[Dict[str, Any]]:
         """
         해시값으로 저장된 결과를 조회합니다.
@@ -109,58 +416,343 @@ class ProcessingHistory:
         Returns:
             Optional[Dict[str, Any]]: 저장된 결과 (없으면 None)
         """
+        # 아직 커밋되지 않은 저장 요청을 먼저 확인 (read-your-writes)
+        with self._pending_lock:
+            row = self._pending.get(file_hash)
+        if row:
+            return self._row_to_result(row[3:6])
+
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute(
-                    "SELECT folder_name, category, reason FROM processed_files WHERE file_hash = ?",
-                    (file_hash,)
-                )
-                row = cursor.fetchone()
-                if row:
-                    return {
-                        "folder_name": row[0],
-                        "category": row[1],
-                        "reason": row[2],
-                        "cached": True
-                    }
+            with self._read_lock:
+                row = self._read_conn.execute(self._SELECT_RESULT_SQL, (file_hash,)).fetchone()
+            if row:
+                return self._row_to_result(row)
         except Exception as e:
             logger.error(f"DB 조회 실패: {e}")
         return None
 
     async def get_result_async(self, file_hash: str) -> Optional[Dict[str, Any]]:
-        """비동기 DB 조회"""
+        """
+        비동기 DB 조회
+
+        읽기 연결의 잠금은 일괄 조회가 오래 잡고 있을 수 있으므로 스레드에서 실행합니다.
+        """
         return await asyncio.to_thread(self.get_result, file_hash)
 
-    def save_result(self, file_hash: str, filename: str, file_size: int, result: Dict[str, Any]):
+    def _row_to_result(self, row) -> Dict[str, Any]:
+        """(folder_name, category, reason) 행을 결과 딕셔너리로 변환합니다."""
+        return {
+            "folder_name": row[0],
+            "category": row[1],
+            "reason": row[2],
+            "cached": True
+        }
+
+    def save_result(
+        self,
+        file_hash: str,
+        filename: str,
+        file_size: int,
+        result: Dict[str, Any],
+        file_path: Optional[str] = None,
+        signature: Optional[Tuple[int, int, int]] = None,
+        snippet: Optional[str] = None
+    ):
         """
         처리 결과를 저장합니다.
 
+        쓰기 스레드의 대기열에 넣고 바로 반환합니다. 실제 커밋은
+        WRITE_BATCH_INTERVAL 동안 모인 행과 함께 한 트랜잭션으로 수행됩니다.
+
         Args:
             file_hash (str): 파일 해시
             filename (str): 파일명
             file_size (int): 파일 크기
             result (Dict[str, Any]): 분류 결과
+            file_path (Optional[str]): 파일 경로 (stat 기반 빠른 조회용)
+            signature (Optional[Tuple[int, int, int]]): (st_size, st_mtime_ns, st_ino)
+            snippet (Optional[str]): 내용 발췌 (유사 파일 분류 학습용)
         """
         try:
             folder_name = result.get("folder_name", "기타")
             category = result.get("category", "기타")
             reason = result.get("reason", "")
+            path = os.path.abspath(file_path) if file_path else None
+            st_size, st_mtime_ns, st_ino = signature if (path and signature) else (None, None, None)
+            row = (file_hash, filename, file_size, folder_name, category, reason,
+                   path, st_size, st_mtime_ns, st_ino, snippet)
+
+            with self._pending_lock:
+                self._pending[file_hash] = row
+            self._enqueue_write((self._UPSERT_SQL, row))
+            if path and signature:
+                self._record_path(path, file_hash, signature)
+        except Exception as e:
+            logger.error(f"DB 저장 실패: {e}")
+
+    async def save_result_async(
+        self,
+        file_hash: str,
+        filename: str,
+        file_size: int,
+        result: Dict[str, Any],
+        file_path: Optional[str] = None,
+        signature: Optional[Tuple[int, int, int]] = None,
+        snippet: Optional[str] = None
+    ):
+        """비동기 DB 저장 (대기열에 넣기만 하므로 블로킹되지 않습니다)"""
+        self.save_result(file_hash, filename, file_size, result, file_path, signature, snippet)
+
+    def update_signature(
+        self, file_hash: str, file_path: str, signature: Optional[Tuple[int, int, int]] = None
+    ) -> None:
+        """
+        해시로 찾은 결과의 현재 경로와 stat 시그니처를 기록합니다.
+
+        다음 조회부터는 해시 계산 없이 get_result_by_stat으로 바로 찾을 수 있습니다.
+        """
+        signature = signature or self.get_stat_signature(file_path)
+        if signature is None:
+            return
+        self._record_path(os.path.abspath(file_path), file_hash, signature)
+
+    def _record_path(self, path: str, file_hash: str, signature: Tuple[int, int, int]) -> None:
+        """경로 -> (stat 시그니처, 해시)를 경로별 테이블에 기록합니다."""
+        path_row = (path, file_hash, *signature)
+        with self._pending_lock:
+            self._pending_paths[path] = path_row
+        self._enqueue_write((self._UPSERT_PATH_SQL, path_row))
+
+    def iter_training_rows(
+        self, limit: int = 20000, exclude_reason_prefix: Optional[str] = None
+    ) -> Iterable[Tuple[str, Optional[str], str, str]]:
+        """
+        유사 파일 분류기 학습용 이력을 최신순으로 반환합니다.
+
+        읽기 연결을 오래 점유하지 않도록 별도 연결에서 조회합니다.
+
+        Args:
+            limit (int): 최대 행 수
+            exclude_reason_prefix (Optional[str]): 이 문자열로 시작하는 사유의 행은 제외 (폴백 결과 등)
+
+        Yields:
+            Tuple[str, Optional[str], str, str]: (파일명, 내용 발췌, 폴더명, 카테고리)
+        """
+        sql = "SELECT filename, snippet, folder_name, category, reason FROM processed_files ORDER BY timestamp DESC LIMIT ?"
+        conn = None
+        try:
+            conn = self._connect()
+            for filename, snippet, folder_name, category, reason in conn.execute(sql, (limit,)):
+                if not filename or not folder_name:
+                    continue
+                if exclude_reason_prefix and (reason or "").startswith(exclude_reason_prefix):
+                    continue
+                yield filename, snippet, folder_name, category
+        except Exception as e:
+            logger.error(f"이력 조회 실패: {e}")
+        finally:
+            if conn is not None:
+                conn.close()
+
+    def add_promoted_rules(self, entries: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        승격 규칙을 기록합니다.
+
+        같은 (keyword, extension) 규칙이 이미 있으면 (취소된 경우 포함) 건너뜁니다.
+
+        Args:
+            entries: keyword, extension, folder_name, category, support, consistency 항목
+
+        Returns:
+            List[Dict[str, Any]]: 새로 기록된 규칙 (id 포함)
+        """
+        sql = """
+            INSERT OR IGNORE INTO promoted_rules (keyword, extension, folder_name, category, support, consistency)
+            VALUES (?, ?, ?, ?, ?, ?)
+        """
+        added = []
+        conn = None
+        try:
+            conn = self._connect()
+            with conn:
+                for entry in entries:
+                    cursor = conn.execute(sql, (
+                        entry["keyword"], entry["extension"], entry["folder_name"],
+                        entry.get("category"), entry.get("support"), entry.get("consistency"),
+                    ))
+                    if cursor.rowcount:
+                        added.append({**entry, "id": cursor.lastrowid, "status": "active"})
+        except Exception as e:
+            logger.error(f"승격 규칙 저장 실패: {e}")
+            return []
+        finally:
+            if conn is not None:
+                conn.close()
+        return added
+
+    def get_promoted_rules(self, include_revoked: bool = False) -> List[Dict[str, Any]]:
+        """
+        승격 규칙 목록을 반환합니다 (감사용).
+
+        Args:
+            include_revoked (bool): 취소된 규칙도 포함할지 여부
+
+        Returns:
+            List[Dict[str, Any]]: 승격 규칙 (오래된 순)
+        """
+        sql = """
+            SELECT id, keyword, extension, folder_name, category, support, consistency,
+                   status, created_at, revoked_at
+            FROM promoted_rules
+        """
+        if not include_revoked:
+            sql += " WHERE status = 'active'"
+        sql += " ORDER BY id"
+        columns = ("id", "keyword", "extension", "folder_name", "category", "support", "consistency",
+                   "status", "created_at", "revoked_at")
+        try:
+            with self._read_lock:
+                rows = self._read_conn.execute(sql).fetchall()
+            return [dict(zip(columns, row)) for row in rows]
+        except Exception as e:
+            logger.error(f"승격 규칙 조회 실패: {e}")
+            return []
 
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute(
-                    """
-                    INSERT OR REPLACE INTO processed_files
-                    (file_hash, filename, file_size, folder_name, category, reason)
-                    VALUES (?, ?, ?, ?, ?, ?)
-                    """,
-                    (file_hash, filename, file_size, folder_name, category, reason)
+    def revoke_promoted_rule(self, rule_id: int) -> bool:
+        """
+        승격 규칙을 취소합니다. 취소된 규칙은 다시 승격되지 않습니다.
+
+        Returns:
+            bool: 취소했으면 True (없거나 이미 취소된 규칙이면 False)
+        """
+        sql = """
+            UPDATE promoted_rules SET status = 'revoked', revoked_at = CURRENT_TIMESTAMP
+            WHERE id = ? AND status = 'active'
+        """
+        conn = None
+        try:
+            conn = self._connect()
+            with conn:
+                return conn.execute(sql, (int(rule_id),)).rowcount > 0
+        except Exception as e:
+            logger.error(f"승격 규칙 취소 실패: {e}")
+            return False
+        finally:
+            if conn is not None:
+                conn.close()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        대기 중인 모든 저장 요청이 커밋될 때까지 기다립니다.
+
+        Returns:
+            bool: 제한 시간 안에 커밋이 끝났으면 True
+        """
+        done = threading.Event()
+        self._enqueue_write(done)
+        return done.wait(timeout)
+
+    def close(self) -> None:
+        """대기 중인 쓰기를 커밋하고 연결을 닫습니다."""
+        self.flush(timeout=5.0)
+        with self._read_lock:
+            if self._read_conn is not None:
+                self._read_conn.close()
+                self._read_conn = None
+
+    def _enqueue_write(self, item) -> None:
+        """쓰기 대기열에 항목을 넣고, 필요하면 쓰기 스레드를 시작합니다."""
+        with self._writer_lock:
+            self._write_queue.put(item)
+            if self._writer_thread is None:
+                self._writer_thread = threading.Thread(
+                    target=self._writer_loop,
+                    name="ProcessingHistoryWriter",
+                    daemon=True
                 )
-                conn.commit()
+                self._writer_thread.start()
+
+    def _writer_loop(self) -> None:
+        """저장 요청을 모아서 하나의 트랜잭션으로 커밋하는 쓰기 스레드"""
+        conn = None
+        try:
+            conn = self._connect()
+            while True:
+                try:
+                    item = self._write_queue.get(timeout=self.WRITER_IDLE_TIMEOUT)
+                except queue.Empty:
+                    with self._writer_lock:
+                        if self._write_queue.empty():
+                            self._writer_thread = None
+                            return
+                    continue
+
+                statements: List[Tuple[str, tuple]] = []
+                waiters: List[threading.Event] = []
+                try:
+                    deadline = time.monotonic() + self.WRITE_BATCH_INTERVAL
+                    while True:
+                        if isinstance(item, threading.Event):
+                            waiters.append(item)
+                        else:
+                            statements.append(item)
+
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0 or waiters:
+                            break
+                        try:
+                            item = self._write_queue.get(timeout=remaining)
+                        except queue.Empty:
+                            break
+
+                    self._commit_statements(conn, statements)
+                except Exception as e:
+                    # 실패한 묶음은 버리고 다음 요청을 계속 처리
+                    logger.error(f"DB 저장 실패: {e}")
+                    self._release_pending(statements)
+                finally:
+                    # flush()/close()가 영원히 기다리지 않도록 항상 깨움
+                    for waiter in waiters:
+                        waiter.set()
+        except Exception as e:
+            logger.error(f"DB 쓰기 스레드 오류: {e}")
+            with self._writer_lock:
+                self._writer_thread = None
+                self._drain_write_queue()
+        finally:
+            if conn is not None:
+                conn.close()
+
+    def _drain_write_queue(self) -> None:
+        """쓰기 스레드가 중단될 때 남은 요청을 버리고 기다리는 쪽을 깨웁니다."""
+        while True:
+            try:
+                item = self._write_queue.get_nowait()
+            except queue.Empty:
+                return
+            if isinstance(item, threading.Event):
+                item.set()
+            else:
+                self._release_pending([item])
+
+    def _commit_statements(self, conn: sqlite3.Connection, statements: List[Tuple[str, tuple]]) -> None:
+        """모인 쓰기 요청을 하나의 트랜잭션으로 커밋합니다."""
+        if not statements:
+            return
+        try:
+            with conn:
+                for sql, params in statements:
+                    conn.execute(sql, params)
         except Exception as e:
             logger.error(f"DB 저장 실패: {e}")
+        finally:
+            self._release_pending(statements)
 
-    async def save_result_async(self, file_hash: str, filename: str, file_size: int, result: Dict[str, Any]):
-        """비동기 DB 저장"""
-        await asyncio.to_thread(self.save_result, file_hash, filename, file_size, result)
+    def _release_pending(self, statements: List[Tuple[str, tuple]]) -> None:
+        """처리한(또는 버린) 쓰기 요청을 커밋 대기 목록에서 뺍니다."""
+        with self._pending_lock:
+            for sql, row in statements:
+                if sql is self._UPSERT_SQL and self._pending.get(row[0]) is row:
+                    del self._pending[row[0]]
+                elif sql is self._UPSERT_PATH_SQL and self._pending_paths.get(row[0]) is row:
+                    del self._pending_paths[row[0]]
@@ -0,0 +1,241 @@
+# -*- coding: utf-8 -*-
+"""
+유사 파일 분류 모듈
+
+처리 이력(파일명, 내용 발췌, 폴더명)으로 문자 n-gram TF-IDF 역색인을 만들고,
+새 파일과 가장 비슷한 과거 파일들의 폴더로 API 호출 없이 분류합니다.
+"""
+
+import heapq
+import logging
+import math
+import re
+import threading
+from collections import Counter, defaultdict, deque
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class _TfidfIndex:
+    """
+    L2 정규화된 TF-IDF 벡터의 역색인 (특징 -> [(문서 번호, 가중치)])
+
+    문서 번호는 추가 순서대로 늘어나므로, 가장 오래된 문서는 각 포스팅 목록의 맨 앞에 있어
+    evict_oldest()로 바로 뺄 수 있습니다.
+    """
+
+    def __init__(self):
+        self.doc_freq: Counter = Counter()
+        self.postings: Dict[str, deque] = defaultdict(deque)
+        self.labels: Dict[int, Tuple[str, str]] = {}
+        self._doc_features: Dict[int, Tuple[str, ...]] = {}
+        self._next_id = 0
+
+    def __len__(self) -> int:
+        return len(self.labels)
+
+    def idf(self, feature: str) -> float:
+        return math.log((1 + len(self.labels)) / (1 + self.doc_freq.get(feature, 0))) + 1.0
+
+    def vectorize(self, counts: Counter) -> Dict[str, float]:
+        vector = {f: (1.0 + math.log(tf)) * self.idf(f) for f, tf in counts.items()}
+        norm = math.sqrt(sum(w * w for w in vector.values())) or 1.0
+        return {f: w / norm for f, w in vector.items()}
+
+    def add(self, counts: Counter, label: Tuple[str, str], count_df: bool = True):
+        if count_df:
+            self.doc_freq.update(counts.keys())
+        doc_id = self._next_id
+        self._next_id += 1
+        self.labels[doc_id] = label
+        self._doc_features[doc_id] = tuple(counts)
+        for feature, weight in self.vectorize(counts).items():
+            self.postings[feature].append((doc_id, weight))
+
+    def evict_oldest(self):
+        """가장 먼저 추가된 문서를 색인에서 뺍니다."""
+        doc_id = next(iter(self.labels))
+        del self.labels[doc_id]
+        for feature in self._doc_features.pop(doc_id):
+            postings = self.postings[feature]
+            if postings and postings[0][0] == doc_id:
+                postings.popleft()
+            if not postings:
+                del self.postings[feature]
+            self.doc_freq[feature] -= 1
+            if self.doc_freq[feature] <= 0:
+                del self.doc_freq[feature]
+
+
+class NearestNeighborClassifier:
+    """
+    처리 이력 기반 최근접 이웃 분류기
+
+    파일명(숫자는 하나의 기호로 통일)과 내용 발췌의 문자 n-gram을 특징으로 사용합니다.
+    가장 가까운 이웃의 유사도가 threshold 이상이고, 상위 k개 이웃의 유사도 가중 투표에서
+    한 폴더가 min_vote_ratio 이상을 차지할 때만 결과를 반환합니다.
+    색인이 max_documents개를 넘으면 가장 오래된 이력부터 뺍니다.
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.75,
+        k: int = 5,
+        min_vote_ratio: float = 0.6,
+        max_documents: int = 20000,
+        snippet_length: int = 300,
+    ):
+        self.threshold = threshold
+        self.k = k
+        self.min_vote_ratio = min_vote_ratio
+        self.max_documents = max_documents
+        self.snippet_length = snippet_length
+
+        self._index = _TfidfIndex()
+        self._lock = threading.Lock()
+        self._ready = False
+        self._building = False
+        self._added_during_build: List[Tuple[Counter, Tuple[str, str]]] = []
+
+    @property
+    def ready(self) -> bool:
+        return self._ready
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def features(self, filename: str, snippet: Optional[str] = None) -> Counter:
+        """파일명과 내용 발췌에서 문자 n-gram 특징을 추출합니다."""
+        path = Path(filename)
+        stem = re.sub(r"\d+", "0", path.stem.lower())
+        stem = re.sub(r"[\s_\-.()\[\]]+", " ", stem).strip()
+
+        counts: Counter = Counter()
+        if path.suffix:
+            counts["x:" + path.suffix.lower()] += 1
+
+        padded = f" {stem} "
+        for n in (2, 3, 4):
+            for i in range(len(padded) - n + 1):
+                counts["f:" + padded[i:i + n]] += 1
+
+        if snippet:
+            text = re.sub(r"\s+", " ", snippet[:self.snippet_length].lower()).strip()
+            text = re.sub(r"\d+", "0", text)
+            for i in range(len(text) - 2):
+                counts["c:" + text[i:i + 3]] += 1
+        return counts
+
+    def load(self, rows: Iterable[Tuple[str, Optional[str], str, str]]) -> int:
+        """
+        (파일명, 내용 발췌, 폴더명, 카테고리) 이력으로 색인을 새로 만듭니다.
+
+        색인은 별도로 만든 뒤 교체하므로, 만드는 동안에도 기존 색인으로 분류할 수 있습니다.
+
+        Returns:
+            int: 색인된 문서 수
+        """
+        with self._lock:
+            self._building = True
+            self._added_during_build = []
+
+        try:
+            documents = []
+            for filename, snippet, folder_name, category in rows:
+                documents.append((self.features(filename, snippet), (folder_name, category or "")))
+                if len(documents) >= self.max_documents:
+                    break
+
+            index = _TfidfIndex()
+            for counts, _ in documents:
+                index.doc_freq.update(counts.keys())
+            # 이력은 최신순이므로 오래된 것부터 추가 (넘칠 때 오래된 문서부터 빠지도록)
+            for counts, label in reversed(documents):
+                index.add(counts, label, count_df=False)
+        except Exception:
+            with self._lock:
+                self._building = False
+            raise
+
+        with self._lock:
+            for counts, label in self._added_during_build:
+                index.add(counts, label)
+            while len(index) > self.max_documents:
+                index.evict_oldest()
+            self._added_during_build = []
+            self._index = index
+            self._building = False
+            self._ready = True
+
+        logger.info(f"유사 파일 분류기 색인 완료: {len(index)}개 문서")
+        return len(index)
+
+    def load_in_background(self, history_db, exclude_reason_prefix: Optional[str] = None) -> threading.Thread:
+        """이력 DB에서 색인을 백그라운드 스레드로 만듭니다."""
+        def run():
+            try:
+                self.load(history_db.iter_training_rows(self.max_documents, exclude_reason_prefix))
+            except Exception as e:
+                logger.error(f"유사 파일 분류기 색인 실패: {e}")
+
+        thread = threading.Thread(target=run, name="NearestNeighborIndex", daemon=True)
+        thread.start()
+        return thread
+
+    def add(self, filename: str, snippet: Optional[str], folder_name: str, category: str = ""):
+        """새 분류 결과를 색인에 추가합니다."""
+        if not folder_name:
+            return
+        counts = self.features(filename, snippet)
+        with self._lock:
+            if self._building:
+                self._added_during_build.append((counts, (folder_name, category or "")))
+            self._index.add(counts, (folder_name, category or ""))
+            while len(self._index) > self.max_documents:
+                self._index.evict_oldest()
+
+    def classify(self, filename: str, snippet: Optional[str] = None) -> Optional[Dict[str, object]]:
+        """
+        가장 비슷한 이력의 폴더로 분류합니다.
+
+        Returns:
+            Optional[Dict[str, object]]: 분류 결과 (확신할 수 없으면 None)
+        """
+        counts = self.features(filename, snippet)
+        with self._lock:
+            index = self._index
+            total = len(index)
+            if not total:
+                return None
+
+            # 절반 이상의 문서에 나오는 특징은 변별력이 없으므로 계산에서 제외
+            common = total // 2 if total >= 20 else total + 1
+            scores: Dict[int, float] = defaultdict(float)
+            for feature, weight in index.vectorize(counts).items():
+                if index.doc_freq.get(feature, 0) > common:
+                    continue
+                for doc_id, doc_weight in index.postings.get(feature, ()):
+                    scores[doc_id] += weight * doc_weight
+
+            neighbors = heapq.nlargest(self.k, scores.items(), key=lambda item: item[1])
+            labels = [(index.labels[doc_id], score) for doc_id, score in neighbors]
+
+        if not labels or labels[0][1] < self.threshold:
+            return None
+
+        votes: Dict[Tuple[str, str], float] = defaultdict(float)
+        for label, score in labels:
+            votes[label] += score
+        (folder_name, category), vote = max(votes.items(), key=lambda item: item[1])
+        if vote / sum(votes.values()) < self.min_vote_ratio:
+            return None
+
+        similarity = max(score for label, score in labels if label == (folder_name, category))
+        return {
+            "folder_name": folder_name,
+            "category": category,
+            "confidence": round(min(similarity, 1.0), 3),
+            "reason": f"유사한 이전 파일 기반 분류 (유사도 {similarity:.2f})",
+        }
@@ -1,11 +1,108 @@
 from abc import ABC, abstractmethod
 from typing import Optional
 
+from modules.prompts import strip_existing_folders_hint
+
+from .rate_limiter import (
+    AdaptiveRateLimiter,
+    RateLimitExceeded,
+    get_rate_limiter,
+    is_rate_limit_error,
+    parse_retry_after,
+)
+from .response_cache import LLMResponseCache, get_response_cache, make_cache_key
+from .tokens import estimate_tokens
+
 class LLMClient(ABC):
-    @abstractmethod
+    # Clients of the same provider share one limiter (see rate_limiter.get_rate_limiter)
+    provider: str = "default"
+
+    @property
+    def rate_limiter(self) -> AdaptiveRateLimiter:
+        return get_rate_limiter(self.provider)
+
+    @property
+    def response_cache(self) -> Optional[LLMResponseCache]:
+        return get_response_cache()
+
+    @property
+    def model_name(self) -> str:
+        return str(getattr(self, "model", ""))
+
+    def cache_key(self, prompt: str, *extra: str) -> str:
+        # The existing-folder hint changes as folders are added; leave it out of the key
+        return make_cache_key(
+            self.provider,
+            self.model_name,
+            getattr(self, "temperature", 0.0),
+            "\x00".join((strip_existing_folders_hint(prompt),) + extra),
+        )
+
+    def invalidate_cached(self, prompt: str, *extra: str):
+        """Drops a cached response, e.g. one the caller could not parse."""
+        cache = self.response_cache
+        if cache is not None:
+            cache.invalidate(self.cache_key(prompt, *extra))
+
+    def _estimate_request_tokens(self, prompt: str) -> int:
+        return estimate_tokens(prompt, self.provider) + (getattr(self, "max_tokens", 0) or 0)
+
+    def _rate_limited(self, error: Exception) -> RateLimitExceeded:
+        retry_after = self.rate_limiter.on_rate_limited(parse_retry_after(error))
+        return RateLimitExceeded(f"{self.provider} rate limit: {error}", retry_after)
+
     def call(self, prompt: str, **kwargs) -> str:
+        return self._limited_sync(prompt, lambda: self._call(prompt, **kwargs), self.cache_key(prompt))
+
+    async def call_async(self, prompt: str, **kwargs) -> str:
+        return await self._limited_async(prompt, lambda: self._call_async(prompt, **kwargs), self.cache_key(prompt))
+
+    def _limited_sync(self, prompt: str, request, cache_key: Optional[str] = None) -> str:
+        """Runs request() inside the provider's rate limiter, consulting the response cache."""
+        cache = self.response_cache if cache_key else None
+        if cache is not None:
+            cached = cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        with self.rate_limiter.acquire_sync(self._estimate_request_tokens(prompt)):
+            try:
+                result = request()
+            except Exception as e:
+                if is_rate_limit_error(e):
+                    raise self._rate_limited(e) from e
+                raise
+        self.rate_limiter.on_success()
+
+        if cache is not None:
+            cache.put(cache_key, result)
+        return result
+
+    async def _limited_async(self, prompt: str, request, cache_key: Optional[str] = None) -> str:
+        """Awaits request() inside the provider's rate limiter, consulting the response cache."""
+        cache = self.response_cache if cache_key else None
+        if cache is not None:
+            cached = await cache.get_async(cache_key)
+            if cached is not None:
+                return cached
+
+        async with self.rate_limiter.acquire(self._estimate_request_tokens(prompt)):
+            try:
+                result = await request()
+            except Exception as e:
+                if is_rate_limit_error(e):
+                    raise self._rate_limited(e) from e
+                raise
+        self.rate_limiter.on_success()
+
+        if cache is not None:
+            await cache.put_async(cache_key, result)
+        return result
+
+    @abstractmethod
+    def _call(self, prompt: str, **kwargs) -> str:
         pass
 
     @abstractmethod
-    async def call_async(self, prompt: str, **kwargs) -> str:
+    async def _call_async(self, prompt: str, **kwargs) -> str:
         pass
@@ -1,27 +1,63 @@
 from .base import LLMClient
+from .structured import dump_structured
 import anthropic
-import asyncio
 import logging
+from typing import Optional
 
 logger = logging.getLogger(__name__)
 
 class ClaudeClient(LLMClient):
+    provider = "claude"
+
     def __init__(self, api_key: str, model: str, temperature: float, max_tokens: int):
         self.client = anthropic.Anthropic(api_key=api_key)
+        # One async client per instance, so all in-flight requests share its HTTP connection pool
+        self.async_client = anthropic.AsyncAnthropic(api_key=api_key)
         self.model = model if "claude" in model else "claude-3-haiku-20240307"
         self.temperature = temperature
         self.max_tokens = max_tokens
 
-    def call(self, prompt: str, **kwargs) -> str:
+    def _call(self, prompt: str, response_schema: Optional[dict] = None, **kwargs) -> str:
         message = self.client.messages.create(
             model=self.model,
             max_tokens=self.max_tokens,
             temperature=self.temperature,
             messages=[
                 {"role": "user", "content": prompt}
-            ]
+            ],
+            **self._structured_kwargs(response_schema)
         )
-        return message.content[0].text
+        return self._message_text(message)
 
-    async def call_async(self, prompt: str, **kwargs) -> str:
-        return await asyncio.to_thread(self.call, prompt, **kwargs)
+    async def _call_async(self, prompt: str, response_schema: Optional[dict] = None, **kwargs) -> str:
+        message = await self.async_client.messages.create(
+            model=self.model,
+            max_tokens=self.max_tokens,
+            temperature=self.temperature,
+            messages=[
+                {"role": "user", "content": prompt}
+            ],
+            **self._structured_kwargs(response_schema)
+        )
+        return self._message_text(message)
+
+    @staticmethod
+    def _structured_kwargs(response_schema: Optional[dict]) -> dict:
+        # Claude's structured output: force a single tool call whose input must match the schema
+        if not response_schema:
+            return {}
+        return {
+            "tools": [{
+                "name": response_schema["name"],
+                "description": "Record the classification result.",
+                "input_schema": response_schema["schema"],
+            }],
+            "tool_choice": {"type": "tool", "name": response_schema["name"]},
+        }
+
+    @staticmethod
+    def _message_text(message) -> str:
+        for block in message.content:
+            if getattr(block, "type", None) == "tool_use":
+                return dump_structured(block.input)
+        return message.content[0].text
@@ -1,5 +1,6 @@
-from typing import Optional
+from typing import Callable, List, Optional, Tuple
 import logging
+import config.config as cfg
 from .base import LLMClient
 
 logger = logging.getLogger(__name__)
@@ -38,3 +39,63 @@ def create_llm_client(
         except ImportError:
             logger.error("Failed to import OpenAIClient. Please ensure openai is installed.")
             raise
+
+def create_tiered_llm_client(
+    credential_source: str,
+    api_key: str,
+    base_url: str,
+    model: str,
+    fast_model: Optional[str],
+    temperature: float,
+    max_tokens: int,
+    timeout: int,
+    accept: Optional[Callable[[str], bool]] = None,
+) -> Optional[LLMClient]:
+    """Builds a fast->strong routed client, or the plain client when no distinct fast model is set."""
+    strong = create_llm_client(credential_source, api_key, base_url, model, temperature, max_tokens, timeout)
+    if not strong or not fast_model:
+        return strong
+
+    fast = create_llm_client(credential_source, api_key, base_url, fast_model, temperature, max_tokens, timeout)
+    if not fast or fast.model_name == strong.model_name:
+        return strong
+
+    from .router import TieredLLMClient
+    logger.info(f"Tiered routing enabled: {fast.model_name} -> {strong.model_name}")
+    return TieredLLMClient(fast, strong, accept)
+
+
+def discover_secondary_credentials(primary_source: str, primary_key: str) -> List[Tuple[str, str]]:
+    """Returns (provider, api_key) pairs other than the primary, in HEDGE_PROVIDERS order."""
+    try:
+        from modules.credential_manager import CredentialManager
+        available = CredentialManager().get_available_credentials()
+    except Exception as e:
+        logger.warning(f"Failed to discover additional credentials: {e}")
+        return []
+
+    primary_provider = "openai" if primary_source == "manual" else primary_source
+    order = getattr(cfg, 'HEDGE_PROVIDERS', list(available))
+    return [
+        (provider, available[provider]["key"])
+        for provider in order
+        if provider in available and provider != primary_provider and available[provider]["key"] != primary_key
+    ]
+
+
+def create_hedged_llm_client(primary: Optional[LLMClient], secondaries: List[LLMClient]) -> Optional[LLMClient]:
+    """Wraps the primary client with hedging across secondaries, or returns it unchanged when there are none."""
+    if not primary or not secondaries:
+        return primary
+
+    from .hedging import HedgedLLMClient
+    logger.info(f"Hedged requests enabled: {primary.provider} -> {', '.join(c.provider for c in secondaries)}")
+    return HedgedLLMClient(
+        primary,
+        secondaries,
+        quantile=getattr(cfg, 'HEDGE_QUANTILE', 0.95),
+        initial_delay=getattr(cfg, 'HEDGE_INITIAL_DELAY', 2.0),
+        min_delay=getattr(cfg, 'HEDGE_MIN_DELAY', 0.2),
+        failure_threshold=getattr(cfg, 'CIRCUIT_BREAKER_THRESHOLD', 3),
+        reset_timeout=getattr(cfg, 'CIRCUIT_BREAKER_RESET_TIMEOUT', 30.0),
+    )
@@ -1,23 +1,79 @@
 from .base import LLMClient
+from .structured import strip_unsupported_keys
 import google.generativeai as genai
-import asyncio
+from google.api_core import exceptions as google_exceptions
 import logging
+from typing import Optional
 
 logger = logging.getLogger(__name__)
 
+# Field names (snake_case from the SDK, camelCase from the REST API) that mark a JSON-mode rejection
+STRUCTURED_OUTPUT_FIELDS = ("response_mime_type", "response_schema", "responsemimetype", "responseschema")
+
+
+def _rejects_structured_output(error: Exception) -> bool:
+    # Other InvalidArgument errors (oversized prompt, bad image, safety settings) must not disable JSON mode
+    if not isinstance(error, google_exceptions.InvalidArgument):
+        return False
+    text = str(error).lower()
+    return any(field in text for field in STRUCTURED_OUTPUT_FIELDS)
+
+
 class GeminiClient(LLMClient):
+    provider = "gemini"
+
     def __init__(self, api_key: str, model: str, temperature: float, max_tokens: int):
         genai.configure(api_key=api_key)
         model_name = model if "gemini" in model else "gemini-pro"
         self.model = genai.GenerativeModel(model_name)
+        self.gemini_model_name = model_name
+        self.temperature = temperature
+        self.max_tokens = max_tokens
         self.generation_config = genai.types.GenerationConfig(
             temperature=temperature,
             max_output_tokens=max_tokens
         )
+        self._structured_output = True
 
-    def call(self, prompt: str, **kwargs) -> str:
-        response = self.model.generate_content(prompt, generation_config=self.generation_config)
+    @property
+    def model_name(self) -> str:
+        return self.gemini_model_name
+
+    def _generation_config(self, response_schema: Optional[dict]):
+        if not response_schema or not self._structured_output:
+            return self.generation_config
+        return genai.types.GenerationConfig(
+            temperature=self.temperature,
+            max_output_tokens=self.max_tokens,
+            response_mime_type="application/json",
+            # Gemini's schema dialect has no additionalProperties
+            response_schema=strip_unsupported_keys(response_schema["schema"]),
+        )
+
+    def _disable_structured_output(self, error: Exception) -> bool:
+        # Older models (e.g. gemini-pro) reject JSON mode; remember and retry with plain output
+        if not self._structured_output or not _rejects_structured_output(error):
+            return False
+        self._structured_output = False
+        logger.warning(f"{self.gemini_model_name} rejected structured output, using plain text: {error}")
+        return True
+
+    def _call(self, prompt: str, response_schema: Optional[dict] = None, **kwargs) -> str:
+        try:
+            response = self.model.generate_content(prompt, generation_config=self._generation_config(response_schema))
+        except Exception as e:
+            if not response_schema or not self._disable_structured_output(e):
+                raise
+            response = self.model.generate_content(prompt, generation_config=self.generation_config)
         return response.text
 
-    async def call_async(self, prompt: str, **kwargs) -> str:
-        return await asyncio.to_thread(self.call, prompt, **kwargs)
+    async def _call_async(self, prompt: str, response_schema: Optional[dict] = None, **kwargs) -> str:
+        # Native async API; the SDK multiplexes requests over one shared async channel
+        config = self._generation_config(response_schema)
+        try:
+            response = await self.model.generate_content_async(prompt, generation_config=config)
+        except Exception as e:
+            if not response_schema or not self._disable_structured_output(e):
+                raise
+            response = await self.model.generate_content_async(prompt, generation_config=self.generation_config)
+        return response.text
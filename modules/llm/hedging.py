@@ -0,0 +1,238 @@
+import asyncio
+import logging
+import math
+import threading
+import time
+from collections import deque
+from typing import Dict, List, Optional
+
+from .base import LLMClient
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitBreaker:
+    """Opens after consecutive failures and admits a single probe call after reset_timeout."""
+
+    def __init__(self, failure_threshold: int = 3, reset_timeout: float = 30.0):
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self._probing = False
+        self._lock = threading.Lock()
+
+    @property
+    def is_open(self) -> bool:
+        return self.opened_at is not None
+
+    def allow(self) -> bool:
+        """Whether a call would be admitted now (does not claim the half-open probe)."""
+        with self._lock:
+            return self._admissible()
+
+    def try_acquire(self) -> bool:
+        """Admits a call; while half-open only the first caller gets through, as the probe."""
+        with self._lock:
+            if not self._admissible():
+                return False
+            if self.opened_at is not None:
+                self._probing = True
+            return True
+
+    def _admissible(self) -> bool:
+        if self.opened_at is None:
+            return True
+        return not self._probing and time.monotonic() - self.opened_at >= self.reset_timeout
+
+    def record_cancelled(self):
+        with self._lock:
+            self._probing = False
+
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            self._probing = False
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            self._probing = False
+            if self.opened_at is not None or self.failures >= self.failure_threshold:
+                self.opened_at = time.monotonic()
+
+
+class LatencyTracker:
+    """Sliding window of successful call latencies."""
+
+    def __init__(self, window: int = 200):
+        self.samples = deque(maxlen=window)
+
+    def record(self, seconds: float):
+        self.samples.append(seconds)
+
+    def quantile(self, q: float) -> Optional[float]:
+        if not self.samples:
+            return None
+        ordered = sorted(self.samples)
+        return ordered[min(len(ordered) - 1, max(0, math.ceil(q * len(ordered)) - 1))]
+
+
+class HedgedLLMClient(LLMClient):
+    """Sends to the primary provider and hedges to the next one if it is slow.
+
+    A duplicate request is started on the next healthy provider once the
+    primary has been outstanding longer than its observed latency quantile
+    (or immediately when it fails). The first successful answer wins and the
+    remaining requests are cancelled. Providers that fail repeatedly are
+    skipped by a per-provider circuit breaker until they recover.
+    """
+
+    def __init__(
+        self,
+        primary: LLMClient,
+        secondaries: List[LLMClient],
+        quantile: float = 0.95,
+        initial_delay: float = 2.0,
+        min_delay: float = 0.2,
+        min_samples: int = 20,
+        failure_threshold: int = 3,
+        reset_timeout: float = 30.0,
+    ):
+        self.primary = primary
+        self.clients = [primary] + list(secondaries)
+        self.provider = primary.provider
+        self.quantile = quantile
+        self.initial_delay = initial_delay
+        self.min_delay = min_delay
+        self.min_samples = min_samples
+        self.breakers: Dict[int, CircuitBreaker] = {
+            id(client): CircuitBreaker(failure_threshold, reset_timeout) for client in self.clients
+        }
+        self.latencies: Dict[int, LatencyTracker] = {id(client): LatencyTracker() for client in self.clients}
+        self.hedges = 0
+
+    @property
+    def model_name(self) -> str:
+        return self.primary.model_name
+
+    def invalidate_cached(self, prompt: str, *extra: str):
+        for client in self.clients:
+            client.invalidate_cached(prompt, *extra)
+
+    def hedge_delay(self, client: LLMClient) -> float:
+        tracker = self.latencies[id(client)]
+        if len(tracker.samples) < self.min_samples:
+            return self.initial_delay
+        return max(self.min_delay, tracker.quantile(self.quantile))
+
+    def _candidates(self) -> List[LLMClient]:
+        candidates = [client for client in self.clients if self.breakers[id(client)].allow()]
+        # Never refuse outright; fall back to the primary if every breaker is open
+        return candidates or [self.primary]
+
+    def call(self, prompt: str, **kwargs) -> str:
+        last_error: Optional[Exception] = None
+        attempted = False
+        for client in self._candidates():
+            if not self.breakers[id(client)].try_acquire():
+                continue
+            attempted = True
+            try:
+                return self._timed_call_sync(client, prompt, kwargs)
+            except Exception as e:
+                logger.warning(f"{client.provider} failed, trying next provider: {e}")
+                last_error = e
+        if not attempted:
+            # Never refuse outright; every breaker is open or probing, so call the primary anyway
+            return self._timed_call_sync(self.primary, prompt, kwargs)
+        raise last_error
+
+    async def call_async(self, prompt: str, **kwargs) -> str:
+        candidates = self._candidates()
+        running: Dict[asyncio.Task, LLMClient] = {}
+        last_error: Optional[Exception] = None
+        next_index = 0
+
+        def launch() -> bool:
+            # Start the next candidate whose breaker admits the call (one probe per half-open window)
+            nonlocal next_index
+            while next_index < len(candidates):
+                client = candidates[next_index]
+                next_index += 1
+                if self.breakers[id(client)].try_acquire():
+                    running[asyncio.ensure_future(self._timed_call(client, prompt, kwargs))] = client
+                    return True
+            return False
+
+        if not launch():
+            # Never refuse outright; every breaker is open or probing, so call the primary anyway
+            running[asyncio.ensure_future(self._timed_call(self.primary, prompt, kwargs, admitted=False))] = self.primary
+        try:
+            while running:
+                # Pace hedges by the oldest request still outstanding (normally the primary's),
+                # not by whichever provider was launched last
+                oldest = next(iter(running.values()))
+                timeout = self.hedge_delay(oldest) if next_index < len(candidates) else None
+                done, _ = await asyncio.wait(running, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+
+                if not done:
+                    if launch():
+                        self.hedges += 1
+                        logger.info(f"Hedged slow request to {candidates[next_index - 1].provider}")
+                    continue
+
+                winner = None
+                for task in done:
+                    running.pop(task)
+                    if task.exception() is None:
+                        winner = winner or task
+                    else:
+                        last_error = task.exception()
+                if winner is not None:
+                    return winner.result()
+
+                # Every outstanding request failed: move on to the next provider right away
+                if not running:
+                    launch()
+            raise last_error
+        finally:
+            for task in running:
+                task.cancel()
+
+    def _timed_call_sync(self, client: LLMClient, prompt: str, kwargs: dict) -> str:
+        breaker = self.breakers[id(client)]
+        started = time.monotonic()
+        try:
+            result = client.call(prompt, **kwargs)
+        except Exception:
+            breaker.record_failure()
+            raise
+        breaker.record_success()
+        self.latencies[id(client)].record(time.monotonic() - started)
+        return result
+
+    async def _timed_call(self, client: LLMClient, prompt: str, kwargs: dict, admitted: bool = True) -> str:
+        breaker = self.breakers[id(client)]
+        started = time.monotonic()
+        try:
+            result = await client.call_async(prompt, **kwargs)
+        except asyncio.CancelledError:
+            # Release the half-open probe this call held (a forced call never claimed it)
+            if admitted:
+                breaker.record_cancelled()
+            raise
+        except Exception as e:
+            breaker.record_failure()
+            logger.warning(f"{client.provider} request failed: {e}")
+            raise
+        breaker.record_success()
+        self.latencies[id(client)].record(time.monotonic() - started)
+        return result
+
+    def _call(self, prompt: str, **kwargs) -> str:
+        return self.call(prompt, **kwargs)
+
+    async def _call_async(self, prompt: str, **kwargs) -> str:
+        return await self.call_async(prompt, **kwargs)
@@ -1,9 +1,25 @@
 from .base import LLMClient
-from openai import OpenAI, AsyncOpenAI
+from openai import OpenAI, AsyncOpenAI, BadRequestError
 import config.config as cfg
-import asyncio
+import logging
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+# Structured output modes, strongest first; a model or server that rejects one falls back to the next
+STRUCTURED_MODES = ("json_schema", "json_object", None)
+
+
+def _rejects_structured_output(error: BadRequestError) -> bool:
+    # Only a 400 that names response_format (e.g. "response_format" or "response_format.json_schema")
+    # is a rejection of the structured mode; other JSON-related errors must not downgrade it
+    param = getattr(error, "param", None) or ""
+    return param.split(".", 1)[0] == "response_format"
+
 
 class OpenAIClient(LLMClient):
+    provider = "openai"
+
     def __init__(self, api_key: str, base_url: str, model: str, temperature: float, max_tokens: int, timeout: int):
         self.client = OpenAI(api_key=api_key, base_url=base_url)
         self.async_client = AsyncOpenAI(api_key=api_key, base_url=base_url)
@@ -11,46 +27,104 @@ class OpenAIClient(LLMClient):
         self.temperature = temperature
         self.max_tokens = max_tokens
         self.timeout = timeout
+        self._structured_mode = 0
 
-    def call(self, prompt: str, **kwargs) -> str:
-        response = self.client.chat.completions.create(
+    def _call(self, prompt: str, response_schema: Optional[dict] = None, **kwargs) -> str:
+        return self._complete([{"role": "user", "content": prompt}], response_schema)
+
+    async def _call_async(self, prompt: str, response_schema: Optional[dict] = None, **kwargs) -> str:
+        return await self._complete_async([{"role": "user", "content": prompt}], response_schema)
+
+    def _response_format(self, response_schema: Optional[dict]) -> Optional[dict]:
+        mode = STRUCTURED_MODES[self._structured_mode] if response_schema else None
+        if mode == "json_schema":
+            return {
+                "type": "json_schema",
+                "json_schema": {"name": response_schema["name"], "schema": response_schema["schema"], "strict": True},
+            }
+        if mode == "json_object":
+            return {"type": "json_object"}
+        return None
+
+    def _request_kwargs(self, messages: list, response_schema: Optional[dict]) -> dict:
+        request = dict(
             model=self.model,
-            messages=[{"role": "user", "content": prompt}],
+            messages=messages,
             temperature=self.temperature,
             max_tokens=self.max_tokens,
             timeout=self.timeout,
         )
-        return response.choices.message.content
+        response_format = self._response_format(response_schema)
+        if response_format:
+            request["response_format"] = response_format
+        return request
 
-    async def call_async(self, prompt: str, **kwargs) -> str:
-        response = await self.async_client.chat.completions.create(
-            model=self.model,
-            messages=[{"role": "user", "content": prompt}],
-            temperature=self.temperature,
-            max_tokens=self.max_tokens,
-            timeout=self.timeout,
+    def _downgrade_structured_output(self, error: Exception):
+        self._structured_mode += 1
+        logger.warning(
+            f"{self.model} rejected structured output, using {STRUCTURED_MODES[self._structured_mode] or 'plain text'}: {error}"
         )
-        return response.choices.message.content
 
-    def call_vision(self, prompt: str, image_data: str, mime_type: str) -> str:
-        response = self.client.chat.completions.create(
-            model=self.model,
-            messages=[
-                {
-                    "role": "user",
-                    "content": [
-                        {"type": "text", "text": prompt},
-                        {
-                            "type": "image_url",
-                            "image_url": {
-                                "url": f"data:{mime_type};base64,{image_data}"
-                            },
+    def _complete(self, messages: list, response_schema: Optional[dict] = None) -> str:
+        while True:
+            request = self._request_kwargs(messages, response_schema)
+            try:
+                response = self.client.chat.completions.create(**request)
+            except BadRequestError as e:
+                if "response_format" not in request or not _rejects_structured_output(e):
+                    raise
+                self._downgrade_structured_output(e)
+                continue
+            return response.choices[0].message.content or ""
+
+    async def _complete_async(self, messages: list, response_schema: Optional[dict] = None) -> str:
+        while True:
+            request = self._request_kwargs(messages, response_schema)
+            try:
+                response = await self.async_client.chat.completions.create(**request)
+            except BadRequestError as e:
+                if "response_format" not in request or not _rejects_structured_output(e):
+                    raise
+                self._downgrade_structured_output(e)
+                continue
+            return response.choices[0].message.content or ""
+
+    def _vision_messages(self, prompt: str, image_data: str, mime_type: str) -> list:
+        return [
+            {
+                "role": "user",
+                "content": [
+                    {"type": "text", "text": prompt},
+                    {
+                        "type": "image_url",
+                        "image_url": {
+                            "url": f"data:{mime_type};base64,{image_data}"
                         },
-                    ],
-                }
-            ],
-            temperature=self.temperature,
-            max_tokens=self.max_tokens,
-            timeout=self.timeout,
+                    },
+                ],
+            }
+        ]
+
+    def call_vision(self, prompt: str, image_data: str, mime_type: str, response_schema: Optional[dict] = None) -> str:
+        return self._limited_sync(
+            prompt,
+            lambda: self._call_vision(prompt, image_data, mime_type, response_schema),
+            self.cache_key(prompt, mime_type, image_data),
+        )
+
+    async def call_vision_async(
+        self, prompt: str, image_data: str, mime_type: str, response_schema: Optional[dict] = None
+    ) -> str:
+        return await self._limited_async(
+            prompt,
+            lambda: self._call_vision_async(prompt, image_data, mime_type, response_schema),
+            self.cache_key(prompt, mime_type, image_data),
         )
-        return response.choices.message.content
+
+    def _call_vision(self, prompt: str, image_data: str, mime_type: str, response_schema: Optional[dict] = None) -> str:
+        return self._complete(self._vision_messages(prompt, image_data, mime_type), response_schema)
+
+    async def _call_vision_async(
+        self, prompt: str, image_data: str, mime_type: str, response_schema: Optional[dict] = None
+    ) -> str:
+        return await self._complete_async(self._vision_messages(prompt, image_data, mime_type), response_schema)
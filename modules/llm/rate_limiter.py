@@ -0,0 +1,213 @@
+import asyncio
+import email.utils
+import logging
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+from typing import Dict, Optional
+
+import config.config as cfg
+
+logger = logging.getLogger(__name__)
+
+
+class RateLimitExceeded(Exception):
+    """Raised when a provider rejects a request with HTTP 429."""
+
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+def is_rate_limit_error(error: Exception) -> bool:
+    if isinstance(error, RateLimitExceeded):
+        return True
+    for attr in ("status_code", "code", "status"):
+        if getattr(error, attr, None) == 429:
+            return True
+    response = getattr(error, "response", None)
+    if getattr(response, "status_code", None) == 429:
+        return True
+    text = str(error).lower()
+    return "rate limit" in text or "resource exhausted" in text
+
+
+def parse_retry_after(error: Exception) -> Optional[float]:
+    if isinstance(error, RateLimitExceeded):
+        return error.retry_after
+
+    headers = getattr(getattr(error, "response", None), "headers", None)
+    if not headers:
+        return None
+
+    try:
+        value = headers.get("retry-after-ms")
+        if value is not None:
+            return max(0.0, float(value) / 1000.0)
+
+        value = headers.get("retry-after")
+        if value is None:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            retry_at = email.utils.parsedate_to_datetime(value)
+            return max(0.0, retry_at.timestamp() - time.time())
+    except Exception:
+        return None
+
+
+class TokenBucket:
+    """Token bucket that lets callers reserve ahead and go into debt.
+
+    A reservation always succeeds and returns how long the caller must wait
+    before the reserved capacity is actually available. Not thread-safe on
+    its own; AdaptiveRateLimiter serializes access.
+    """
+
+    def __init__(self, per_minute: float):
+        self.capacity = float(per_minute)
+        self.rate = self.capacity / 60.0
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+
+    def reserve(self, amount: float, now: float) -> float:
+        if self.rate <= 0:
+            return 0.0
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        self.tokens -= amount
+        return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+
+class AdaptiveRateLimiter:
+    """Per-provider limiter combining RPM/TPM token buckets with AIMD concurrency.
+
+    Concurrency grows by one after a full window of successes and halves on
+    every 429. A 429 also blocks all callers until its Retry-After elapses.
+    State is guarded by a threading lock so the same limiter serves sync calls
+    from worker threads and async calls from any event loop.
+    """
+
+    POLL_INTERVAL = 0.05
+
+    def __init__(
+        self,
+        name: str,
+        requests_per_minute: float = 0,
+        tokens_per_minute: float = 0,
+        max_concurrency: int = 5,
+        min_concurrency: int = 1,
+        default_backoff: float = 2.0,
+    ):
+        self.name = name
+        self.max_concurrency = max(1, int(max_concurrency))
+        self.min_concurrency = max(1, min(int(min_concurrency), self.max_concurrency))
+        self.default_backoff = default_backoff
+
+        self._requests = TokenBucket(requests_per_minute)
+        self._tokens = TokenBucket(tokens_per_minute)
+        self._lock = threading.Lock()
+        self._limit = self.max_concurrency
+        self._in_flight = 0
+        self._successes = 0
+        self._blocked_until = 0.0
+        self._consecutive_limits = 0
+
+    @property
+    def concurrency_limit(self) -> int:
+        return self._limit
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def _try_enter(self, estimated_tokens: int) -> float:
+        """Takes a slot and returns -(bucket wait), or returns a positive delay before retrying."""
+        with self._lock:
+            now = time.monotonic()
+            if self._blocked_until > now:
+                return self._blocked_until - now
+            if self._in_flight >= self._limit:
+                return self.POLL_INTERVAL
+
+            self._in_flight += 1
+            return -max(
+                self._requests.reserve(1, now),
+                self._tokens.reserve(estimated_tokens, now),
+            )
+
+    def _leave(self):
+        with self._lock:
+            self._in_flight -= 1
+
+    @asynccontextmanager
+    async def acquire(self, estimated_tokens: int = 0):
+        while True:
+            wait = self._try_enter(estimated_tokens)
+            if wait <= 0:
+                break
+            await asyncio.sleep(wait)
+        try:
+            if wait < 0:
+                await asyncio.sleep(-wait)
+            yield self
+        finally:
+            self._leave()
+
+    @contextmanager
+    def acquire_sync(self, estimated_tokens: int = 0):
+        while True:
+            wait = self._try_enter(estimated_tokens)
+            if wait <= 0:
+                break
+            time.sleep(wait)
+        try:
+            if wait < 0:
+                time.sleep(-wait)
+            yield self
+        finally:
+            self._leave()
+
+    def on_success(self):
+        with self._lock:
+            self._consecutive_limits = 0
+            self._successes += 1
+            if self._successes >= self._limit and self._limit < self.max_concurrency:
+                self._limit += 1
+                self._successes = 0
+                logger.debug(f"[{self.name}] concurrency raised to {self._limit}")
+
+    def on_rate_limited(self, retry_after: Optional[float] = None) -> float:
+        with self._lock:
+            self._consecutive_limits += 1
+            self._successes = 0
+            self._limit = max(self.min_concurrency, self._limit // 2)
+            if retry_after is None:
+                retry_after = self.default_backoff * (2 ** (self._consecutive_limits - 1))
+            self._blocked_until = max(self._blocked_until, time.monotonic() + retry_after)
+            logger.warning(
+                f"[{self.name}] rate limited; concurrency {self._limit}, pausing {retry_after:.1f}s"
+            )
+            return retry_after
+
+
+_limiters: Dict[str, AdaptiveRateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(provider: str) -> AdaptiveRateLimiter:
+    """Returns the limiter shared by every client of the given provider."""
+    with _limiters_lock:
+        limiter = _limiters.get(provider)
+        if limiter is None:
+            limits = getattr(cfg, 'LLM_RATE_LIMITS', {}).get(provider, {})
+            limiter = AdaptiveRateLimiter(
+                provider,
+                requests_per_minute=limits.get("rpm", 0),
+                tokens_per_minute=limits.get("tpm", 0),
+                max_concurrency=limits.get("max_concurrency", getattr(cfg, 'MAX_CONCURRENT_API_CALLS', 5)),
+                default_backoff=getattr(cfg, 'RATE_LIMIT_DEFAULT_BACKOFF', 2.0),
+            )
+            _limiters[provider] = limiter
+        return limiter
@@ -0,0 +1,189 @@
+import asyncio
+import hashlib
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+
+import config.config as cfg
+
+logger = logging.getLogger(__name__)
+
+
+def make_cache_key(provider: str, model: str, temperature: float, prompt: str) -> str:
+    digest = hashlib.sha256()
+    for part in (provider, model, repr(float(temperature or 0.0)), prompt):
+        digest.update(str(part).encode("utf-8"))
+        digest.update(b"\x00")
+    return digest.hexdigest()
+
+
+class LLMResponseCache:
+    """Two-tier prompt response cache: in-memory LRU in front of a SQLite table.
+
+    Keys are digests of (provider, model, temperature, prompt), so identical
+    prompts are answered once regardless of which file produced them. The
+    async accessors answer memory hits inline and run the SQLite tier on a
+    worker thread so the event loop never waits on disk.
+    """
+
+    PRUNE_EVERY = 256
+
+    def __init__(self, db_path: Optional[str] = None, memory_size: int = 2048, max_disk_entries: int = 50000):
+        self.memory_size = max(0, int(memory_size))
+        self.max_disk_entries = max(0, int(max_disk_entries))
+        self._memory: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+        # Guards the SQLite connection separately so memory hits never wait on disk I/O
+        self._db_lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._inserts = 0
+        self.hits = 0
+        self.misses = 0
+
+        if db_path:
+            try:
+                self._conn = sqlite3.connect(db_path, check_same_thread=False)
+                self._conn.execute("PRAGMA journal_mode=WAL")
+                self._conn.execute("PRAGMA synchronous=NORMAL")
+                self._conn.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS llm_responses (
+                        cache_key TEXT PRIMARY KEY,
+                        response TEXT NOT NULL,
+                        created_at REAL NOT NULL
+                    )
+                    """
+                )
+                self._conn.commit()
+            except sqlite3.Error as e:
+                logger.error(f"Failed to open LLM response cache at {db_path}: {e}")
+                self._conn = None
+
+    def get(self, key: str) -> Optional[str]:
+        response = self._get_memory(key)
+        if response is not None:
+            return response
+        return self._get_disk(key)
+
+    async def get_async(self, key: str) -> Optional[str]:
+        response = self._get_memory(key)
+        if response is not None:
+            return response
+        if self._conn is None:
+            return self._get_disk(key)
+        return await asyncio.to_thread(self._get_disk, key)
+
+    def put(self, key: str, response: str):
+        if not response:
+            return
+        with self._lock:
+            self._remember(key, response)
+        self._put_disk(key, response)
+
+    async def put_async(self, key: str, response: str):
+        if not response:
+            return
+        with self._lock:
+            self._remember(key, response)
+        if self._conn is not None:
+            await asyncio.to_thread(self._put_disk, key, response)
+
+    def invalidate(self, key: str):
+        with self._lock:
+            self._memory.pop(key, None)
+        with self._db_lock:
+            if self._conn is None:
+                return
+            try:
+                self._conn.execute("DELETE FROM llm_responses WHERE cache_key = ?", (key,))
+                self._conn.commit()
+            except sqlite3.Error as e:
+                logger.warning(f"LLM response cache delete failed: {e}")
+
+    def _get_memory(self, key: str) -> Optional[str]:
+        with self._lock:
+            response = self._memory.get(key)
+            if response is not None:
+                self._memory.move_to_end(key)
+                self.hits += 1
+            return response
+
+    def _get_disk(self, key: str) -> Optional[str]:
+        row = None
+        with self._db_lock:
+            if self._conn is not None:
+                try:
+                    row = self._conn.execute(
+                        "SELECT response FROM llm_responses WHERE cache_key = ?", (key,)
+                    ).fetchone()
+                except sqlite3.Error as e:
+                    logger.warning(f"LLM response cache read failed: {e}")
+        with self._lock:
+            if row:
+                self._remember(key, row[0])
+                self.hits += 1
+                return row[0]
+            self.misses += 1
+            return None
+
+    def _put_disk(self, key: str, response: str):
+        with self._db_lock:
+            if self._conn is None:
+                return
+            try:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO llm_responses (cache_key, response, created_at) VALUES (?, ?, ?)",
+                    (key, response, time.time()),
+                )
+                self._inserts += 1
+                if self.max_disk_entries and self._inserts % self.PRUNE_EVERY == 0:
+                    self._prune()
+                self._conn.commit()
+            except sqlite3.Error as e:
+                logger.warning(f"LLM response cache write failed: {e}")
+
+    def close(self):
+        with self._db_lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _remember(self, key: str, response: str):
+        if not self.memory_size:
+            return
+        self._memory[key] = response
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_size:
+            self._memory.popitem(last=False)
+
+    def _prune(self):
+        self._conn.execute(
+            """
+            DELETE FROM llm_responses WHERE cache_key IN (
+                SELECT cache_key FROM llm_responses ORDER BY created_at DESC LIMIT -1 OFFSET ?
+            )
+            """,
+            (self.max_disk_entries,),
+        )
+
+
+_cache: Optional[LLMResponseCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_response_cache() -> Optional[LLMResponseCache]:
+    """Returns the process-wide response cache, or None when disabled."""
+    global _cache
+    if not getattr(cfg, 'LLM_CACHE_ENABLED', True):
+        return None
+    with _cache_lock:
+        if _cache is None:
+            _cache = LLMResponseCache(
+                getattr(cfg, 'LLM_CACHE_DB_PATH', "llm_cache.db"),
+                memory_size=getattr(cfg, 'LLM_CACHE_MEMORY_SIZE', 2048),
+                max_disk_entries=getattr(cfg, 'LLM_CACHE_MAX_DISK_ENTRIES', 50000),
+            )
+        return _cache
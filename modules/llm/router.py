@@ -0,0 +1,89 @@
+import logging
+from typing import Callable, Optional
+
+from .base import LLMClient
+
+logger = logging.getLogger(__name__)
+
+TIER_FAST = "fast"
+TIER_STRONG = "strong"
+
+
+class TieredLLMClient(LLMClient):
+    """Routes each prompt to a cheap model first and escalates when needed.
+
+    `accept` inspects the fast model's reply and returns False when the
+    stronger model should answer instead (low confidence, unusable output).
+    Both underlying clients keep their own rate limiting and response cache.
+    Pass tier="fast" or tier="strong" to skip routing for a single call.
+    """
+
+    def __init__(self, fast: LLMClient, strong: LLMClient, accept: Optional[Callable[[str], bool]] = None):
+        self.fast = fast
+        self.strong = strong
+        self.accept = accept or (lambda response: bool(response))
+        self.provider = strong.provider
+        self.escalations = 0
+        self.fast_answers = 0
+
+    @property
+    def model_name(self) -> str:
+        return f"{self.fast.model_name}->{self.strong.model_name}"
+
+    def invalidate_cached(self, prompt: str, *extra: str):
+        self.fast.invalidate_cached(prompt, *extra)
+        self.strong.invalidate_cached(prompt, *extra)
+
+    def call(self, prompt: str, tier: Optional[str] = None, **kwargs) -> str:
+        if tier == TIER_STRONG:
+            return self.strong.call(prompt, **kwargs)
+        try:
+            response = self.fast.call(prompt, **kwargs)
+        except Exception as e:
+            if tier == TIER_FAST:
+                raise
+            logger.warning(f"Fast model failed, escalating: {e}")
+            response = None
+        if tier == TIER_FAST or self._accepted(response):
+            return response
+        self._count_escalation()
+        return self.strong.call(prompt, **kwargs)
+
+    async def call_async(self, prompt: str, tier: Optional[str] = None, **kwargs) -> str:
+        if tier == TIER_STRONG:
+            return await self.strong.call_async(prompt, **kwargs)
+        try:
+            response = await self.fast.call_async(prompt, **kwargs)
+        except Exception as e:
+            if tier == TIER_FAST:
+                raise
+            logger.warning(f"Fast model failed, escalating: {e}")
+            response = None
+        if tier == TIER_FAST or self._accepted(response):
+            return response
+        self._count_escalation()
+        return await self.strong.call_async(prompt, **kwargs)
+
+    def _accepted(self, response: Optional[str]) -> bool:
+        if response is None:
+            return False
+        try:
+            accepted = self.accept(response)
+        except Exception:
+            accepted = False
+        if accepted:
+            self.fast_answers += 1
+        return accepted
+
+    def _count_escalation(self):
+        self.escalations += 1
+        logger.info(
+            f"Escalating to {self.strong.model_name} "
+            f"({self.escalations} escalated / {self.fast_answers} answered by {self.fast.model_name})"
+        )
+
+    def _call(self, prompt: str, **kwargs) -> str:
+        return self.call(prompt, **kwargs)
+
+    async def _call_async(self, prompt: str, **kwargs) -> str:
+        return await self.call_async(prompt, **kwargs)
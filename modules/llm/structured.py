@@ -0,0 +1,201 @@
+import json
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+_CLASSIFICATION_PROPERTIES = {
+    "folder_name": {"type": "string"},
+    "category": {"type": "string"},
+    "confidence": {"type": "number"},
+    "reason": {"type": "string"},
+}
+
+# Structured-output descriptors: a name plus a JSON schema, in the shape OpenAI's
+# json_schema response format expects; other providers adapt them below.
+CLASSIFICATION_SCHEMA: Dict[str, Any] = {
+    "name": "file_classification",
+    "schema": {
+        "type": "object",
+        "properties": _CLASSIFICATION_PROPERTIES,
+        "required": list(_CLASSIFICATION_PROPERTIES),
+        "additionalProperties": False,
+    },
+}
+
+BATCH_CLASSIFICATION_SCHEMA: Dict[str, Any] = {
+    "name": "batch_file_classification",
+    "schema": {
+        "type": "object",
+        "properties": {
+            "results": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {"index": {"type": "integer"}, **_CLASSIFICATION_PROPERTIES},
+                    "required": ["index", *_CLASSIFICATION_PROPERTIES],
+                    "additionalProperties": False,
+                },
+            },
+        },
+        "required": ["results"],
+        "additionalProperties": False,
+    },
+}
+
+
+def strip_unsupported_keys(schema: Any, unsupported: Tuple[str, ...] = ("additionalProperties",)) -> Any:
+    """Copy of a JSON schema without keys a provider's schema dialect rejects (e.g. Gemini)."""
+    if isinstance(schema, dict):
+        return {k: strip_unsupported_keys(v, unsupported) for k, v in schema.items() if k not in unsupported}
+    if isinstance(schema, list):
+        return [strip_unsupported_keys(v, unsupported) for v in schema]
+    return schema
+
+
+_FENCE = re.compile(r"```(?:json)?\s*", re.IGNORECASE)
+_OPENERS = re.compile(r"[{\[]")
+_MAX_START_CANDIDATES = 5
+_MAX_REPAIR_ATTEMPTS = 64
+
+
+class StreamingJSONParser:
+    """Incremental, tolerant JSON parser.
+
+    Chunks are fed as they arrive; ``value()`` returns the best-effort parse of
+    everything seen so far. Prose and Markdown fences around the JSON are
+    ignored, trailing commas are dropped, and a truncated document is closed at
+    the last complete member, so a cut-off reply still yields the fields that
+    were fully written. Unfinished strings are never guessed at.
+    """
+
+    def __init__(self):
+        self._raw: List[str] = []
+        self._out: List[str] = []
+        self._stack: List[str] = []
+        self._started = False
+        self._done = False
+        self._in_string = False
+        self._escape = False
+        # (length of _out, open containers) where the document can be cut and closed
+        self._cuts: List[Tuple[int, Tuple[str, ...]]] = []
+
+    def feed(self, chunk: str) -> "StreamingJSONParser":
+        self._raw.append(chunk)
+        for char in chunk:
+            if self._done:
+                break
+            self._consume(char)
+        return self
+
+    def _consume(self, char: str):
+        if not self._started:
+            if char in "{[":
+                self._started = True
+                self._open(char)
+            return
+
+        out = self._out
+        if self._in_string:
+            out.append(char)
+            if self._escape:
+                self._escape = False
+            elif char == "\\":
+                self._escape = True
+            elif char == '"':
+                self._in_string = False
+            return
+
+        if char == '"':
+            self._in_string = True
+            out.append(char)
+        elif char in "{[":
+            self._open(char)
+        elif char in "}]":
+            self._drop_trailing_comma()
+            if self._stack:
+                self._stack.pop()
+            out.append(char)
+            if not self._stack:
+                self._done = True
+        elif char == ",":
+            self._cuts.append((len(out), tuple(self._stack)))
+            out.append(char)
+        elif char == "`":
+            # Closing Markdown fence of an unterminated document
+            self._done = True
+        else:
+            out.append(char)
+
+    def _open(self, char: str):
+        self._stack.append(char)
+        self._out.append(char)
+        self._cuts.append((len(self._out), tuple(self._stack)))
+
+    def _drop_trailing_comma(self):
+        out = self._out
+        index = len(out) - 1
+        while index >= 0 and out[index].isspace():
+            index -= 1
+        if index >= 0 and out[index] == ",":
+            del out[index:]
+
+    @staticmethod
+    def _close(body: str, stack: Tuple[str, ...]) -> str:
+        body = body.rstrip().rstrip(",").rstrip()
+        if body.endswith(":"):
+            return ""
+        closers = {"{": "}", "[": "]"}
+        return body + "".join(closers[c] for c in reversed(stack))
+
+    def value(self) -> Any:
+        """Best-effort parse of the input so far (None if no JSON value has started)."""
+        if not self._started:
+            return None
+        text = "".join(self._out)
+        if self._done:
+            try:
+                return json.loads(text)
+            except json.JSONDecodeError:
+                pass
+
+        candidates = []
+        if not self._in_string and not self._done:
+            candidates.append((len(text), tuple(self._stack)))
+        candidates.extend(reversed(self._cuts[-_MAX_REPAIR_ATTEMPTS:]))
+        for length, stack in candidates:
+            repaired = self._close(text[:length], stack)
+            if not repaired:
+                continue
+            try:
+                return json.loads(repaired)
+            except json.JSONDecodeError:
+                continue
+        return None
+
+
+def parse_json_lenient(text: str) -> Any:
+    """Parses the first JSON object/array in text, salvaging what it can.
+
+    Raises ValueError if text contains no JSON value at all.
+    """
+    if not text:
+        raise ValueError("Empty response")
+    cleaned = _FENCE.sub("", text).strip()
+    starts = [match.start() for match in _OPENERS.finditer(cleaned)][:_MAX_START_CANDIDATES]
+    if not starts:
+        raise ValueError("No JSON object in response")
+    decoder = json.JSONDecoder()
+    for start in starts:
+        try:
+            return decoder.raw_decode(cleaned, start)[0]
+        except json.JSONDecodeError:
+            pass
+        # Truncated or slightly malformed: keep whatever complete members it has
+        value = StreamingJSONParser().feed(cleaned[start:]).value()
+        if value:
+            return value
+    raise ValueError("Could not recover JSON from response")
+
+
+def dump_structured(data: Optional[Any]) -> str:
+    """Serialises a provider's parsed structured output back to the JSON text callers expect."""
+    return json.dumps(data, ensure_ascii=False)
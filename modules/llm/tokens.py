@@ -0,0 +1,37 @@
+import re
+from typing import Dict, Optional
+
+# Average characters per token by script, per provider tokenizer family.
+# Heuristics measured on mixed Korean/English documents; close enough for budgeting
+# without shipping a tokenizer for every provider.
+CHARS_PER_TOKEN: Dict[str, Dict[str, float]] = {
+    "openai": {"latin": 4.0, "hangul": 1.6, "cjk": 1.2, "punct": 1.5, "other": 1.0},
+    "claude": {"latin": 3.5, "hangul": 1.0, "cjk": 1.0, "punct": 1.2, "other": 1.0},
+    "gemini": {"latin": 4.0, "hangul": 1.8, "cjk": 1.5, "punct": 1.5, "other": 1.0},
+    # Unknown providers: err high so budgets stay safe
+    "default": {"latin": 3.5, "hangul": 1.0, "cjk": 1.0, "punct": 1.0, "other": 1.0},
+}
+
+_HANGUL = re.compile(r"[가-힣ᄀ-ᇿ㄰-㆏]")
+_CJK = re.compile(r"[぀-ヿ㐀-䶿一-鿿豈-﫿]")
+_LATIN = re.compile(r"[A-Za-z0-9\s]")
+_PUNCT = re.compile(r"[!-/:-@\[-`{-~]")
+
+
+def estimate_tokens(text: str, provider: Optional[str] = None) -> int:
+    if not text:
+        return 1
+    ratios = CHARS_PER_TOKEN.get(provider or "default", CHARS_PER_TOKEN["default"])
+    hangul = len(_HANGUL.findall(text))
+    cjk = len(_CJK.findall(text))
+    latin = len(_LATIN.findall(text))
+    punct = len(_PUNCT.findall(text))
+    other = len(text) - hangul - cjk - latin - punct
+    tokens = (
+        latin / ratios["latin"]
+        + hangul / ratios["hangul"]
+        + cjk / ratios["cjk"]
+        + punct / ratios["punct"]
+        + other / ratios["other"]
+    )
+    return max(1, int(tokens + 0.999))
@@ -11,7 +11,7 @@ import shutil
 import logging
 import asyncio
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple, Set
 from datetime import datetime
 from enum import Enum
 
@@ -68,6 +68,8 @@ class FileMover:
         self.duplicate_strategy = duplicate_strategy
         self.undo_manager = undo_manager
         self.move_history: List[Dict] = []
+        # 이 인스턴스가 만든/사용한 대상 폴더 (정규화된 절대 경로, 폴더 감시에서 제외용)
+        self.destination_folders: Set[str] = set()
         
         logger.info(f"FileMover 초기화됨 - base_path: {self.base_path}")
 
@@ -348,6 +350,7 @@ class FileMover:
                 logger.error(f"폴더 쓰기 권한이 없습니다: {destination_path}")
                 return None
             
+            self.destination_folders.add(os.path.normcase(os.path.abspath(destination_path)))
             logger.info(f"대상 폴더 준비됨: {destination_path}")
             return destination_path
         
@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+"""
+DOCX/ODT 문단 읽기 모듈
+
+문서 객체 모델 전체를 만들지 않고, zip 안의 본문 XML(word/document.xml 또는
+content.xml)을 iterparse로 흘려 읽으며 문단 텍스트를 순서대로 꺼냅니다.
+
+- 끝난 문단과 문단 밖의 요소는 바로 비우고 부모에서 떼어내므로, 문서 크기와 관계없이
+  한 번에 메모리에 있는 것은 현재 읽는 최상위 블록(문단/표) 하나입니다.
+- 앞쪽 문단은 목록에, 뒤쪽 문단은 길이 제한이 있는 deque에 모읍니다.
+- 표 안의 문단도 본문 문단으로 읽습니다.
+- 문단 안에 든 문단(텍스트 상자, 도형, 콘텐츠 컨트롤)은 바깥 문단 바로 뒤에 따로 내보냅니다.
+  DOCX의 mc:Fallback(같은 텍스트 상자의 VML 사본)은 중복이므로 읽지 않습니다.
+"""
+
+import zipfile
+import xml.etree.ElementTree as ET
+from collections import deque
+from typing import BinaryIO, Callable, Dict, Iterator, List, NamedTuple, Union
+
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_TEXT = "{urn:oasis:names:tc:opendocument:xmlns:text:1.0}"
+_MC = "{http://schemas.openxmlformats.org/markup-compatibility/2006}"
+
+DOCX_BODY = "word/document.xml"
+ODF_BODY = "content.xml"
+
+
+def _docx_paragraph_text(paragraph: ET.Element) -> str:
+    """w:p 문단의 텍스트 (w:t, 탭, 줄바꿈)"""
+    parts: List[str] = []
+    for node in paragraph.iter():
+        tag = node.tag
+        if tag == _W + "t":
+            parts.append(node.text or "")
+        elif tag == _W + "tab":
+            parts.append("\t")
+        elif tag in (_W + "br", _W + "cr"):
+            parts.append("\n")
+    return "".join(parts)
+
+
+def _odf_paragraph_text(element: ET.Element) -> str:
+    """text:p/text:h 문단의 텍스트 (text:s 공백, 탭, 줄바꿈, span 등 안쪽 요소 포함)"""
+    parts: List[str] = [element.text or ""]
+    for child in element:
+        tag = child.tag
+        if tag == _TEXT + "s":
+            parts.append(" " * int(child.get(_TEXT + "c", "1") or 1))
+        elif tag == _TEXT + "tab":
+            parts.append("\t")
+        elif tag == _TEXT + "line-break":
+            parts.append("\n")
+        elif tag not in (_TEXT + "p", _TEXT + "h", _TEXT + "note"):
+            parts.append(_odf_paragraph_text(child))
+        parts.append(child.tail or "")
+    return "".join(parts)
+
+
+# 본문 XML 경로 -> (문단 태그, 건너뛸 태그, 문단 텍스트 함수)
+_FORMATS: Dict[str, tuple] = {
+    DOCX_BODY: ({_W + "p"}, {_MC + "Fallback"}, _docx_paragraph_text),
+    ODF_BODY: ({_TEXT + "p", _TEXT + "h"}, set(), _odf_paragraph_text),
+}
+
+
+def iter_paragraphs(file_path: Union[str, BinaryIO]) -> Iterator[str]:
+    """
+    DOCX/ODT 파일의 문단 텍스트를 문서 순서대로 돌려줍니다.
+
+    file_path에는 경로 대신 seek 가능한 파일 객체(예: 매핑한 파일)를 넘길 수도 있습니다.
+
+    Raises:
+        zipfile.BadZipFile: zip 형식이 아닌 경우 (예: 예전 .doc 바이너리)
+        ValueError: 본문 XML이 없는 경우
+    """
+    with zipfile.ZipFile(file_path) as archive:
+        names = set(archive.namelist())
+        for body, (paragraph_tags, skip_tags, paragraph_text) in _FORMATS.items():
+            if body in names:
+                with archive.open(body) as stream:
+                    yield from _iter_body(stream, paragraph_tags, skip_tags, paragraph_text)
+                return
+    raise ValueError(f"문서 본문을 찾을 수 없습니다: {file_path}")
+
+
+def _iter_body(stream, paragraph_tags: set, skip_tags: set,
+               paragraph_text: Callable[[ET.Element], str]) -> Iterator[str]:
+    stack: List[ET.Element] = []
+    paragraph_depth = 0
+    skip_depth = 0
+    # 바깥 문단 안에서 끝난 문단의 텍스트 (시작 순서대로 자리를 잡아 둠)
+    nested: List[str] = []
+    slots: List[int] = []
+    for event, element in ET.iterparse(stream, events=("start", "end")):
+        if event == "start":
+            stack.append(element)
+            if element.tag in skip_tags:
+                skip_depth += 1
+            elif element.tag in paragraph_tags and not skip_depth:
+                paragraph_depth += 1
+                if paragraph_depth > 1:
+                    slots.append(len(nested))
+                    nested.append("")
+            continue
+
+        stack.pop()
+        if element.tag in skip_tags:
+            skip_depth -= 1
+            element.clear()
+        elif element.tag in paragraph_tags and not skip_depth:
+            paragraph_depth -= 1
+            text = paragraph_text(element)
+            # 끝난 문단만 비우고, 안쪽 문단의 텍스트는 비우기 전에 모아 둠
+            element.clear()
+            if paragraph_depth:
+                nested[slots.pop()] = text
+            else:
+                yield text
+                yield from nested
+                nested.clear()
+        # 문단 밖의 요소는 끝나는 대로 떼어냄 (문단 안의 요소는 문단 텍스트에 필요)
+        if paragraph_depth == 0 and stack:
+            element.clear()
+            stack[-1].remove(element)
+
+
+class ParagraphSummary(NamedTuple):
+    """앞쪽/뒤쪽 문단과 전체 문단 수"""
+    head: List[str]
+    tail: List[str]
+    total: int
+
+
+def read_paragraphs(file_path: Union[str, BinaryIO], head: int = 50, tail: int = 50) -> ParagraphSummary:
+    """
+    앞쪽 head개와 뒤쪽 tail개 문단을 읽습니다 (중간 문단은 세기만 함).
+
+    전체가 head + tail개 이하이면 head와 tail을 이어 붙인 것이 전체 문단입니다.
+    """
+    head_paragraphs: List[str] = []
+    tail_paragraphs: deque = deque(maxlen=tail)
+    total = 0
+    for text in iter_paragraphs(file_path):
+        total += 1
+        if len(head_paragraphs) < head:
+            head_paragraphs.append(text)
+        elif tail:
+            tail_paragraphs.append(text)
+    return ParagraphSummary(head_paragraphs, list(tail_paragraphs), total)
@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+"""
+지연 PDF 읽기 모듈
+
+파일을 메모리 매핑해 PyPDF2에 넘기고, 필요한 페이지만 읽습니다.
+
+- 페이지 수: 전체 페이지 트리를 펼치는 len(reader.pages) 대신 루트 /Pages의 /Count를 읽습니다.
+- 페이지 찾기: 각 /Pages 노드의 /Count로 필요한 자식만 따라 내려가므로, 페이지 하나를 찾는 데
+  트리 깊이만큼의 객체만 읽습니다.
+- 텍스트: 요청한 페이지의 내용 스트림만 디코딩하고, 글자 수 한도에 도달하면 멈춥니다.
+
+PyPDF2는 xref와 객체를 필요할 때 찾아 읽으므로, 매핑한 파일 중 실제로 접근한 부분만
+메모리에 올라옵니다.
+"""
+
+import logging
+import mmap
+from typing import Any, BinaryIO, Dict, Iterable, List, Optional, Tuple
+
+try:
+    import PyPDF2
+    from PyPDF2 import PageObject
+    from PyPDF2.generic import IndirectObject, NameObject
+except ImportError:
+    PyPDF2 = None
+
+logger = logging.getLogger(__name__)
+
+# 부모 /Pages 노드에서 물려받는 페이지 속성
+INHERITABLE_PAGE_ATTRIBUTES = ("/Resources", "/MediaBox", "/CropBox", "/Rotate")
+
+# 페이지 트리 최대 깊이 (순환 참조 방지)
+MAX_PAGE_TREE_DEPTH = 64
+
+
+class LazyPdfReader:
+    """
+    필요한 페이지만 읽는 PDF 리더 (컨텍스트 매니저)
+
+    사용 예:
+        with LazyPdfReader(path) as pdf:
+            texts = pdf.extract_pages([0, 1], max_chars=1250)
+    """
+
+    def __init__(self, file_path: str, stream: Optional[BinaryIO] = None):
+        """
+        LazyPdfReader 초기화
+
+        Args:
+            file_path (str): PDF 파일 경로
+            stream (Optional[BinaryIO]): 이미 연 파일 객체 (예: 매핑한 파일, 있으면 파일을 다시 열지 않고 닫지도 않음)
+        """
+        self.file_path = file_path
+        self.stream = stream
+        self._file = None
+        self._mmap: Optional[mmap.mmap] = None
+        self.reader = None
+        self._page_count: Optional[int] = None
+
+    def __enter__(self) -> "LazyPdfReader":
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def open(self):
+        """파일을 메모리 매핑해 PdfReader를 만듭니다 (트레일러/xref만 읽음)."""
+        if PyPDF2 is None:
+            raise ImportError("PyPDF2가 설치되지 않았습니다.")
+        if self.stream is not None:
+            self.stream.seek(0)
+            self.reader = PyPDF2.PdfReader(self.stream)
+            return
+        self._file = open(self.file_path, 'rb')
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            self.reader = PyPDF2.PdfReader(self._mmap)
+        except Exception:
+            self.close()
+            raise
+
+    def close(self):
+        """PdfReader와 매핑을 해제합니다."""
+        self.reader = None
+        if self._mmap is not None:
+            try:
+                self._mmap.close()
+            except BufferError:
+                # 아직 참조 중인 버퍼가 있으면 GC에 맡김
+                pass
+            self._mmap = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _root_pages(self):
+        return self.reader.trailer["/Root"].get_object()["/Pages"].get_object()
+
+    @property
+    def page_count(self) -> int:
+        """루트 /Pages의 /Count (잘못된 값이면 페이지 트리를 펼쳐 셈)"""
+        if self._page_count is None:
+            try:
+                count = int(self._root_pages()["/Count"])
+                if count < 0:
+                    raise ValueError(count)
+            except Exception as e:
+                logger.debug(f"/Count를 읽을 수 없어 페이지 트리를 펼칩니다 ({self.file_path}): {e}")
+                count = len(self.reader.pages)
+            self._page_count = count
+        return self._page_count
+
+    def page(self, index: int):
+        """
+        index번째 페이지를 찾습니다 (필요한 페이지 트리 경로만 읽음).
+
+        Raises:
+            IndexError: 페이지가 없는 경우
+        """
+        node = self._root_pages()
+        reference = None
+        inherited: Dict[str, Any] = {}
+        remaining = index
+
+        for _ in range(MAX_PAGE_TREE_DEPTH):
+            if "/Kids" not in node:
+                if remaining != 0:
+                    raise IndexError(f"페이지 {index}가 없습니다")
+                return self._page_object(node, reference, inherited)
+
+            for attr in INHERITABLE_PAGE_ATTRIBUTES:
+                if attr in node:
+                    inherited[attr] = node[attr]
+
+            for kid_reference in node["/Kids"]:
+                kid = kid_reference.get_object()
+                size = int(kid.get("/Count", 0)) if "/Kids" in kid else 1
+                if remaining < size:
+                    node = kid
+                    reference = kid_reference if isinstance(kid_reference, IndirectObject) else None
+                    break
+                remaining -= size
+            else:
+                raise IndexError(f"페이지 {index}가 없습니다")
+
+        raise IndexError(f"페이지 트리가 너무 깊습니다: {self.file_path}")
+
+    def _page_object(self, node, reference, inherited: Dict[str, Any]):
+        page = PageObject(self.reader, reference)
+        page.update(node)
+        for attr, value in inherited.items():
+            if attr not in page:
+                page[NameObject(attr)] = value
+        return page
+
+    def extract_pages(self, indices: Iterable[int], max_chars: Optional[int] = None) -> List[Tuple[int, str]]:
+        """
+        주어진 순서로 페이지 텍스트를 추출하고, max_chars 글자가 모이면 멈춥니다.
+
+        Returns:
+            List[Tuple[int, str]]: (페이지 번호, 텍스트) 목록
+        """
+        pages: List[Tuple[int, str]] = []
+        collected = 0
+        for index in indices:
+            if max_chars is not None and collected >= max_chars:
+                break
+            text = self.page(index).extract_text() or ""
+            pages.append((index, text))
+            collected += len(text)
+        return pages
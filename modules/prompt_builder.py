@@ -0,0 +1,191 @@
+# -*- coding: utf-8 -*-
+"""
+프롬프트 내용 압축 모듈
+
+추출된 내용을 공급자별 토큰 추정치 기준의 예산에 맞춰 줄입니다.
+
+1. 공백 정리: 줄 안의 연속 공백과 연속 빈 줄을 하나로 합칩니다.
+2. 반복 제거: 페이지마다 반복되는 머리글/바닥글, 쪽 번호, 구분선 줄을 뺍니다.
+3. 구간 선택: 예산을 넘으면 첫 단락(제목 부분)을 두고, 새 단어가 많은 단락을
+   토큰당 정보량 순으로 골라 원래 순서대로 이어 붙입니다.
+4. 자르기: 그래도 넘으면 예산에 맞는 길이까지 자릅니다.
+"""
+
+import re
+from collections import Counter
+from typing import List, Optional
+
+from modules.llm.tokens import estimate_tokens
+
+# 생략된 구간 표시
+OMISSION_MARKER = "..."
+
+# 머리글/바닥글로 보고 제거하는 최소 반복 횟수 (똑같은 줄)
+REPEATED_LINE_MIN_COUNT = 2
+# 숫자만 다른 줄을 머리글/바닥글로 보는 최소 반복 횟수와 숫자를 뺀 최소 길이
+NUMBERED_LINE_MIN_COUNT = 3
+NUMBERED_LINE_MIN_LENGTH = 10
+
+_WHITESPACE = re.compile(r"[ \t\f\v 　]+")
+_DIGITS = re.compile(r"\d+")
+_WORD = re.compile(r"[^\W_]{2,}")
+# 쪽 번호 줄 (예: "3", "- 3 -", "Page 3 of 10", "3 / 10", "3쪽")
+_PAGE_NUMBER = re.compile(r"^(?:page\s*)?[-–—\s]*\d+\s*(?:(?:/|of)\s*\d+)?\s*(?:쪽|페이지|p\.?)?[-–—\s]*$", re.IGNORECASE)
+# 구분선 줄 (예: "-----", "=====", "*****")
+_SEPARATOR = re.compile(r"^[\W_]{3,}$")
+
+
+def normalize_whitespace(text: str) -> str:
+    """줄 안의 연속 공백을 하나로, 연속 빈 줄을 한 줄로 합칩니다."""
+    lines = [_WHITESPACE.sub(" ", line).strip() for line in text.replace("\r\n", "\n").replace("\r", "\n").split("\n")]
+    collapsed: List[str] = []
+    for line in lines:
+        if line or (collapsed and collapsed[-1]):
+            collapsed.append(line)
+    while collapsed and not collapsed[-1]:
+        collapsed.pop()
+    return "\n".join(collapsed)
+
+
+def strip_boilerplate(text: str) -> str:
+    """
+    반복되는 머리글/바닥글, 쪽 번호, 구분선 줄을 제거합니다 (반복 줄은 첫 번째만 유지).
+
+    똑같은 줄이 반복되거나, 쪽 번호만 다른 긴 줄이 여러 번 나오면 머리글/바닥글로 봅니다.
+    ('제 1 조', '제 2 조'처럼 숫자만 다른 짧은 줄은 본문으로 유지)
+    """
+    lines = text.split("\n")
+    exact = Counter(line for line in lines if line)
+    numbered = Counter(_DIGITS.sub("0", line) for line in lines if line)
+    seen = set()
+    kept: List[str] = []
+    for line in lines:
+        if not line:
+            kept.append(line)
+            continue
+        if _PAGE_NUMBER.match(line) or _SEPARATOR.match(line):
+            continue
+        key = None
+        if exact[line] >= REPEATED_LINE_MIN_COUNT:
+            key = line
+        else:
+            numbered_key = _DIGITS.sub("0", line)
+            if (numbered[numbered_key] >= NUMBERED_LINE_MIN_COUNT
+                    and len(_DIGITS.sub("", line).strip()) >= NUMBERED_LINE_MIN_LENGTH):
+                key = numbered_key
+        if key is not None:
+            if key in seen:
+                continue
+            seen.add(key)
+        kept.append(line)
+    return normalize_whitespace("\n".join(kept))
+
+
+class PromptBuilder:
+    """
+    토큰 예산 기반 내용 압축기
+
+    provider별 문자/토큰 비율로 토큰 수를 추정하므로, 같은 예산이라도
+    한국어 문서와 영문/코드 문서에 알맞은 분량이 남습니다.
+    """
+
+    def __init__(self, provider: Optional[str] = None, token_budget: int = 600, max_chars: Optional[int] = None):
+        """
+        PromptBuilder 초기화
+
+        Args:
+            provider (Optional[str]): 토큰 추정에 사용할 공급자 (openai, claude, gemini)
+            token_budget (int): 내용에 허용하는 최대 토큰 수
+            max_chars (Optional[int]): 압축 결과의 최대 글자 수
+        """
+        self.provider = provider
+        self.token_budget = token_budget
+        self.max_chars = max_chars
+
+    def count(self, text: str) -> int:
+        """공급자 기준 추정 토큰 수"""
+        return estimate_tokens(text, self.provider) if text else 0
+
+    def compress(self, content: Optional[str], token_budget: Optional[int] = None) -> str:
+        """
+        내용을 토큰 예산 안으로 압축합니다.
+
+        Args:
+            content (Optional[str]): 추출된 내용
+            token_budget (Optional[int]): 이번 호출에만 사용할 예산 (없으면 기본 예산)
+
+        Returns:
+            str: 압축된 내용
+        """
+        if not content:
+            return ""
+        budget = self.token_budget if token_budget is None else token_budget
+        if budget <= 0:
+            return ""
+
+        text = strip_boilerplate(normalize_whitespace(content))
+        if self.count(text) > budget:
+            text = self._select_sections(text, budget)
+        text = self._truncate(text, budget)
+        if self.max_chars:
+            text = text[:self.max_chars]
+        return text
+
+    def _select_sections(self, text: str, budget: int) -> str:
+        """첫 단락을 두고, 토큰당 새 단어가 많은 단락부터 예산까지 고릅니다."""
+        blocks = [block for block in text.split("\n\n") if block.strip()]
+        if len(blocks) < 2:
+            return text
+
+        costs = [self.count(block) for block in blocks]
+        chosen = {0}
+        used = costs[0]
+        seen_words = set(_WORD.findall(blocks[0].lower()))
+
+        remaining = set(range(1, len(blocks)))
+        while remaining:
+            best, best_score = None, 0.0
+            for index in remaining:
+                if used + costs[index] > budget:
+                    continue
+                words = set(_WORD.findall(blocks[index].lower()))
+                new_words = len(words - seen_words)
+                score = new_words / costs[index] + 1e-6 / (1 + index)
+                if new_words and score > best_score:
+                    best, best_score = index, score
+            if best is None:
+                break
+            chosen.add(best)
+            remaining.discard(best)
+            used += costs[best]
+            seen_words |= set(_WORD.findall(blocks[best].lower()))
+
+        parts: List[str] = []
+        previous = -1
+        for index in sorted(chosen):
+            if previous >= 0 and index != previous + 1:
+                parts.append(OMISSION_MARKER)
+            parts.append(blocks[index])
+            previous = index
+        if previous != len(blocks) - 1:
+            parts.append(OMISSION_MARKER)
+        return "\n\n".join(parts)
+
+    def _truncate(self, text: str, budget: int) -> str:
+        """예산을 넘으면 예산에 맞는 가장 긴 앞부분만 남깁니다."""
+        if self.count(text) <= budget:
+            return text
+        budget -= self.count(OMISSION_MARKER)
+        low, high = 0, len(text)
+        while low < high:
+            middle = (low + high + 1) // 2
+            if self.count(text[:middle]) <= budget:
+                low = middle
+            else:
+                high = middle - 1
+        cut = text[:low]
+        # 단어 중간에서 자르지 않도록 마지막 공백까지
+        boundary = max(cut.rfind(" "), cut.rfind("\n"))
+        if boundary > len(cut) * 0.8:
+            cut = cut[:boundary]
+        return cut.rstrip() + OMISSION_MARKER if cut else ""
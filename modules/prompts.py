@@ -5,6 +5,8 @@
 LLM에 전송할 프롬프트를 관리합니다.
 """
 
+import re
+
 CLASSIFICATION_PROMPT = """파일을 분석하여 적절한 폴더명을 추천해주세요.
 정보: {filename}, {file_type}
 내용:
@@ -13,7 +15,7 @@ CLASSIFICATION_PROMPT = """파일을 분석하여 적절한 폴더명을 추천
 규칙:
 1. 한글로 된 의미있는 이름 (예: 청구서, 회의록)
 2. 짧고 간결하게
-3. 내용 기반 분류
+3. 내용 기반 분류{existing_folders}
 
 JSON 응답:
 {{
@@ -29,7 +31,7 @@ VISION_PROMPT = """이미지를 분석하여 폴더명을 추천해주세요.
 규칙:
 1. 한글로 된 의미있는 이름
 2. 짧고 간결하게
-3. 내용 기반
+3. 내용 기반{existing_folders}
 
 JSON 응답:
 {{
@@ -38,3 +40,50 @@ JSON 응답:
     "confidence": 0.85,
     "reason": "이유"
 }}"""
+
+
+BATCH_CLASSIFICATION_PROMPT = """여러 파일을 분석하여 각 파일에 적절한 폴더명을 추천해주세요.
+
+{files}
+
+규칙:
+1. 한글로 된 의미있는 이름 (예: 청구서, 회의록)
+2. 짧고 간결하게
+3. 내용 기반 분류
+4. 모든 파일({count}개)에 대해 index 순서대로 응답{existing_folders}
+
+JSON 응답:
+{{
+    "results": [
+        {{
+            "index": 0,
+            "folder_name": "추천폴더명",
+            "category": "문서|이미지|비디오|음악|기타",
+            "confidence": 0.85,
+            "reason": "이유"
+        }}
+    ]
+}}"""
+
+BATCH_FILE_ENTRY = """[{index}] 정보: {filename}, {file_type}
+내용:
+{content}
+"""
+
+# 기존 폴더 목록 (규칙 목록 끝에 붙음, 기존 폴더가 없으면 생략)
+EXISTING_FOLDERS_HINT = """
+- 알맞은 기존 폴더가 있으면 새로 만들지 말고 그 이름을 그대로 사용: {folders}"""
+
+# 기존 폴더 목록 줄 (응답 캐시 키에서 제외)
+_EXISTING_FOLDERS_LINE = re.compile(re.escape(EXISTING_FOLDERS_HINT.split("{folders}")[0]) + r"[^\n]*")
+
+
+def strip_existing_folders_hint(prompt: str) -> str:
+    """
+    프롬프트에서 기존 폴더 목록 줄을 뺀 문자열 (응답 캐시 키용)
+
+    기존 폴더 목록은 폴더가 생기거나 사용 빈도가 바뀔 때마다 달라지므로, 캐시 키에 넣으면
+    같은 파일 내용의 프롬프트도 캐시에 맞지 않습니다. 응답의 폴더명은 분류기가 다시
+    기존 폴더명으로 맞추므로 목록 없이 캐시해도 됩니다.
+    """
+    return _EXISTING_FOLDERS_LINE.sub("", prompt)
@@ -0,0 +1,404 @@
+# -*- coding: utf-8 -*-
+"""
+규칙 엔진 모듈
+
+키워드, 확장자, glob, 정규식, 파일 크기 규칙을 한 번에 컴파일하여
+규칙 수가 늘어나도 파일 하나를 검사하는 비용이 거의 일정하도록 합니다.
+
+- 키워드와 glob의 고정 문자열은 Aho-Corasick 오토마톤으로 한 번에 찾습니다.
+- 확장자 규칙은 해시 조회로 찾습니다.
+- 후보 규칙 중 나머지 조건을 모두 만족하는 규칙 가운데 우선순위가 가장 높은 규칙을 사용합니다.
+
+사용자 규칙 파일(JSON) 예:
+    {"rules": [
+        {"folder": "세금계산서", "keyword": "세금계산서", "priority": 200},
+        {"folder": "대용량 영상", "extension": ["mp4", "mov"], "min_size": 1073741824},
+        {"folder": "스캔", "glob": "scan_*.pdf"},
+        {"folder": "주문서", "regex": "^po-\\\\d{6}"}
+    ]}
+"""
+
+import fnmatch
+import json
+import logging
+import os
+import re
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from modules.file_rules import EXTENSION_RULES, FILE_TYPE_MAPPING, KEYWORD_RULES
+
+logger = logging.getLogger(__name__)
+
+# 기본 규칙 우선순위 (사용자 규칙의 기본값은 USER_RULE_PRIORITY)
+KEYWORD_RULE_PRIORITY = 100
+EXTENSION_RULE_PRIORITY = 10
+USER_RULE_PRIORITY = 150
+# 처리 이력에서 자동 승격된 규칙 (기본 키워드 규칙보다 낮고 확장자 규칙보다 높음)
+PROMOTED_RULE_PRIORITY = 50
+
+# glob에서 오토마톤 색인에 사용할 고정 문자열의 최소 길이
+MIN_GLOB_LITERAL = 3
+
+
+class Rule:
+    """
+    분류 규칙 하나
+
+    지정된 모든 조건(keyword, extensions, glob, regex, min_size, max_size)을 만족해야 일치합니다.
+    """
+
+    __slots__ = (
+        "folder_name", "category", "priority", "confidence", "reason", "order",
+        "keyword", "extensions", "glob", "glob_regex", "regex", "min_size", "max_size",
+    )
+
+    def __init__(
+        self,
+        folder_name: str,
+        keyword: Optional[str] = None,
+        extensions: Optional[Iterable[str]] = None,
+        glob: Optional[str] = None,
+        regex: Optional[str] = None,
+        min_size: Optional[int] = None,
+        max_size: Optional[int] = None,
+        category: Optional[str] = None,
+        priority: int = USER_RULE_PRIORITY,
+        confidence: float = 1.0,
+        reason: Optional[str] = None,
+        order: int = 0,
+    ):
+        if not folder_name:
+            raise ValueError("규칙에 folder가 없습니다")
+        self.folder_name = folder_name
+        self.keyword = keyword.lower() if keyword else None
+        self.extensions = frozenset(e.lower().lstrip(".") for e in extensions) if extensions else None
+        self.glob = glob.lower() if glob else None
+        self.glob_regex = re.compile(fnmatch.translate(self.glob)) if self.glob else None
+        self.regex = re.compile(regex, re.IGNORECASE) if regex else None
+        self.min_size = min_size
+        self.max_size = max_size
+        if not (self.keyword or self.extensions or self.glob or self.regex
+                or min_size is not None or max_size is not None):
+            raise ValueError(f"조건이 없는 규칙입니다: {folder_name}")
+        self.category = category
+        self.priority = priority
+        self.confidence = confidence
+        self.reason = reason or self._default_reason()
+        self.order = order
+
+    @property
+    def needs_size(self) -> bool:
+        return self.min_size is not None or self.max_size is not None
+
+    def _default_reason(self) -> str:
+        if self.keyword:
+            return f"파일명 키워드 매칭 ('{self.keyword}')"
+        if self.glob:
+            return f"파일명 패턴 매칭 ('{self.glob}')"
+        if self.regex:
+            return f"파일명 정규식 매칭 ('{self.regex.pattern}')"
+        if self.extensions:
+            return "확장자 기반 규칙 ('{file_type}')"
+        return "파일 크기 규칙"
+
+    def matches(self, filename_lower: str, file_type_lower: str, file_size: Optional[int]) -> bool:
+        """키워드 이외의 조건을 검사합니다 (키워드는 오토마톤에서 이미 확인)."""
+        if self.extensions and file_type_lower not in self.extensions:
+            return False
+        if self.glob_regex and not self.glob_regex.match(filename_lower):
+            return False
+        if self.regex and not self.regex.search(filename_lower):
+            return False
+        if self.needs_size:
+            if file_size is None:
+                return False
+            if self.min_size is not None and file_size < self.min_size:
+                return False
+            if self.max_size is not None and file_size > self.max_size:
+                return False
+        return True
+
+
+class AhoCorasick:
+    """여러 문자열을 한 번의 순회로 찾는 Aho-Corasick 오토마톤"""
+
+    def __init__(self, patterns: Iterable[str]):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[str]] = [[]]
+
+        for pattern in patterns:
+            if pattern:
+                self._insert(pattern)
+        self._build_failure_links()
+
+    def _insert(self, pattern: str):
+        state = 0
+        for char in pattern:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+            state = next_state
+        if pattern not in self._output[state]:
+            self._output[state].append(pattern)
+
+    def _build_failure_links(self):
+        pending = deque(self._goto[0].values())
+        while pending:
+            state = pending.popleft()
+            for char, next_state in self._goto[state].items():
+                pending.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                candidate = self._goto[fallback].get(char, 0)
+                self._fail[next_state] = candidate if candidate != next_state else 0
+                self._output[next_state].extend(self._output[self._fail[next_state]])
+
+    def find(self, text: str) -> set:
+        """text에 포함된 모든 패턴을 반환합니다."""
+        found = set()
+        state = 0
+        goto, fail, output = self._goto, self._fail, self._output
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if output[state]:
+                found.update(output[state])
+        return found
+
+
+class _CompiledRules:
+    """컴파일된 규칙 집합 (교체 단위로 사용하며 생성 후 변경하지 않습니다)"""
+
+    def __init__(self, rules: List[Rule]):
+        self.rules = rules
+        self.by_literal: Dict[str, List[Rule]] = {}
+        self.by_extension: Dict[str, List[Rule]] = {}
+        self.always: List[Rule] = []
+        self.has_size_rules = any(rule.needs_size for rule in rules)
+
+        for rule in rules:
+            literal = rule.keyword or self._glob_literal(rule.glob)
+            if literal:
+                self.by_literal.setdefault(literal, []).append(rule)
+            elif rule.extensions:
+                for extension in rule.extensions:
+                    self.by_extension.setdefault(extension, []).append(rule)
+            else:
+                self.always.append(rule)
+
+        self.automaton = AhoCorasick(self.by_literal)
+
+    @staticmethod
+    def _glob_literal(pattern: Optional[str]) -> Optional[str]:
+        """glob에서 반드시 포함되어야 하는 가장 긴 고정 문자열"""
+        if not pattern:
+            return None
+        # [...] 문자 클래스는 그중 한 글자만 맞으면 되므로 고정 문자열에서 제외
+        without_classes = re.sub(r"\[!?\]?[^\]]*\]", "*", pattern)
+        literals = re.split(r"[*?\[\]]", without_classes)
+        longest = max(literals, key=len)
+        return longest if len(longest) >= MIN_GLOB_LITERAL else None
+
+    def candidates(self, filename_lower: str, file_type_lower: str) -> Iterable[Rule]:
+        for literal in self.automaton.find(filename_lower):
+            yield from self.by_literal[literal]
+        yield from self.by_extension.get(file_type_lower, ())
+        yield from self.always
+
+
+class RuleEngine:
+    """
+    컴파일된 분류 규칙 엔진
+
+    기본 규칙(file_rules.KEYWORD_RULES, EXTENSION_RULES), 처리 이력에서 승격된 규칙,
+    사용자 규칙 파일을 합쳐 컴파일하고,
+    사용자 규칙 파일이 바뀌면 다음 검사 때 다시 컴파일합니다.
+    """
+
+    def __init__(self, user_rules_path: Optional[str] = None, reload_interval: float = 2.0,
+                 default_category: str = "기타"):
+        """
+        RuleEngine 초기화
+
+        Args:
+            user_rules_path (Optional[str]): 사용자 규칙 JSON 파일 경로
+            reload_interval (float): 파일 변경 여부를 확인하는 최소 간격 (초)
+            default_category (str): 확장자 매핑이 없을 때의 카테고리
+        """
+        self.user_rules_path = str(user_rules_path) if user_rules_path else None
+        self.reload_interval = reload_interval
+        self.default_category = default_category
+
+        self._lock = threading.Lock()
+        self._user_mtime: Optional[int] = None
+        self._next_check = 0.0
+        self._extra_rules: List[Rule] = []
+        self._promoted_rules: List[Rule] = []
+        self._compiled = _CompiledRules(self._build_rules([]))
+        self.reload(force=True)
+
+    @property
+    def rule_count(self) -> int:
+        return len(self._compiled.rules)
+
+    @property
+    def has_size_rules(self) -> bool:
+        return self._compiled.has_size_rules
+
+    def default_rules(self) -> List[Rule]:
+        """file_rules 모듈의 정적 규칙 (키워드는 정의 순서대로 우선)"""
+        rules = [
+            Rule(folder, keyword=keyword, priority=KEYWORD_RULE_PRIORITY, confidence=1.0)
+            for keyword, folder in KEYWORD_RULES.items()
+        ]
+        rules.extend(
+            Rule(folder, extensions=[extension], priority=EXTENSION_RULE_PRIORITY, confidence=0.95)
+            for extension, folder in EXTENSION_RULES.items()
+        )
+        return rules
+
+    def add_rules(self, rules: Iterable[Rule]) -> None:
+        """코드에서 규칙을 추가합니다 (다시 컴파일)."""
+        with self._lock:
+            self._extra_rules.extend(rules)
+            self._compiled = _CompiledRules(self._build_rules(self._load_user_rules()))
+
+    def set_promoted_rules(self, rules: Iterable[Rule]) -> None:
+        """처리 이력에서 승격된 규칙 목록을 교체합니다 (다시 컴파일)."""
+        with self._lock:
+            self._promoted_rules = list(rules)
+            try:
+                user_rules = self._load_user_rules()
+            except Exception as e:
+                logger.error(f"사용자 규칙 로드 실패, 사용자 규칙 없이 컴파일: {e}")
+                user_rules = []
+            self._compiled = _CompiledRules(self._build_rules(user_rules))
+        logger.info(f"승격 규칙 적용: {len(self._promoted_rules)}개")
+
+    def _build_rules(self, user_rules: List[Rule]) -> List[Rule]:
+        rules = self.default_rules() + list(self._extra_rules) + list(self._promoted_rules) + user_rules
+        for order, rule in enumerate(rules):
+            rule.order = order
+        return rules
+
+    def reload(self, force: bool = False) -> bool:
+        """
+        사용자 규칙 파일이 바뀌었으면 다시 컴파일합니다.
+
+        Returns:
+            bool: 다시 컴파일했으면 True
+        """
+        now = time.monotonic()
+        if not force and now < self._next_check:
+            return False
+        self._next_check = now + self.reload_interval
+
+        mtime = self._user_rules_mtime()
+        if not force and mtime == self._user_mtime:
+            return False
+
+        with self._lock:
+            self._user_mtime = mtime
+            try:
+                compiled = _CompiledRules(self._build_rules(self._load_user_rules()))
+            except Exception as e:
+                logger.error(f"사용자 규칙 컴파일 실패, 기존 규칙 유지: {e}")
+                return False
+            self._compiled = compiled
+        logger.info(f"분류 규칙 컴파일 완료: {self.rule_count}개")
+        return True
+
+    def _user_rules_mtime(self) -> Optional[int]:
+        if not self.user_rules_path:
+            return None
+        try:
+            return os.stat(self.user_rules_path).st_mtime_ns
+        except OSError:
+            return None
+
+    def _load_user_rules(self) -> List[Rule]:
+        if not self.user_rules_path or not os.path.exists(self.user_rules_path):
+            return []
+        with open(self.user_rules_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        entries = data.get("rules", []) if isinstance(data, dict) else data
+
+        rules = []
+        for entry in entries:
+            try:
+                rules.append(self._rule_from_dict(entry))
+            except (ValueError, TypeError, re.error) as e:
+                logger.warning(f"잘못된 사용자 규칙 무시 ({entry}): {e}")
+        return rules
+
+    @staticmethod
+    def _rule_from_dict(entry: Dict[str, Any]) -> Rule:
+        extensions = entry.get("extension") or entry.get("extensions")
+        if isinstance(extensions, str):
+            extensions = [extensions]
+        return Rule(
+            entry.get("folder") or entry.get("folder_name"),
+            keyword=entry.get("keyword"),
+            extensions=extensions,
+            glob=entry.get("glob"),
+            regex=entry.get("regex"),
+            min_size=entry.get("min_size"),
+            max_size=entry.get("max_size"),
+            category=entry.get("category"),
+            priority=int(entry.get("priority", USER_RULE_PRIORITY)),
+            confidence=float(entry.get("confidence", 1.0)),
+            reason=entry.get("reason"),
+        )
+
+    def match(
+        self, filename: str, file_type: str, file_path: Optional[str] = None, file_size: Optional[int] = None
+    ) -> Optional[Tuple[Rule, Dict[str, Any]]]:
+        """
+        파일에 일치하는 규칙 중 우선순위가 가장 높은 규칙을 찾습니다.
+
+        Args:
+            filename (str): 파일명
+            file_type (str): 확장자
+            file_path (Optional[str]): 크기 규칙이 있을 때 크기를 구할 파일 경로
+            file_size (Optional[int]): 이미 알고 있는 파일 크기
+
+        Returns:
+            Optional[Tuple[Rule, Dict[str, Any]]]: (규칙, 분류 결과 필드) 또는 None
+        """
+        self.reload()
+        compiled = self._compiled
+        filename_lower = filename.lower()
+        file_type_lower = file_type.lower()
+
+        if file_size is None and file_path and compiled.has_size_rules:
+            try:
+                file_size = os.stat(file_path).st_size
+            except OSError:
+                file_size = None
+
+        best: Optional[Rule] = None
+        for rule in compiled.candidates(filename_lower, file_type_lower):
+            if best is not None and (rule.priority, -rule.order) <= (best.priority, -best.order):
+                continue
+            if rule.matches(filename_lower, file_type_lower, file_size):
+                best = rule
+
+        if best is None:
+            return None
+        return best, {
+            "folder_name": best.folder_name,
+            "category": best.category or FILE_TYPE_MAPPING.get(file_type_lower, self.default_category),
+            "confidence": best.confidence,
+            "reason": best.reason.replace("{file_type}", file_type),
+        }
@@ -0,0 +1,206 @@
+# -*- coding: utf-8 -*-
+"""
+규칙 자동 승격 모듈
+
+처리 이력에서 LLM이 반복해서 같은 폴더로 보낸 파일명 토큰(확장자별)을 찾아
+결정적 규칙으로 승격합니다. 승격된 규칙은 이력 DB의 promoted_rules 테이블에 기록되어
+목록 조회(감사)와 취소가 가능하며, 규칙 엔진이 LLM 호출 전에 적용합니다.
+
+예: '세금계산서_*.pdf' 파일 50개가 모두 '세금계산서' 폴더로 분류되었다면
+    ('세금계산서', pdf) -> 세금계산서 규칙이 만들어집니다.
+"""
+
+import logging
+import re
+import threading
+from collections import Counter, defaultdict
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from modules.rule_engine import PROMOTED_RULE_PRIORITY, Rule
+
+logger = logging.getLogger(__name__)
+
+# 토큰으로 인정하는 최소 글자 수
+MIN_TOKEN_LENGTH = 2
+
+# 토큰 구분자: 공백/기호/밑줄/숫자 (날짜, 일련번호는 토큰에서 제외)
+_TOKEN_SPLIT = re.compile(r"[\W_\d]+")
+
+
+def tokenize(filename: str) -> Tuple[Set[str], str]:
+    """
+    파일명을 (토큰 집합, 확장자)로 나눕니다.
+
+    Returns:
+        Tuple[Set[str], str]: 소문자 토큰 집합과 점 없는 소문자 확장자
+    """
+    path = Path(filename)
+    tokens = {token for token in _TOKEN_SPLIT.split(path.stem.lower()) if len(token) >= MIN_TOKEN_LENGTH}
+    return tokens, path.suffix.lower().lstrip(".")
+
+
+def token_regex(token: str) -> str:
+    """토큰이 다른 글자에 붙어 있지 않을 때만 일치하는 정규식 ('catalog'가 'log'에 걸리지 않도록)"""
+    return rf"(?<![^\W\d_]){re.escape(token)}(?![^\W\d_])"
+
+
+def to_rule(entry: Dict[str, Any]) -> Rule:
+    """promoted_rules 행을 규칙 엔진의 Rule로 변환합니다."""
+    keyword, extension = entry["keyword"], entry["extension"]
+    return Rule(
+        entry["folder_name"],
+        keyword=keyword,
+        extensions=[extension] if extension else None,
+        regex=token_regex(keyword),
+        category=entry.get("category") or None,
+        priority=PROMOTED_RULE_PRIORITY,
+        confidence=round(float(entry.get("consistency") or 1.0), 3),
+        reason=f"학습된 규칙 #{entry.get('id')} ('{keyword}' .{extension}, {entry.get('support')}건)",
+    )
+
+
+class RuleMiner:
+    """
+    처리 이력 기반 규칙 채굴기
+
+    (토큰, 확장자)가 min_support개 이상의 이력에 나타나고, 그중 min_consistency 이상이
+    같은 폴더로 분류되었을 때 규칙 후보가 됩니다. 이미 승격되었거나 취소된 후보는
+    다시 승격하지 않으므로, 취소한 규칙이 다음 채굴에서 되살아나지 않습니다.
+    """
+
+    def __init__(
+        self,
+        history_db,
+        min_support: int = 20,
+        min_consistency: float = 0.95,
+        max_rows: int = 50000,
+        exclude_reason_prefix: Optional[str] = None,
+    ):
+        """
+        RuleMiner 초기화
+
+        Args:
+            history_db (ProcessingHistory): 처리 이력 DB
+            min_support (int): 후보가 되기 위한 최소 이력 수
+            min_consistency (float): 가장 많은 폴더가 차지해야 하는 최소 비율
+            max_rows (int): 채굴에 사용하는 최대 이력 수 (최신순)
+            exclude_reason_prefix (Optional[str]): 이 문자열로 시작하는 사유의 이력은 제외 (폴백 결과 등)
+        """
+        self.history_db = history_db
+        self.min_support = min_support
+        self.min_consistency = min_consistency
+        self.max_rows = max_rows
+        self.exclude_reason_prefix = exclude_reason_prefix
+
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def mine(self, rows: Optional[Iterable[Tuple[str, Optional[str], str, str]]] = None) -> List[Dict[str, Any]]:
+        """
+        이력에서 규칙 후보를 찾습니다.
+
+        Args:
+            rows: (파일명, 내용 발췌, 폴더명, 카테고리) 이력 (없으면 이력 DB에서 조회)
+
+        Returns:
+            List[Dict[str, Any]]: keyword, extension, folder_name, category, support, consistency
+        """
+        if rows is None:
+            rows = self.history_db.iter_training_rows(self.max_rows, self.exclude_reason_prefix)
+
+        # (토큰, 확장자) -> 이력 번호 집합, (토큰, 확장자) -> (폴더, 카테고리) 빈도
+        occurrences: Dict[Tuple[str, str], Set[int]] = defaultdict(set)
+        labels: Dict[Tuple[str, str], Counter] = defaultdict(Counter)
+        for row_id, (filename, _, folder_name, category) in enumerate(rows):
+            tokens, extension = tokenize(filename)
+            if not extension:
+                continue
+            for token in tokens:
+                occurrences[(token, extension)].add(row_id)
+                labels[(token, extension)][(folder_name, category or "")] += 1
+
+        candidates = []
+        for key, row_ids in occurrences.items():
+            support = len(row_ids)
+            if support < self.min_support:
+                continue
+            (folder_name, category), count = labels[key].most_common(1)[0]
+            consistency = count / support
+            if consistency < self.min_consistency:
+                continue
+            candidates.append((key, row_ids, folder_name, category, support, consistency))
+
+        # 같은 파일들을 이미 덮는 더 강한(지지도, 일치율, 토큰 길이 순) 후보가 있으면 중복 규칙을 만들지 않음
+        candidates.sort(key=lambda c: (-c[4], -c[5], -len(c[0][0]), c[0]))
+        covered: Dict[Tuple[str, str], Set[int]] = defaultdict(set)
+        mined = []
+        for (token, extension), row_ids, folder_name, category, support, consistency in candidates:
+            target = (extension, folder_name)
+            if row_ids <= covered[target]:
+                continue
+            covered[target] |= row_ids
+            mined.append({
+                "keyword": token,
+                "extension": extension,
+                "folder_name": folder_name,
+                "category": category,
+                "support": support,
+                "consistency": round(consistency, 4),
+            })
+        return mined
+
+    def promote(self) -> List[Dict[str, Any]]:
+        """
+        후보를 찾아 promoted_rules 테이블에 기록합니다.
+
+        Returns:
+            List[Dict[str, Any]]: 새로 승격된 규칙
+        """
+        added = self.history_db.add_promoted_rules(self.mine())
+        for entry in added:
+            logger.info(
+                f"규칙 승격: '{entry['keyword']}' .{entry['extension']} -> {entry['folder_name']} "
+                f"({entry['support']}건, 일치율 {entry['consistency']:.0%})"
+            )
+        return added
+
+    def active_rules(self) -> List[Rule]:
+        """취소되지 않은 승격 규칙을 Rule로 반환합니다."""
+        rules = []
+        for entry in self.history_db.get_promoted_rules():
+            try:
+                rules.append(to_rule(entry))
+            except (ValueError, re.error) as e:
+                logger.warning(f"잘못된 승격 규칙 무시 (#{entry.get('id')}): {e}")
+        return rules
+
+    def start(self, interval: float, on_update: Callable[[List[Rule]], None]) -> threading.Thread:
+        """
+        백그라운드 스레드에서 주기적으로 채굴합니다.
+
+        시작 직후 기존 승격 규칙을 on_update로 전달하고, 이후 새 규칙이 승격될 때마다 다시 전달합니다.
+        """
+        def run():
+            first = True
+            while not self._stop.is_set():
+                try:
+                    if self.promote() or first:
+                        on_update(self.active_rules())
+                    first = False
+                except Exception as e:
+                    logger.error(f"규칙 채굴 실패: {e}")
+                if self._stop.wait(interval):
+                    break
+
+        self._stop.clear()
+        self._thread = threading.Thread(target=run, name="RuleMiner", daemon=True)
+        self._thread.start()
+        return self._thread
+
+    def stop(self, timeout: Optional[float] = 1.0) -> None:
+        """백그라운드 채굴을 멈춥니다."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
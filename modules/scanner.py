@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+"""
+디렉토리 스캔 모듈
+
+os.scandir 기반 제너레이터로 폴더를 순회하며 파일 경로와 stat 시그니처를 생성합니다.
+전체 목록을 메모리에 만들지 않으므로 대용량 폴더에서도 메모리 사용량이 일정합니다.
+"""
+
+import os
+import logging
+from itertools import islice
+from typing import Iterator, List, Tuple
+
+logger = logging.getLogger(__name__)
+
+# (경로, (st_size, st_mtime_ns, st_ino))
+ScanEntry = Tuple[str, Tuple[int, int, int]]
+
+
+def iter_files(root: str, recursive: bool = False, skip_hidden: bool = True) -> Iterator[ScanEntry]:
+    """
+    폴더 내 파일을 순회합니다.
+
+    DirEntry가 이미 가진 타입/stat 정보를 재사용하여 항목당 추가 stat 호출을 줄입니다.
+
+    Args:
+        root (str): 스캔할 폴더 경로
+        recursive (bool): 하위 폴더까지 순회할지 여부
+        skip_hidden (bool): '.'으로 시작하는 파일/폴더 제외 여부
+
+    Yields:
+        ScanEntry: (파일 경로, stat 시그니처)
+    """
+    stack = [root]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    if skip_hidden and entry.name.startswith('.'):
+                        continue
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if recursive:
+                                stack.append(entry.path)
+                        elif entry.is_file():
+                            st = entry.stat()
+                            # Windows의 DirEntry.stat()은 st_ino가 0이므로 inode()를 사용
+                            yield entry.path, (st.st_size, st.st_mtime_ns, entry.inode())
+                    except OSError as e:
+                        logger.debug(f"항목 확인 실패 ({entry.path}): {e}")
+        except OSError as e:
+            logger.warning(f"폴더 스캔 실패 ({current}): {e}")
+
+
+def next_chunk(scanner: Iterator[ScanEntry], size: int) -> List[ScanEntry]:
+    """
+    스캐너에서 최대 size개의 항목을 가져옵니다.
+
+    Args:
+        scanner (Iterator[ScanEntry]): iter_files 제너레이터
+        size (int): 가져올 최대 개수
+
+    Returns:
+        List[ScanEntry]: 항목 목록 (스캔이 끝나면 빈 목록)
+    """
+    return list(islice(scanner, size))
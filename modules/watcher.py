@@ -5,14 +5,211 @@
 폴더의 변화를 감시하고 새로운 파일이 추가되면 자동으로 분류합니다.
 """
 
+import os
+import re
+import time
+import fnmatch
 import logging
+import threading
 from pathlib import Path
-from typing import Callable, Optional, List
+from typing import Callable, Optional, List, Dict, Tuple, Set, Iterable
 from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler, FileCreatedEvent
 
+import config.config as cfg
+
 logger = logging.getLogger(__name__)
 
+# 다운로드/저장 중인 임시 파일 확장자 (최종 이름으로 바뀔 때까지 처리하지 않음)
+TEMP_FILE_SUFFIXES = (
+    '.crdownload', '.part', '.partial', '.download', '.opdownload', '.tmp', '.!ut'
+)
+
+
+def is_temp_file(file_path: str) -> bool:
+    """
+    다운로드 중이거나 편집기가 만든 임시 파일인지 확인합니다.
+
+    Args:
+        file_path (str): 파일 경로
+
+    Returns:
+        bool: 임시 파일이면 True
+    """
+    name = os.path.basename(file_path).lower()
+    return name.endswith(TEMP_FILE_SUFFIXES) or name.startswith(('~$', '.~lock'))
+
+
+class PathFilter:
+    """
+    감시 제외 경로 필터
+
+    프로그램이 만든 대상 폴더(라이브 집합)와 glob 패턴에 해당하는 경로를 걸러냅니다.
+    경로의 상위 폴더만 집합에서 확인하므로 폴더 수가 많아도 비용은 경로 깊이에 비례합니다.
+    """
+
+    def __init__(
+        self,
+        watch_path: Optional[str] = None,
+        ignored_dirs: Optional[Set[str]] = None,
+        ignore_patterns: Optional[Iterable[str]] = None
+    ):
+        """
+        PathFilter 초기화
+
+        Args:
+            watch_path (Optional[str]): 감시 루트 (상위 폴더 확인은 여기서 멈춤)
+            ignored_dirs (Optional[Set[str]]): 제외할 폴더의 정규화된 절대 경로 집합 (외부에서 계속 갱신 가능)
+            ignore_patterns (Optional[Iterable[str]]): 제외할 파일/폴더 이름 glob 패턴
+        """
+        self.watch_root = os.path.normcase(os.path.abspath(watch_path)) if watch_path else None
+        self.ignored_dirs = ignored_dirs if ignored_dirs is not None else set()
+
+        patterns = list(ignore_patterns or [])
+        # 모든 패턴을 하나의 정규식으로 합쳐 이름당 한 번만 매칭
+        self._pattern = re.compile(
+            "|".join(fnmatch.translate(os.path.normcase(p)) for p in patterns)
+        ) if patterns else None
+
+    def is_ignored(self, file_path: str) -> bool:
+        """
+        경로가 제외 대상인지 확인합니다.
+
+        Args:
+            file_path (str): 확인할 경로
+
+        Returns:
+            bool: 제외 대상이면 True
+        """
+        path = os.path.normcase(os.path.abspath(file_path))
+        if self._pattern and self._pattern.match(os.path.basename(path)):
+            return True
+
+        parent = os.path.dirname(path)
+        while parent and parent != self.watch_root:
+            if parent in self.ignored_dirs:
+                return True
+            if self._pattern and self._pattern.match(os.path.basename(parent)):
+                return True
+            next_parent = os.path.dirname(parent)
+            if next_parent == parent:
+                break
+            parent = next_parent
+        return False
+
+
+class EventDebouncer:
+    """
+    파일 이벤트 디바운서
+
+    같은 경로의 이벤트를 하나로 합치고, 파일 크기와 수정 시각이
+    debounce_time 동안 변하지 않은 뒤에만 콜백을 한 번 실행합니다.
+    """
+
+    def __init__(self, callback: Callable[[str], None], debounce_time: float):
+        """
+        EventDebouncer 초기화
+
+        Args:
+            callback (Callable[[str], None]): 안정화된 파일 경로를 받을 콜백
+            debounce_time (float): 안정화 판단 시간 (초)
+        """
+        self.callback = callback
+        self.debounce_time = debounce_time
+        self.poll_interval = min(0.25, max(0.05, debounce_time / 4))
+
+        # 경로 -> (마지막 변화 시각, 마지막으로 관찰한 (크기, 수정 시각))
+        self._pending: Dict[str, Tuple[float, Optional[Tuple[int, int]]]] = {}
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """안정화 확인 스레드 시작"""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="EventDebouncer", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """안정화 확인 스레드 중지 (대기 중인 이벤트는 버림)"""
+        self._stop_event.set()
+        if self._thread:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+        with self._lock:
+            self._pending.clear()
+
+    def touch(self, file_path: str) -> None:
+        """경로에 이벤트가 발생했음을 기록합니다 (대기 시간 재시작)"""
+        with self._lock:
+            self._pending[file_path] = (time.monotonic(), None)
+
+    def refresh(self, file_path: str) -> None:
+        """이미 대기 중인 경로라면 대기 시간을 재시작합니다"""
+        with self._lock:
+            if file_path in self._pending:
+                self._pending[file_path] = (time.monotonic(), None)
+
+    def discard(self, file_path: str) -> bool:
+        """
+        대기 중인 경로를 제거합니다.
+
+        Returns:
+            bool: 대기 중이었으면 True
+        """
+        with self._lock:
+            return self._pending.pop(file_path, None) is not None
+
+    def is_pending(self, file_path: str) -> bool:
+        """경로가 안정화 대기 중인지 확인"""
+        with self._lock:
+            return file_path in self._pending
+
+    def _run(self) -> None:
+        """주기적으로 대기 중인 파일의 안정화 여부를 확인합니다"""
+        while not self._stop_event.wait(self.poll_interval):
+            for file_path in self._collect_stable():
+                try:
+                    self.callback(file_path)
+                except Exception as e:
+                    logger.error(f"콜백 실행 중 오류 발생: {e}")
+
+    def _collect_stable(self) -> List[str]:
+        """크기와 수정 시각이 debounce_time 동안 변하지 않은 경로를 꺼냅니다"""
+        with self._lock:
+            snapshot = dict(self._pending)
+        if not snapshot:
+            return []
+
+        observed = {}
+        for file_path in snapshot:
+            try:
+                st = os.stat(file_path)
+                observed[file_path] = (st.st_size, st.st_mtime_ns)
+            except OSError:
+                observed[file_path] = None
+
+        now = time.monotonic()
+        stable = []
+        with self._lock:
+            for file_path, entry in snapshot.items():
+                # 확인하는 동안 새 이벤트가 들어온 경로는 다음 주기에 다시 확인
+                if self._pending.get(file_path) != entry:
+                    continue
+                last_change, signature = entry
+                current = observed[file_path]
+                if current is None:
+                    # 삭제되었거나 다른 이름으로 바뀜
+                    del self._pending[file_path]
+                elif current != signature:
+                    self._pending[file_path] = (now, current)
+                elif now - last_change >= self.debounce_time:
+                    del self._pending[file_path]
+                    stable.append(file_path)
+        return stable
+
 
 class FileWatcher(FileSystemEventHandler):
     """
@@ -22,16 +219,32 @@ class FileWatcher(FileSystemEventHandler):
     새 파일이 생성되면 콜백 함수를 실행합니다.
     """
     
-    def __init__(self, on_created: Optional[Callable] = None):
+    def __init__(
+        self,
+        on_created: Optional[Callable] = None,
+        debounce_time: Optional[float] = None,
+        path_filter: Optional[PathFilter] = None
+    ):
         """
         FileWatcher 초기화
         
         Args:
             on_created (Optional[Callable]): 파일 생성 시 실행할 콜백 함수
+            debounce_time (Optional[float]): 파일이 안정화될 때까지 기다리는 시간 (초)
+                기본값은 MONITOR_DEBOUNCE_TIME이며, 0이면 즉시 콜백을 실행합니다.
+            path_filter (Optional[PathFilter]): 이벤트를 무시할 경로 필터
         """
         super().__init__()
         self.creation_callback = on_created
         self.watched_files: List[str] = []
+        self.path_filter = path_filter
+
+        if debounce_time is None:
+            debounce_time = cfg.MONITOR_DEBOUNCE_TIME
+        self.debouncer: Optional[EventDebouncer] = None
+        if debounce_time and debounce_time > 0:
+            self.debouncer = EventDebouncer(self._emit, debounce_time)
+            self.debouncer.start()
     
     def on_created(self, event: FileCreatedEvent) -> None:
         """
@@ -44,14 +257,20 @@ class FileWatcher(FileSystemEventHandler):
             return
         
         file_path = event.src_path
+        if is_temp_file(file_path):
+            logger.debug(f"임시 파일 무시: {file_path}")
+            return
+        if self._is_ignored(file_path):
+            logger.debug(f"제외 경로 무시: {file_path}")
+            return
+
         logger.info(f"새 파일 감지됨: {file_path}")
         self.watched_files.append(file_path)
         
-        if self.creation_callback:
-            try:
-                self.creation_callback(file_path)
-            except Exception as e:
-                logger.error(f"콜백 실행 중 오류 발생: {e}")
+        if self.debouncer:
+            self.debouncer.touch(file_path)
+        else:
+            self._emit(file_path)
     
     def on_modified(self, event) -> None:
         """
@@ -64,6 +283,37 @@ class FileWatcher(FileSystemEventHandler):
             return
         
         logger.debug(f"파일 수정됨: {event.src_path}")
+        # 아직 쓰는 중인 새 파일이면 안정화 대기를 다시 시작
+        if self.debouncer:
+            self.debouncer.refresh(event.src_path)
+
+    def on_moved(self, event) -> None:
+        """
+        파일 이름이 바뀌었을 때 호출
+
+        다운로드 임시 파일(.crdownload, .part 등)이 최종 이름으로 바뀌면
+        최종 파일만 처리 대상으로 등록합니다.
+
+        Args:
+            event: 파일 이벤트
+        """
+        if event.is_directory:
+            return
+
+        src_path, dest_path = event.src_path, event.dest_path
+        was_pending = self.debouncer.discard(src_path) if self.debouncer else False
+        if not (was_pending or is_temp_file(src_path)) or is_temp_file(dest_path):
+            return
+        if self._is_ignored(dest_path):
+            logger.debug(f"제외 경로 무시: {dest_path}")
+            return
+
+        logger.info(f"파일 이름 변경 감지됨: {src_path} -> {dest_path}")
+        self.watched_files.append(dest_path)
+        if self.debouncer:
+            self.debouncer.touch(dest_path)
+        else:
+            self._emit(dest_path)
     
     def on_deleted(self, event) -> None:
         """
@@ -76,6 +326,25 @@ class FileWatcher(FileSystemEventHandler):
             return
         
         logger.info(f"파일 삭제됨: {event.src_path}")
+        if self.debouncer:
+            self.debouncer.discard(event.src_path)
+
+    def _is_ignored(self, file_path: str) -> bool:
+        """경로 필터에 해당하는지 확인"""
+        return bool(self.path_filter and self.path_filter.is_ignored(file_path))
+
+    def close(self) -> None:
+        """디바운서 스레드를 정리합니다"""
+        if self.debouncer:
+            self.debouncer.stop()
+
+    def _emit(self, file_path: str) -> None:
+        """처리 대상 파일로 콜백 실행"""
+        if self.creation_callback:
+            try:
+                self.creation_callback(file_path)
+            except Exception as e:
+                logger.error(f"콜백 실행 중 오류 발생: {e}")
 
 
 class FolderMonitor:
@@ -85,14 +354,28 @@ class FolderMonitor:
     특정 폴더를 감시하고 변화가 발생할 때 처리합니다.
     """
     
-    def __init__(self, watch_path: str):
+    def __init__(
+        self,
+        watch_path: str,
+        debounce_time: Optional[float] = None,
+        ignored_dirs: Optional[Set[str]] = None,
+        ignore_patterns: Optional[Iterable[str]] = None
+    ):
         """
         FolderMonitor 초기화
         
         Args:
             watch_path (str): 감시할 폴더 경로
+            debounce_time (Optional[float]): 이벤트 디바운스 시간 (기본값: MONITOR_DEBOUNCE_TIME)
+            ignored_dirs (Optional[Set[str]]): 감시에서 제외할 폴더 집합
+                (예: FileMover.destination_folders - 이동 시 계속 갱신됨)
+            ignore_patterns (Optional[Iterable[str]]): 제외할 이름 패턴 (기본값: MONITOR_IGNORE_PATTERNS)
         """
         self.watch_path = Path(watch_path)
+        self.debounce_time = debounce_time
+        if ignore_patterns is None:
+            ignore_patterns = getattr(cfg, 'MONITOR_IGNORE_PATTERNS', [])
+        self.path_filter = PathFilter(str(self.watch_path), ignored_dirs, ignore_patterns)
         self.observer: Optional[Observer] = None
         self.watcher: Optional[FileWatcher] = None
         self.is_running = False
@@ -116,7 +399,11 @@ class FolderMonitor:
             return False
         
         try:
-            self.watcher = FileWatcher(on_created=on_file_created)
+            self.watcher = FileWatcher(
+                on_created=on_file_created,
+                debounce_time=self.debounce_time,
+                path_filter=self.path_filter
+            )
             self.observer = Observer()
             self.observer.schedule(
                 self.watcher,
@@ -130,6 +417,8 @@ class FolderMonitor:
             return True
         except Exception as e:
             logger.error(f"폴더 감시 시작 실패: {e}")
+            if self.watcher:
+                self.watcher.close()
             return False
     
     def stop(self) -> None:
@@ -142,6 +431,8 @@ class FolderMonitor:
             if self.observer:
                 self.observer.stop()
                 self.observer.join()
+            if self.watcher:
+                self.watcher.close()
             self.is_running = False
             logger.info("폴더 감시 중지됨")
         except Exception as e:
@@ -7,12 +7,14 @@ Handles asynchronous file processing pipeline: Extraction -> Classification -> M
 
 import asyncio
 import logging
-from typing import Optional, Dict, Set
+from typing import Optional, Dict, Set, List, Tuple, Any
 from pathlib import Path
 from datetime import datetime
 
 from modules.extractor import FileExtractor
 from modules.classifier import FileClassifier
+from modules.file_buffer import FileBuffer
+from modules.file_sniffer import SNIFF_BYTES
 from modules.mover import FileMover, DuplicateHandlingStrategy
 import config.config as cfg
 
@@ -57,6 +59,13 @@ class FileProcessingWorker:
         self.concurrency_limit = getattr(cfg, 'MAX_CONCURRENT_FILE_PROCESSING', 20)
         self.semaphore = asyncio.Semaphore(self.concurrency_limit)
 
+        # Micro-batching of non-rule files for the LLM
+        self.batch_enabled = getattr(cfg, 'BATCH_CLASSIFICATION_ENABLED', False)
+        self.batch_max_size = max(1, getattr(cfg, 'BATCH_MAX_SIZE', 10))
+        self.batch_max_wait = getattr(cfg, 'BATCH_MAX_WAIT', 0.5)
+        self._batch_pending: List[Tuple[Dict[str, Any], asyncio.Future]] = []
+        self._batch_timer: Optional[asyncio.TimerHandle] = None
+
     async def run(self):
         """
         Start the worker loop.
@@ -66,15 +75,26 @@ class FileProcessingWorker:
 
         while self.is_running:
             try:
+                # Take a processing slot before dequeuing, so a full worker leaves
+                # files in the bounded queue and the producers wait (backpressure)
+                await self.semaphore.acquire()
+
                 # Wait for a file from the queue
                 try:
-                    file_path = await asyncio.wait_for(self.queue.get(), timeout=1.0)
+                    item = await asyncio.wait_for(self.queue.get(), timeout=1.0)
                 except asyncio.TimeoutError:
+                    self.semaphore.release()
                     continue
 
+                # Items are either a file path or (file path, cached classification result)
+                if isinstance(item, tuple):
+                    file_path, cached_result = item
+                else:
+                    file_path, cached_result = item, None
+
                 # Create a task for processing the file
-                # Acquire semaphore inside the task to limit concurrency
-                task = asyncio.create_task(self._process_file_bounded(file_path))
+                # The task releases the slot acquired above when it finishes
+                task = asyncio.create_task(self._process_file_bounded(file_path, cached_result))
 
                 # Keep track of active tasks
                 self.active_tasks.add(task)
@@ -93,19 +113,30 @@ class FileProcessingWorker:
         Stop the worker.
         """
         self.is_running = False
+        # Send out any partially filled batch so its waiters can finish
+        self._flush_batch()
         # Wait for active tasks? Or just let them finish?
         # Usually we might want to wait for them.
         if self.active_tasks:
             logger.info(f"Waiting for {len(self.active_tasks)} active tasks to finish...")
             await asyncio.gather(*self.active_tasks, return_exceptions=True)
 
-    async def _process_file_bounded(self, file_path: str):
-        """Wrapper to process file with semaphore limit"""
-        async with self.semaphore:
-            await self._process_file_async(file_path)
+    async def _process_file_bounded(self, file_path: str, cached_result: Optional[Dict] = None):
+        """Wrapper to process file and release the slot taken by the run loop"""
+        try:
+            await self._process_file_async(file_path, cached_result)
+        finally:
+            self.semaphore.release()
+
+    async def _process_file_async(self, file_path: str, cached_result: Optional[Dict] = None):
+        """
+        Single file async processing pipeline
 
-    async def _process_file_async(self, file_path: str):
-        """Single file async processing pipeline"""
+        Args:
+            file_path: File to process.
+            cached_result: Classification already resolved from the history cache.
+                When given, extraction and classification are skipped.
+        """
         try:
             file_path_obj = Path(file_path)
 
@@ -113,26 +144,17 @@ class FileProcessingWorker:
                 logger.warning(f"File does not exist: {file_path}")
                 return
 
-            # 1. Extract content (Async)
-            extracted = await self.extractor.extract_async(file_path)
-            content = extracted.get('content', '') if extracted else ''
+            if cached_result is not None:
+                classification_result = cached_result
+            else:
+                if not self.classifier:
+                    logger.warning("Classifier not initialized.")
+                    return
 
-            # 2. Classify (Async)
-            if not self.classifier:
-                logger.warning("Classifier not initialized.")
-                return
+                # 1-3. Detect, hash and extract from a single read of the file
+                file_type, content = await self._read_file_async(file_path)
 
-            file_type = file_path_obj.suffix.lstrip('.')
-
-            if self.classifier.is_image_file(file_type):
-                classification_result = await self.classifier.classify_image_async(file_path)
-            else:
-                classification_result = await self.classifier.classify_file_async(
-                    filename=file_path_obj.name,
-                    file_type=file_type,
-                    content=content,
-                    file_path=file_path
-                )
+                classification_result = await self._classify_async(file_path_obj, file_type, content)
 
             if classification_result.get('status') != 'success':
                 error_msg = classification_result.get('error', 'Classification failed')
@@ -140,7 +162,7 @@ class FileProcessingWorker:
                 self.stats['failed'] += 1
                 return
 
-            # 3. Move file (Async)
+            # 4. Move file (Async)
             folder_name = classification_result.get('folder_name', cfg.DEFAULT_FOLDER_NAME)
             move_result = await self.mover.move_file_async(file_path, folder_name)
 
@@ -162,3 +184,114 @@ class FileProcessingWorker:
         except Exception as e:
             logger.error(f"Processing error (Async): {file_path} - {e}", exc_info=True)
             self.stats['failed'] += 1
+
+    async def _read_file_async(self, file_path: str) -> Tuple[str, str]:
+        """
+        Map the file once and feed type detection, hashing and extraction from it.
+
+        Detection reads the mapped head, and the hash is remembered by the history
+        DB, so the classifier's cache lookup does not open the file again. Handlers
+        that run in the extraction process pool still open the file by path there.
+        The mapping is closed before returning, so the file can be moved afterwards.
+
+        Returns:
+            (file_type, content) tuple.
+        """
+        # 1. Map the file and detect the real type from magic bytes in one thread hop,
+        # so files with a missing or wrong extension get the right extractor and rules
+        buffer, file_type = await asyncio.to_thread(self._open_and_detect, file_path)
+        if buffer is None:
+            extracted = await self.extractor.extract_async(file_path, file_type)
+            return file_type, extracted.get('content', '') if extracted else ''
+
+        try:
+            # 2. Hash (for the history cache) and 3. extract content, both from the buffer
+            history_db = getattr(self.classifier, 'history_db', None)
+            extraction = self.extractor.extract_async(file_path, file_type, data=buffer.data)
+            if history_db is not None and not self.classifier.is_image_file(file_type):
+                _, extracted = await asyncio.gather(
+                    asyncio.to_thread(history_db.get_file_hash_from_buffer, buffer), extraction
+                )
+            else:
+                extracted = await extraction
+        finally:
+            buffer.close()
+
+        return file_type, extracted.get('content', '') if extracted else ''
+
+    def _open_and_detect(self, file_path: str) -> Tuple[Optional[FileBuffer], str]:
+        """Map the file (None if it cannot be mapped) and detect its type (runs in a thread)."""
+        buffer = FileBuffer.open(file_path)
+        if buffer is None:
+            return None, self.extractor.detect_type(file_path)
+        try:
+            return buffer, self.extractor.detect_type(file_path, buffer.head(SNIFF_BYTES))
+        except BaseException:
+            buffer.close()
+            raise
+
+    async def _classify_async(self, file_path_obj: Path, file_type: str, content: str) -> Dict:
+        """Route a file to image, single or batched classification."""
+        if self.classifier.is_image_file(file_type):
+            return await self.classifier.classify_image_async(str(file_path_obj), file_type=file_type)
+
+        item = {
+            'filename': file_path_obj.name,
+            'file_type': file_type,
+            'content': content,
+            'file_path': str(file_path_obj)
+        }
+
+        # Rule-matched files are resolved locally, so they never wait for a batch
+        if not self.batch_enabled or self.classifier.check_rules(item['filename'], file_type, item['file_path']):
+            return await self.classifier.classify_file_async(**item)
+
+        return await self._classify_in_batch(item)
+
+    async def _classify_in_batch(self, item: Dict[str, Any]) -> Dict:
+        """
+        Add a file to the current micro-batch and wait for its result.
+
+        A batch is sent when it reaches BATCH_MAX_SIZE files or when
+        BATCH_MAX_WAIT seconds have passed since its first file arrived.
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._batch_pending.append((item, future))
+
+        if len(self._batch_pending) >= self.batch_max_size:
+            self._flush_batch()
+        elif self._batch_timer is None:
+            self._batch_timer = loop.call_later(self.batch_max_wait, self._flush_batch)
+
+        return await future
+
+    def _flush_batch(self):
+        """Send the pending micro-batch to the classifier."""
+        if self._batch_timer is not None:
+            self._batch_timer.cancel()
+            self._batch_timer = None
+
+        if not self._batch_pending:
+            return
+
+        batch, self._batch_pending = self._batch_pending, []
+        task = asyncio.create_task(self._run_batch(batch))
+        self.active_tasks.add(task)
+        task.add_done_callback(self.active_tasks.discard)
+
+    async def _run_batch(self, batch: List[Tuple[Dict[str, Any], asyncio.Future]]):
+        """Classify a micro-batch and resolve the waiting futures."""
+        items = [item for item, _ in batch]
+        try:
+            results = await self.classifier.classify_files_batch_async(items)
+        except Exception as e:
+            logger.error(f"Batch classification error: {e}", exc_info=True)
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
@@ -9,6 +9,7 @@ class TestAsyncIntegration(unittest.TestCase):
         self.classifier = FileClassifier(api_key="test_key")
         # Mocking history_db to avoid actual DB operations
         self.classifier.history_db = MagicMock()
+        self.classifier.history_db.get_result_by_stat_async = AsyncMock(return_value=None)
         self.classifier.history_db.get_file_hash_async = AsyncMock(return_value="dummy_hash")
         self.classifier.history_db.get_result_async = AsyncMock(return_value=None)
         self.classifier.history_db.save_result_async = AsyncMock()
@@ -40,5 +41,123 @@ class TestAsyncIntegration(unittest.TestCase):
         self.classifier.history_db.get_result_async.assert_called_once()
         self.classifier.history_db.save_result_async.assert_called_once()
 
+class TestBatchClassification(unittest.TestCase):
+    def setUp(self):
+        self.classifier = FileClassifier(api_key="test_key")
+        self.classifier.history_db = MagicMock()
+        self.classifier.llm_client = MagicMock()
+
+    def test_batch_packs_non_rule_files_into_one_call(self):
+        self.classifier.llm_client.call_async = AsyncMock(return_value="""[
+            {"index": 1, "folder_name": "회의록", "category": "문서", "confidence": 0.9, "reason": "r"},
+            {"index": 0, "folder_name": "청구내역", "category": "문서", "confidence": 0.8, "reason": "r"}
+        ]""")
+        items = [
+            {"filename": "a_data.txt", "file_type": "txt", "content": "A"},
+            {"filename": "b_notes.txt", "file_type": "txt", "content": "B"},
+            {"filename": "photo.jpg", "file_type": "jpg", "content": ""},
+        ]
+
+        results = asyncio.run(self.classifier.classify_files_batch_async(items))
+
+        self.classifier.llm_client.call_async.assert_called_once()
+        self.assertEqual(results[0]["folder_name"], "청구내역")
+        self.assertEqual(results[1]["folder_name"], "회의록")
+        self.assertEqual(results[2]["folder_name"], "이미지")
+
+    def test_batch_falls_back_per_missing_item(self):
+        batch_reply = '[{"index": 0, "folder_name": "회의록", "category": "문서", "confidence": 0.9, "reason": "r"}]'
+        single_reply = '{"folder_name": "계약서류", "category": "문서", "confidence": 0.9, "reason": "r"}'
+        self.classifier.llm_client.call_async = AsyncMock(side_effect=[batch_reply, single_reply])
+        items = [
+            {"filename": "a_data.txt", "file_type": "txt", "content": "A"},
+            {"filename": "b_notes.txt", "file_type": "txt", "content": "B"},
+        ]
+
+        results = asyncio.run(self.classifier.classify_files_batch_async(items))
+
+        self.assertEqual(self.classifier.llm_client.call_async.call_count, 2)
+        self.assertEqual(results[0]["folder_name"], "회의록")
+        self.assertEqual(results[1]["folder_name"], "계약서류")
+
+    def test_batch_cache_prepass_uses_bulk_lookup(self):
+        db = self.classifier.history_db
+        db.get_stat_signature.side_effect = lambda path: (1, 2, 3)
+        db.get_results_by_stat_bulk.return_value = {
+            "/tmp/hit_data.txt": ("hit_hash", {"folder_name": "청구서", "category": "문서", "reason": "r"})
+        }
+        db.get_file_hash.return_value = "miss_hash"
+        db.get_results_bulk.return_value = {}
+        self.classifier._lookup_cache_async = AsyncMock()
+        self.classifier._save_history_async = AsyncMock()
+        self.classifier.llm_client.call_async = AsyncMock(
+            return_value='[{"index": 0, "folder_name": "회의록", "category": "문서", "confidence": 0.9, "reason": "r"}]'
+        )
+        items = [
+            {"filename": "hit_data.txt", "file_type": "txt", "content": "A", "file_path": "/tmp/hit_data.txt"},
+            {"filename": "miss_data.txt", "file_type": "txt", "content": "B", "file_path": "/tmp/miss_data.txt"},
+        ]
+
+        results = asyncio.run(self.classifier.classify_files_batch_async(items))
+
+        self.classifier._lookup_cache_async.assert_not_called()
+        db.get_results_by_stat_bulk.assert_called_once()
+        db.get_results_bulk.assert_called_once()
+        self.assertEqual(results[0]["folder_name"], "청구서")
+        self.assertEqual(results[1]["folder_name"], "회의록")
+        self.assertEqual(self.classifier._save_history_async.call_args.args[1], "miss_hash")
+
+class TestSingleFlight(unittest.TestCase):
+    def setUp(self):
+        self.classifier = FileClassifier(api_key="test_key")
+        self.classifier._lookup_cache_async = AsyncMock(return_value=("same_hash", None))
+        self.classifier._lookup_cache_bulk = MagicMock(side_effect=lambda paths: ({p: "same_hash" for p in paths}, {}))
+        self.classifier._save_history_async = AsyncMock()
+        self.classifier.history_db = MagicMock()
+        self.classifier.llm_client = MagicMock()
+
+        async def slow_reply(prompt):
+            await asyncio.sleep(0.05)
+            return '{"folder_name": "회의록", "category": "문서", "confidence": 0.9, "reason": "r"}'
+
+        self.classifier.llm_client.call_async = AsyncMock(side_effect=slow_reply)
+
+    def test_concurrent_identical_files_call_api_once(self):
+        async def run_test():
+            return await asyncio.gather(*(
+                self.classifier.classify_file_async("notes.txt", "txt", "same", f"/tmp/dir{i}/notes.txt")
+                for i in range(5)
+            ))
+
+        results = asyncio.run(run_test())
+
+        self.classifier.llm_client.call_async.assert_called_once()
+        self.assertTrue(all(r["folder_name"] == "회의록" for r in results))
+        self.assertEqual(self.classifier._inflight, {})
+        # 결과를 공유받은 파일도 각자의 경로를 기록
+        recorded = {call.args[1] for call in self.classifier.history_db.update_signature.call_args_list}
+        self.assertEqual(len(recorded), 4)
+
+    def test_batch_shares_inflight_results(self):
+        items = [
+            {"filename": "a_data.txt", "file_type": "txt", "content": "same", "file_path": "/tmp/a/a_data.txt"},
+            {"filename": "a_data.txt", "file_type": "txt", "content": "same", "file_path": "/tmp/b/a_data.txt"},
+        ]
+
+        async def run_test():
+            return await asyncio.gather(
+                self.classifier.classify_file_async("a_data.txt", "txt", "same", "/tmp/c/a_data.txt"),
+                self.classifier.classify_files_batch_async(items),
+            )
+
+        single, batch = asyncio.run(run_test())
+
+        self.classifier.llm_client.call_async.assert_called_once()
+        self.assertEqual([r["folder_name"] for r in batch], ["회의록", "회의록"])
+        self.assertEqual(single["folder_name"], "회의록")
+        self.assertEqual(self.classifier._inflight, {})
+        recorded = {call.args[1] for call in self.classifier.history_db.update_signature.call_args_list}
+        self.assertEqual(len(recorded), 2)
+
 if __name__ == "__main__":
     unittest.main()
@@ -8,6 +8,10 @@ FileClassifier 클래스의 기능을 검증하는 단위 테스트입니다.
 import unittest
 import json
 import os
+import io
+import base64
+import shutil
+import tempfile
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 import sys
@@ -177,6 +181,20 @@ class TestParseResponse(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.classifier._parse_response(response)
 
+    def test_parse_batch_response_aligns_by_index(self):
+        """배치 응답을 index 기준으로 정렬"""
+        response = """```json
+[
+    {"index": 1, "folder_name": "회의록", "category": "문서", "confidence": 0.9, "reason": "r"},
+    {"index": 0, "folder_name": "청구서"}
+]
+```"""
+        entries = self.classifier._parse_batch_response(response, 3)
+        self.assertEqual(entries[0]["folder_name"], "청구서")
+        self.assertEqual(entries[0]["confidence"], 0.5)
+        self.assertEqual(entries[1]["folder_name"], "회의록")
+        self.assertIsNone(entries[2])
+
 
 class TestIsImageFile(unittest.TestCase):
     """이미지 파일 판별 테스트"""
@@ -293,6 +311,75 @@ class TestFileMappings(unittest.TestCase):
                 self.assertEqual(result, "음악")
 
 
+class TestPrepareImagePayload(unittest.TestCase):
+    """Vision 이미지 페이로드 준비 테스트"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.classifier = FileClassifier(api_key="test_key_123")
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """테스트 정리"""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_large_image_is_downscaled(self):
+        """큰 이미지는 최대 크기로 축소되어 인코딩"""
+        from PIL import Image
+
+        path = os.path.join(self.temp_dir, "big.png")
+        Image.new("RGB", (3000, 1500), (200, 10, 10)).save(path)
+
+        with patch("modules.classifier.cfg.VISION_MAX_IMAGE_DIMENSION", 512):
+            data, mime_type = self.classifier._prepare_image_payload(path, "png")
+
+        self.assertEqual(mime_type, "image/jpeg")
+        with Image.open(io.BytesIO(base64.b64decode(data))) as img:
+            self.assertEqual(max(img.size), 512)
+
+    def test_small_image_is_sent_unchanged(self):
+        """작은 이미지는 원본 그대로 인코딩"""
+        from PIL import Image
+
+        path = os.path.join(self.temp_dir, "small.png")
+        Image.new("RGB", (64, 64)).save(path)
+
+        data, mime_type = self.classifier._prepare_image_payload(path, "png")
+
+        self.assertEqual(mime_type, "image/png")
+        with open(path, "rb") as f:
+            self.assertEqual(base64.b64decode(data), f.read())
+
+
+class TestLookupCachedBulk(unittest.TestCase):
+    """일괄 캐시 조회 테스트"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.classifier = FileClassifier(api_key="test_key_123")
+        self.classifier.history_db = MagicMock()
+        self.classifier.history_db.get_results_by_stat_bulk.return_value = {
+            "/tmp/hit.txt": ("hash", {"folder_name": "청구서", "category": "문서", "reason": "r", "cached": True})
+        }
+        self.signatures = {"/tmp/hit.txt": (1, 2, 3), "/tmp/miss.txt": (4, 5, 6)}
+
+    def test_stat_only_lookup_does_not_hash_misses(self):
+        """hash_misses=False면 stat 적중만 반환하고 빠진 파일은 읽지 않음"""
+        hits = self.classifier.lookup_cached_bulk(list(self.signatures), self.signatures, hash_misses=False)
+
+        self.assertEqual(list(hits), ["/tmp/hit.txt"])
+        self.classifier.history_db.get_file_hash.assert_not_called()
+
+    def test_default_lookup_hashes_misses(self):
+        """기본값은 빠진 파일의 해시로 다시 조회"""
+        self.classifier.history_db.get_file_hash.return_value = "miss_hash"
+        self.classifier.history_db.get_results_bulk.return_value = {}
+
+        self.classifier.lookup_cached_bulk(list(self.signatures), self.signatures)
+
+        self.classifier.history_db.get_file_hash.assert_called_once_with("/tmp/miss.txt")
+
+
 class TestPromptTemplates(unittest.TestCase):
     """프롬프트 템플릿 테스트"""
 
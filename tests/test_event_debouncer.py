@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+"""
+파일 이벤트 디바운스 및 필터 테스트
+
+FileWatcher의 이벤트 병합, 안정화 대기, 임시 파일 이름 변경 처리와
+감시 제외 경로 필터를 검증합니다.
+"""
+
+import os
+import shutil
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import Mock
+import sys
+
+# 프로젝트 루트를 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from watchdog.events import FileCreatedEvent, FileModifiedEvent, FileMovedEvent
+
+from modules.watcher import FileWatcher, PathFilter, is_temp_file
+
+
+class TestFileWatcherDebounce(unittest.TestCase):
+    """FileWatcher 디바운스 테스트"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.test_dir = tempfile.mkdtemp()
+        self.callback = Mock()
+        self.watcher = FileWatcher(on_created=self.callback, debounce_time=0.2)
+
+    def tearDown(self):
+        """테스트 정리"""
+        self.watcher.close()
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def _write(self, name: str, content: str = "data") -> str:
+        path = os.path.join(self.test_dir, name)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(content)
+        return path
+
+    def _wait_for_calls(self, count: int, timeout: float = 2.0) -> None:
+        deadline = time.monotonic() + timeout
+        while self.callback.call_count < count and time.monotonic() < deadline:
+            time.sleep(0.05)
+
+    def test_repeated_events_fire_once(self):
+        """같은 경로의 반복 이벤트는 한 번만 콜백"""
+        path = self._write("report.txt")
+        self.watcher.on_created(FileCreatedEvent(path))
+        self.watcher.on_modified(FileModifiedEvent(path))
+        self.watcher.on_modified(FileModifiedEvent(path))
+
+        self.assertEqual(self.callback.call_count, 0)
+        self._wait_for_calls(1)
+        time.sleep(0.3)
+        self.callback.assert_called_once_with(path)
+
+    def test_temp_download_renamed_to_final(self):
+        """임시 다운로드 파일은 무시하고 최종 이름만 처리"""
+        temp_path = self._write("movie.mp4.crdownload")
+        self.watcher.on_created(FileCreatedEvent(temp_path))
+
+        final_path = os.path.join(self.test_dir, "movie.mp4")
+        os.rename(temp_path, final_path)
+        self.watcher.on_moved(FileMovedEvent(temp_path, final_path))
+
+        self._wait_for_calls(1)
+        self.callback.assert_called_once_with(final_path)
+
+    def test_deleted_before_stable_is_dropped(self):
+        """안정화 전에 삭제된 파일은 처리하지 않음"""
+        path = self._write("gone.txt")
+        self.watcher.on_created(FileCreatedEvent(path))
+        os.remove(path)
+
+        time.sleep(0.6)
+        self.callback.assert_not_called()
+
+    def test_is_temp_file(self):
+        """임시 파일 판별"""
+        self.assertTrue(is_temp_file("a.pdf.part"))
+        self.assertTrue(is_temp_file("/x/b.zip.CRDOWNLOAD"))
+        self.assertTrue(is_temp_file("~$report.docx"))
+        self.assertFalse(is_temp_file("report.docx"))
+
+
+class TestPathFilter(unittest.TestCase):
+    """PathFilter 테스트"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.root = os.path.abspath(tempfile.gettempdir())
+        self.ignored_dirs = set()
+        self.path_filter = PathFilter(self.root, self.ignored_dirs, ["Thumbs.db", ".git"])
+
+    def _path(self, *parts: str) -> str:
+        return os.path.join(self.root, *parts)
+
+    def test_live_destination_folders(self):
+        """나중에 추가된 대상 폴더도 즉시 제외"""
+        moved = self._path("청구서", "invoice.pdf")
+        self.assertFalse(self.path_filter.is_ignored(moved))
+
+        self.ignored_dirs.add(os.path.normcase(self._path("청구서")))
+        self.assertTrue(self.path_filter.is_ignored(moved))
+        self.assertFalse(self.path_filter.is_ignored(self._path("new.pdf")))
+
+    def test_ignore_patterns(self):
+        """이름 패턴으로 파일과 폴더 제외"""
+        self.assertTrue(self.path_filter.is_ignored(self._path("Thumbs.db")))
+        self.assertTrue(self.path_filter.is_ignored(self._path("repo", ".git", "HEAD")))
+        self.assertFalse(self.path_filter.is_ignored(self._path("repo", "main.py")))
+
+    def test_watcher_drops_ignored_events(self):
+        """제외 경로의 이벤트는 콜백하지 않음"""
+        callback = Mock()
+        self.ignored_dirs.add(os.path.normcase(self._path("보고서")))
+        watcher = FileWatcher(on_created=callback, debounce_time=0, path_filter=self.path_filter)
+
+        watcher.on_created(FileCreatedEvent(self._path("보고서", "a.docx")))
+        watcher.on_created(FileCreatedEvent(self._path("a.docx")))
+
+        callback.assert_called_once_with(self._path("a.docx"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+"""
+추출 프로세스 풀 테스트
+
+CPU 부하가 큰 핸들러의 프로세스 실행, 작업 시간 제한, 작업 프로세스 교체를 검증합니다.
+"""
+
+import asyncio
+import os
+import shutil
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import AsyncMock
+import sys
+
+# 프로젝트 루트를 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from modules.extraction_pool import ExtractionProcessPool
+from modules.extractor import FileExtractor
+
+
+def _pid_handler(file_path):
+    """작업 프로세스 번호를 돌려주는 핸들러"""
+    return {"content": Path(file_path).name, "pid": os.getpid()}
+
+
+def _busy_handler(file_path):
+    """제한 시간 안에 끝나지만 시간이 걸리는 핸들러"""
+    time.sleep(0.8)
+    return {"content": Path(file_path).name}
+
+
+def _slow_handler(file_path):
+    """제한 시간을 넘기는 핸들러"""
+    time.sleep(30)
+    return {"content": ""}
+
+
+class TestExtractionProcessPool(unittest.TestCase):
+    """프로세스 풀 추출 테스트"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.test_dir = tempfile.mkdtemp()
+        self.pool = ExtractionProcessPool(max_workers=1, task_timeout=10.0, max_tasks_per_worker=2)
+        self.extractor = FileExtractor(use_process_pool=True, process_pool=self.pool)
+        self.extractor.register_handler(".bin", _pid_handler, cpu_bound=True)
+        self.path = os.path.join(self.test_dir, "a.bin")
+        Path(self.path).write_bytes(b"data")
+
+    def tearDown(self):
+        """테스트 정리"""
+        self.pool.shutdown(wait_workers=False)
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def test_cpu_bound_handler_runs_in_worker_process(self):
+        """cpu_bound 핸들러는 다른 프로세스에서 실행"""
+        result = asyncio.run(self.extractor.extract_async(self.path))
+
+        self.assertEqual(result["content"], "a.bin")
+        self.assertNotEqual(result["pid"], os.getpid())
+
+    def test_text_handler_stays_on_thread(self):
+        """텍스트 핸들러는 프로세스 풀을 쓰지 않음"""
+        text_path = os.path.join(self.test_dir, "a.txt")
+        Path(text_path).write_text("hello", encoding="utf-8")
+        self.pool.run = AsyncMock()
+
+        result = asyncio.run(self.extractor.extract_async(text_path))
+
+        self.assertEqual(result["content"], "hello")
+        self.pool.run.assert_not_called()
+
+    def test_default_document_handlers_are_cpu_bound(self):
+        """PDF/DOCX 기본 핸들러는 프로세스 풀 대상"""
+        self.assertTrue({".pdf", ".docx"} <= self.extractor._process_extensions)
+        self.assertNotIn(".txt", self.extractor._process_extensions)
+
+    def test_workers_are_recycled(self):
+        """max_tasks_per_worker개를 처리한 작업 프로세스는 교체됨"""
+        async def run_test():
+            return [await self.extractor.extract_async(self.path) for _ in range(4)]
+
+        pids = {result["pid"] for result in asyncio.run(run_test())}
+
+        self.assertGreaterEqual(len(pids), 2)
+
+    def test_timeout_restarts_pool(self):
+        """시간 초과 작업은 None이 되고 이후 작업은 새 풀에서 실행"""
+        self.pool.task_timeout = 1.0
+        self.extractor.register_handler(".slow", _slow_handler, cpu_bound=True)
+        slow_path = os.path.join(self.test_dir, "a.slow")
+        Path(slow_path).write_bytes(b"")
+        self.pool.warm_up(wait_ready=True, timeout=30)
+
+        async def run_test():
+            timed_out = await self.extractor.extract_async(slow_path)
+            self.pool.task_timeout = 30.0
+            return timed_out, await self.extractor.extract_async(self.path)
+
+        timed_out, result = asyncio.run(run_test())
+
+        self.assertIsNone(timed_out)
+        self.assertEqual(result["content"], "a.bin")
+
+    def test_queue_wait_is_not_counted_as_timeout(self):
+        """대기열에서 기다린 시간은 제한 시간에 포함되지 않음"""
+        self.pool.task_timeout = 2.0
+        # 작업 프로세스 교체(새 프로세스 시작)는 이 테스트와 무관하므로 끔
+        self.pool.max_tasks_per_worker = None
+        self.extractor.register_handler(".busy", _busy_handler, cpu_bound=True)
+        paths = []
+        for index in range(4):
+            path = os.path.join(self.test_dir, f"{index}.busy")
+            Path(path).write_bytes(b"")
+            paths.append(path)
+        self.pool.warm_up(wait_ready=True, timeout=30)
+
+        async def run_test():
+            return await asyncio.gather(*(self.extractor.extract_async(path) for path in paths))
+
+        results = asyncio.run(run_test())
+
+        self.assertEqual([result["content"] for result in results], [Path(path).name for path in paths])
+
+    def test_missing_file_returns_none(self):
+        """없는 파일은 None"""
+        result = asyncio.run(self.extractor.extract_async(os.path.join(self.test_dir, "missing.pdf")))
+
+        self.assertIsNone(result)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+"""
+공유 파일 버퍼 테스트
+
+한 번 매핑한 버퍼로 계산한 해시와 추출 결과가 경로로 읽은 결과와 같고,
+버퍼를 쓰는 경로에서는 파일을 다시 열지 않는지 검증합니다.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+import zipfile
+from pathlib import Path
+from unittest.mock import patch
+import sys
+
+# 프로젝트 루트를 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from modules.extractor import FileExtractor
+from modules.file_buffer import FileBuffer
+from modules.history_db import ProcessingHistory
+
+W_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+
+
+class TestFileBuffer(unittest.TestCase):
+    """버퍼 기반 해시/추출 테스트"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.test_dir = tempfile.mkdtemp()
+        self.history = ProcessingHistory(os.path.join(self.test_dir, "history.db"))
+        self.extractor = FileExtractor(use_process_pool=False)
+
+    def tearDown(self):
+        """테스트 정리"""
+        self.history.close()
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def _write(self, name, data):
+        path = os.path.join(self.test_dir, name)
+        Path(path).write_bytes(data)
+        return path
+
+    def test_buffer_hash_matches_path_hash(self):
+        """빈 파일, 작은 파일, 블록보다 큰 파일 모두 경로로 계산한 해시와 같음"""
+        for size in (0, 5, 70000):
+            with self.subTest(size=size):
+                path = self._write(f"f{size}.bin", bytes(i % 251 for i in range(size)))
+                with FileBuffer(path) as buffer:
+                    buffer_hash = self.history.get_file_hash_from_buffer(buffer)
+                fresh = ProcessingHistory(os.path.join(self.test_dir, f"h{size}.db"))
+                try:
+                    self.assertEqual(buffer_hash, fresh.get_file_hash(path))
+                finally:
+                    fresh.close()
+
+    def test_path_hash_reuses_buffer_hash(self):
+        """버퍼로 계산한 뒤에는 같은 파일의 해시 계산이 파일을 열지 않음"""
+        path = self._write("report.txt", "분기 보고서".encode("utf-8") * 100)
+        with FileBuffer(path) as buffer:
+            expected = self.history.get_file_hash_from_buffer(buffer)
+
+        with patch("builtins.open", side_effect=AssertionError("file reopened")):
+            self.assertEqual(self.history.get_file_hash(path), expected)
+
+    def test_text_extraction_from_buffer(self):
+        """작은/큰 텍스트 파일 모두 버퍼에서 읽은 결과가 경로로 읽은 결과와 같음"""
+        for name, text in (("small.txt", "회의록 안건"), ("large.txt", "가나다라마바사" * 500)):
+            with self.subTest(name=name):
+                path = self._write(name, text.encode("utf-8"))
+                expected = self.extractor.extract(path)
+                with FileBuffer(path) as buffer:
+                    with patch("builtins.open", side_effect=AssertionError("file reopened")):
+                        result = self.extractor.extract(path, data=buffer.data)
+                self.assertEqual(result, expected)
+
+    def test_docx_extraction_from_buffer(self):
+        """DOCX도 버퍼에서 읽음"""
+        path = os.path.join(self.test_dir, "memo.docx")
+        xml = (f'<w:document xmlns:w="{W_NS}"><w:body>'
+               '<w:p><w:r><w:t>계약서</w:t></w:r></w:p></w:body></w:document>')
+        with zipfile.ZipFile(path, "w") as archive:
+            archive.writestr("word/document.xml", xml)
+
+        with FileBuffer(path) as buffer:
+            result = self.extractor.extract(path, data=buffer.data)
+
+        self.assertEqual(result["content"], "계약서")
+        self.assertEqual(result["size"], os.path.getsize(path))
+
+    def test_detect_type_from_head(self):
+        """앞부분을 넘기면 파일을 열지 않고 판별"""
+        path = self._write("scan.download", b"%PDF-1.4\n")
+        with FileBuffer(path) as buffer:
+            head = buffer.head(8192)
+
+        with patch("builtins.open", side_effect=AssertionError("file reopened")):
+            self.assertEqual(self.extractor.detect_type(path, head), "pdf")
+
+    def test_open_missing_file_returns_none(self):
+        """없는 파일은 None"""
+        self.assertIsNone(FileBuffer.open(os.path.join(self.test_dir, "missing.txt")))
+
+    def test_empty_file(self):
+        """빈 파일은 빈 버퍼"""
+        path = self._write("empty.txt", b"")
+        with FileBuffer(path) as buffer:
+            self.assertEqual(buffer.size, 0)
+            self.assertEqual(buffer.head(10), b"")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+"""
+파일 형식 판별 테스트
+
+매직 넘버 판별, 확장자와의 선택 규칙, (inode, mtime) 캐시, 판별 형식에 따른 추출기 선택을 검증합니다.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+import zipfile
+from pathlib import Path
+from unittest.mock import patch
+import sys
+
+# 프로젝트 루트를 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from modules.extractor import FileExtractor
+from modules.file_sniffer import FileTypeSniffer, resolve_file_type, sniff_bytes
+
+
+class TestSniffBytes(unittest.TestCase):
+    """매직 넘버 판별 테스트"""
+
+    def test_known_signatures(self):
+        """대표 형식의 매직 넘버"""
+        cases = {
+            b"%PDF-1.7\n": "pdf",
+            b"\x89PNG\r\n\x1a\n\x00\x00": "png",
+            b"\xff\xd8\xff\xe0\x00\x10JFIF": "jpg",
+            b"GIF89a\x01\x00": "gif",
+            b"RIFF\x00\x00\x00\x00WEBPVP8 ": "webp",
+            b"\x00\x00\x00\x18ftypmp42": "mp4",
+            b"\x00\x00\x00\x14ftypqt  ": "mov",
+            b"ID3\x03\x00\x00": "mp3",
+            b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1": "doc",
+        }
+        for head, expected in cases.items():
+            with self.subTest(expected=expected):
+                self.assertEqual(sniff_bytes(head), expected)
+
+    def test_text_is_not_mistaken_for_short_signatures(self):
+        """'BM', 'ID3'로 시작하는 텍스트는 텍스트"""
+        self.assertEqual(sniff_bytes("BMW 견적서 2024".encode("utf-8")), "txt")
+        self.assertEqual(sniff_bytes(b"ID3 tags explained"), "txt")
+
+    def test_text_and_binary(self):
+        """UTF-8/CP949 텍스트와 알 수 없는 바이너리"""
+        self.assertEqual(sniff_bytes("회의록 안건".encode("cp949")), "txt")
+        self.assertIsNone(sniff_bytes(b"\x00\x01\x02\x03binary"))
+        self.assertIsNone(sniff_bytes(b""))
+
+    def test_zip_based_documents(self):
+        """zip 안의 파일 이름으로 DOCX/ODT 구분"""
+        test_dir = tempfile.mkdtemp()
+        try:
+            docx_path = os.path.join(test_dir, "a")
+            with zipfile.ZipFile(docx_path, "w") as archive:
+                archive.writestr("[Content_Types].xml", "<Types/>")
+                archive.writestr("word/document.xml", "<w:document/>")
+            odt_path = os.path.join(test_dir, "b")
+            with zipfile.ZipFile(odt_path, "w") as archive:
+                archive.writestr("mimetype", "application/vnd.oasis.opendocument.text")
+                archive.writestr("content.xml", "<office:document-content/>")
+
+            self.assertEqual(sniff_bytes(Path(docx_path).read_bytes()), "docx")
+            self.assertEqual(sniff_bytes(Path(odt_path).read_bytes()), "odt")
+        finally:
+            shutil.rmtree(test_dir, ignore_errors=True)
+
+
+class TestResolveFileType(unittest.TestCase):
+    """판별 형식과 확장자 선택 테스트"""
+
+    def test_same_family_keeps_extension(self):
+        """같은 계열이면 더 구체적인 확장자 사용"""
+        self.assertEqual(resolve_file_type("txt", ".py"), "py")
+        self.assertEqual(resolve_file_type("zip", ".xlsx"), "xlsx")
+        self.assertEqual(resolve_file_type("jpg", ".JPEG"), "jpeg")
+
+    def test_wrong_or_missing_extension_uses_detected(self):
+        """확장자가 없거나 다른 계열이면 판별 형식 사용"""
+        self.assertEqual(resolve_file_type("pdf", ".tmp"), "pdf")
+        self.assertEqual(resolve_file_type("png", ".jpg"), "png")
+        self.assertEqual(resolve_file_type("pdf", ""), "pdf")
+
+    def test_generic_or_unknown_extension_keeps_extension(self):
+        """zip/txt 판별이나 알 수 없는 확장자는 확장자 사용"""
+        self.assertEqual(resolve_file_type("zip", ".hwpx"), "hwpx")
+        self.assertEqual(resolve_file_type("zip", ".key"), "key")
+        self.assertEqual(resolve_file_type("txt", ".srt"), "srt")
+        self.assertEqual(resolve_file_type("txt", ".tsx"), "tsx")
+        self.assertEqual(resolve_file_type("pdf", ".dat"), "dat")
+        self.assertEqual(resolve_file_type("zip", ".download"), "zip")
+
+    def test_unknown_content_keeps_extension(self):
+        """판별하지 못하면 확장자 사용"""
+        self.assertEqual(resolve_file_type(None, ".mp4"), "mp4")
+
+
+class TestFileTypeSniffer(unittest.TestCase):
+    """판별기 캐시와 추출기 연동 테스트"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.test_dir = tempfile.mkdtemp()
+        self.sniffer = FileTypeSniffer()
+
+    def tearDown(self):
+        """테스트 정리"""
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def test_cached_per_inode_and_mtime(self):
+        """같은 파일은 다시 읽지 않고, 수정되면 다시 판별"""
+        path = os.path.join(self.test_dir, "report.download")
+        Path(path).write_bytes(b"%PDF-1.4\n")
+
+        self.assertEqual(self.sniffer.file_type(path), "pdf")
+        with patch("builtins.open", side_effect=AssertionError("cache miss")):
+            self.assertEqual(self.sniffer.file_type(path), "pdf")
+
+        Path(path).write_bytes(b"\x89PNG\r\n\x1a\n....")
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        self.assertEqual(self.sniffer.file_type(path), "png")
+
+    def test_extractor_uses_detected_type(self):
+        """확장자 없는 텍스트 파일도 텍스트 추출기로 처리"""
+        path = os.path.join(self.test_dir, "README")
+        Path(path).write_text("설치 방법과 사용법", encoding="utf-8")
+        extractor = FileExtractor(use_process_pool=False)
+
+        file_type = extractor.detect_type(path)
+
+        self.assertEqual(file_type, "txt")
+        self.assertEqual(extractor.extract(path, file_type)["content"], "설치 방법과 사용법")
+
+    def test_extractor_falls_back_to_content_without_type(self):
+        """확장자에 핸들러가 없으면 내용으로 판별한 형식의 핸들러 사용"""
+        path = os.path.join(self.test_dir, "notes.log")
+        Path(path).write_text("서버 점검 기록", encoding="utf-8")
+
+        result = FileExtractor(use_process_pool=False).extract(path)
+
+        self.assertEqual(result["content"], "서버 점검 기록")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+"""
+폴더 어휘 테스트
+
+기존 대상 폴더 색인, 프롬프트용 관련 폴더 선택, 비슷한 폴더명 통일을 검증합니다.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+import sys
+
+# 프로젝트 루트를 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from modules.classifier import FileClassifier
+from modules.folder_vocabulary import FolderVocabulary, normalize_folder_name
+
+
+class TestFolderVocabulary(unittest.TestCase):
+    """폴더 어휘 테스트"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.test_dir = tempfile.mkdtemp()
+        for name in ("청구서", "회의록", "여행 사진", ".cache"):
+            os.makedirs(os.path.join(self.test_dir, name))
+        self.vocabulary = FolderVocabulary(self.test_dir, refresh_interval=0)
+
+    def tearDown(self):
+        """테스트 정리"""
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def test_normalize(self):
+        """구분자, 대소문자, 흔한 접미사 제거"""
+        self.assertEqual(normalize_folder_name(" 청구서류 "), "청구서")
+        self.assertEqual(normalize_folder_name("Travel_Photos"), "travelphotos")
+        self.assertEqual(normalize_folder_name("파일"), "파일")
+
+    def test_existing_folders_are_indexed(self):
+        """숨김 폴더를 제외한 하위 폴더를 색인"""
+        self.assertEqual(self.vocabulary.folders, ["여행 사진", "청구서", "회의록"])
+
+    def test_near_duplicates_snap_to_existing(self):
+        """거의 같은 폴더명은 기존 폴더명으로 통일"""
+        self.assertEqual(self.vocabulary.snap("청구서류"), "청구서")
+        self.assertEqual(self.vocabulary.snap("여행_사진"), "여행 사진")
+        self.assertEqual(self.vocabulary.snap("계약서"), "계약서")
+
+    def test_different_numbers_do_not_snap(self):
+        """연도/번호가 다른 폴더명은 통일하지 않음"""
+        os.makedirs(os.path.join(self.test_dir, "회의록2023"))
+        vocabulary = FolderVocabulary(self.test_dir, refresh_interval=0)
+
+        self.assertEqual(vocabulary.snap("회의록2024"), "회의록2024")
+        self.assertEqual(vocabulary.snap("회의록_2023"), "회의록2023")
+
+    def test_new_folders_on_disk_are_picked_up(self):
+        """새로 만들어진 폴더를 다시 읽음"""
+        os.makedirs(os.path.join(self.test_dir, "계약서"))
+        stat = os.stat(self.test_dir)
+        os.utime(self.test_dir, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        self.assertEqual(self.vocabulary.snap("계약서들"), "계약서")
+
+    def test_relevant_folders_ranked_by_overlap(self):
+        """파일과 겹치는 폴더가 먼저 선택됨"""
+        self.assertEqual(self.vocabulary.relevant("2024 회의록 안건", k=1), ["회의록"])
+        self.assertEqual(len(self.vocabulary.relevant("anything", k=10)), 3)
+
+    def test_recorded_names_without_base_path(self):
+        """base_path가 없으면 분류에 쓰인 폴더명만 사용"""
+        vocabulary = FolderVocabulary()
+        vocabulary.record("견적서")
+
+        self.assertEqual(vocabulary.snap("견적서류"), "견적서")
+
+
+class TestClassifierFolderVocabulary(unittest.TestCase):
+    """분류기의 폴더 어휘 연동 테스트"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.test_dir = tempfile.mkdtemp()
+        os.makedirs(os.path.join(self.test_dir, "청구서"))
+        self.classifier = FileClassifier(api_key="test_key", destination_root=self.test_dir)
+
+    def tearDown(self):
+        """테스트 정리"""
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def test_prompt_lists_existing_folders(self):
+        """프롬프트에 기존 폴더 목록 포함"""
+        prompt = self.classifier._prepare_classification_prompt("청구_2024.pdf", "pdf", "청구 금액")
+
+        self.assertIn("청구서", prompt)
+        self.assertNotIn("{existing_folders}", prompt)
+
+    def test_llm_folder_is_snapped(self):
+        """LLM이 만든 비슷한 폴더명은 기존 폴더명으로 통일"""
+        result = self.classifier._finalize_llm_result({"folder_name": "청구서류"}, "a.pdf", "pdf")
+
+        self.assertEqual(result["folder_name"], "청구서")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+"""
+다중 공급자 헤징 테스트
+
+지연 시 중복 요청, 패자 취소, 서킷 브레이커 동작을 검증합니다.
+"""
+
+import asyncio
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock
+import sys
+
+# 프로젝트 루트를 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from modules.llm.hedging import CircuitBreaker, HedgedLLMClient, LatencyTracker
+
+
+class FakeClient:
+    """지연/실패를 설정할 수 있는 가짜 클라이언트"""
+
+    def __init__(self, provider, reply="ok", delay=0.0, error=None):
+        self.provider = provider
+        self.model_name = provider
+        self.reply = reply
+        self.delay = delay
+        self.error = error
+        self.calls = 0
+        self.cancelled = False
+
+    async def call_async(self, prompt, **kwargs):
+        self.calls += 1
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        if self.error:
+            raise self.error
+        return self.reply
+
+
+class TestHedgedLLMClient(unittest.TestCase):
+    """헤징 클라이언트 테스트"""
+
+    def test_fast_primary_does_not_hedge(self):
+        """주 공급자가 빠르면 보조 공급자를 호출하지 않음"""
+        primary, secondary = FakeClient("openai", "primary"), FakeClient("claude", "secondary")
+        client = HedgedLLMClient(primary, [secondary], initial_delay=0.5)
+
+        self.assertEqual(asyncio.run(client.call_async("prompt")), "primary")
+        self.assertEqual(secondary.calls, 0)
+
+    def test_slow_primary_is_hedged_and_cancelled(self):
+        """주 공급자가 느리면 보조 공급자 응답을 사용하고 주 요청은 취소"""
+        primary = FakeClient("openai", "primary", delay=5)
+        secondary = FakeClient("claude", "secondary", delay=0.01)
+        client = HedgedLLMClient(primary, [secondary], initial_delay=0.05)
+
+        async def run():
+            result = await client.call_async("prompt")
+            await asyncio.sleep(0)
+            return result
+
+        self.assertEqual(asyncio.run(run()), "secondary")
+        self.assertTrue(primary.cancelled)
+        self.assertEqual(client.hedges, 1)
+
+    def test_hedge_delay_follows_primary_latency(self):
+        """두 번째 헤지도 주 공급자의 지연 기준으로 시작"""
+        primary = FakeClient("openai", "primary", delay=5)
+        secondary = FakeClient("claude", "secondary", delay=5)
+        tertiary = FakeClient("gemini", "tertiary", delay=0.01)
+        client = HedgedLLMClient(primary, [secondary, tertiary], min_samples=1, min_delay=0.01)
+        client.latencies[id(primary)].record(0.05)
+        client.latencies[id(secondary)].record(10)
+
+        result = asyncio.run(asyncio.wait_for(client.call_async("prompt"), 1))
+
+        self.assertEqual(result, "tertiary")
+        self.assertEqual(client.hedges, 2)
+
+    def test_failed_primary_falls_over_immediately(self):
+        """주 공급자가 실패하면 대기 없이 보조 공급자로 전환"""
+        primary = FakeClient("openai", error=RuntimeError("boom"))
+        secondary = FakeClient("claude", "secondary")
+        client = HedgedLLMClient(primary, [secondary], initial_delay=10)
+
+        self.assertEqual(asyncio.run(asyncio.wait_for(client.call_async("prompt"), 1)), "secondary")
+
+    def test_repeatedly_failing_provider_is_circuit_broken(self):
+        """연속 실패한 공급자는 차단되어 호출되지 않음"""
+        primary = FakeClient("openai", error=RuntimeError("boom"))
+        secondary = FakeClient("claude", "secondary")
+        client = HedgedLLMClient(primary, [secondary], failure_threshold=2, reset_timeout=60)
+
+        for _ in range(3):
+            self.assertEqual(asyncio.run(client.call_async("prompt")), "secondary")
+
+        self.assertEqual(primary.calls, 2)
+
+    def test_half_open_admits_single_probe_for_concurrent_calls(self):
+        """동시 요청이 몰려도 반쯤 열린 공급자에는 시험 요청 하나만 전송"""
+        primary = FakeClient("openai", delay=0.05, error=RuntimeError("boom"))
+        secondary = FakeClient("claude", "secondary")
+        client = HedgedLLMClient(primary, [secondary], initial_delay=10, failure_threshold=1, reset_timeout=0)
+        asyncio.run(client.call_async("prompt"))
+
+        async def burst():
+            return await asyncio.gather(*(client.call_async("prompt") for _ in range(5)))
+
+        self.assertEqual(asyncio.run(burst()), ["secondary"] * 5)
+        self.assertEqual(primary.calls, 2)
+
+
+class TestHedgingHelpers(unittest.TestCase):
+    """서킷 브레이커와 지연 시간 분위수 테스트"""
+
+    def test_circuit_breaker_half_open_probe(self):
+        """재시도 시간 이후 한 번의 시험 요청만 허용"""
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+        breaker.record_failure()
+
+        self.assertTrue(breaker.allow())
+        self.assertTrue(breaker.try_acquire())
+        self.assertFalse(breaker.allow())
+        self.assertFalse(breaker.try_acquire())
+        breaker.record_success()
+        self.assertFalse(breaker.is_open)
+
+    def test_latency_quantile(self):
+        """분위수 계산"""
+        tracker = LatencyTracker()
+        for value in range(1, 101):
+            tracker.record(value / 100)
+
+        self.assertAlmostEqual(tracker.quantile(0.95), 0.95)
+
+
+if __name__ == "__main__":
+    unittest.main()
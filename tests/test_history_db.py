@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+"""
+처리 이력 DB 모듈 테스트
+
+ProcessingHistory의 저장/조회 동작을 검증하는 단위 테스트입니다.
+"""
+
+import shutil
+import sqlite3
+import tempfile
+import unittest
+from unittest.mock import patch
+from pathlib import Path
+import sys
+
+# 프로젝트 루트를 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from modules.history_db import ProcessingHistory
+
+
+class TestProcessingHistory(unittest.TestCase):
+    """ProcessingHistory 테스트"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.test_dir = tempfile.mkdtemp()
+        self.db_path = str(Path(self.test_dir) / "history.db")
+        self.history = ProcessingHistory(self.db_path)
+        self.result = {"folder_name": "청구서", "category": "문서", "reason": "테스트"}
+
+    def tearDown(self):
+        """테스트 정리"""
+        self.history.close()
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def test_wal_mode_enabled(self):
+        """WAL 저널 모드 사용"""
+        with sqlite3.connect(self.db_path) as conn:
+            mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+        self.assertEqual(mode.lower(), "wal")
+
+    def test_result_visible_before_commit(self):
+        """커밋 전에도 저장한 결과를 조회 가능"""
+        self.history.save_result("hash1", "a.pdf", 10, self.result)
+        cached = self.history.get_result("hash1")
+        self.assertEqual(cached["folder_name"], "청구서")
+        self.assertTrue(cached["cached"])
+
+    def test_flush_persists_results(self):
+        """flush 후 다른 인스턴스에서 조회 가능"""
+        for i in range(20):
+            self.history.save_result(f"hash{i}", f"{i}.pdf", i, self.result)
+        self.assertTrue(self.history.flush(timeout=5.0))
+
+        other = ProcessingHistory(self.db_path)
+        try:
+            self.assertEqual(other.get_result("hash19")["folder_name"], "청구서")
+            self.assertIsNone(other.get_result("missing"))
+        finally:
+            other.close()
+
+    def test_failed_batch_releases_waiters(self):
+        """묶음 저장이 실패해도 flush는 반환되고 대기 행은 정리됨"""
+        with patch.object(self.history, "_commit_statements", side_effect=RuntimeError("disk")):
+            self.history.save_result("hash1", "a.pdf", 10, self.result)
+            self.assertTrue(self.history.flush(timeout=5.0))
+        self.assertIsNone(self.history.get_result("hash1"))
+
+        self.history.save_result("hash2", "b.pdf", 10, self.result)
+        self.assertTrue(self.history.flush(timeout=5.0))
+        self.assertIsNotNone(self.history.get_result("hash2"))
+
+    def test_writer_failure_releases_waiters(self):
+        """쓰기 스레드가 연결에 실패해도 flush는 반환됨"""
+        with patch.object(self.history, "_connect", side_effect=sqlite3.OperationalError("locked")):
+            self.history.save_result("hash1", "a.pdf", 10, self.result)
+            self.assertTrue(self.history.flush(timeout=5.0))
+        self.assertNotIn("hash1", self.history._pending)
+
+    def test_get_results_bulk_spans_chunks(self):
+        """청크 크기를 넘는 일괄 조회"""
+        self.history.BULK_QUERY_CHUNK = 7
+        for i in range(20):
+            self.history.save_result(f"hash{i}", f"{i}.pdf", i, self.result)
+        self.history.flush(timeout=5.0)
+        self.history.save_result("pending", "p.pdf", 1, self.result)
+
+        results = self.history.get_results_bulk([f"hash{i}" for i in range(25)] + ["pending"])
+
+        self.assertEqual(len(results), 21)
+        self.assertIn("hash0", results)
+        self.assertIn("pending", results)
+        self.assertNotIn("hash24", results)
+
+    def test_stat_signature_fast_path(self):
+        """stat 시그니처가 같으면 해시 없이 조회, 바뀌면 미스"""
+        file_path = Path(self.test_dir) / "doc.txt"
+        file_path.write_text("hello", encoding="utf-8")
+        file_hash = self.history.get_file_hash(str(file_path))
+        signature = self.history.get_stat_signature(str(file_path))
+        self.history.save_result(file_hash, "doc.txt", 5, self.result,
+                                 file_path=str(file_path), signature=signature)
+        self.history.flush(timeout=5.0)
+
+        hit = self.history.get_result_by_stat(str(file_path))
+        self.assertIsNotNone(hit)
+        self.assertEqual(hit[0], file_hash)
+        self.assertEqual(hit[1]["folder_name"], "청구서")
+
+        file_path.write_text("hello world", encoding="utf-8")
+        self.assertIsNone(self.history.get_result_by_stat(str(file_path)))
+
+    def test_stat_signature_per_path_for_identical_content(self):
+        """내용이 같은 두 파일도 각자의 경로로 stat 조회"""
+        paths = [Path(self.test_dir) / "a.txt", Path(self.test_dir) / "b.txt"]
+        for path in paths:
+            path.write_text("same", encoding="utf-8")
+        file_hash = self.history.get_file_hash(str(paths[0]))
+        for path in paths:
+            self.history.save_result(file_hash, path.name, 4, self.result,
+                                     file_path=str(path), signature=self.history.get_stat_signature(str(path)))
+        self.assertEqual(len(self.history.get_results_by_stat_bulk(
+            {str(path): self.history.get_stat_signature(str(path)) for path in paths})), 2)
+        self.history.flush(timeout=5.0)
+
+        for path in paths:
+            self.assertEqual(self.history.get_result_by_stat(str(path))[0], file_hash)
+        hits = self.history.get_results_by_stat_bulk(
+            {str(path): self.history.get_stat_signature(str(path)) for path in paths})
+        self.assertEqual(set(hits), {str(path) for path in paths})
+
+    def test_migrates_legacy_schema(self):
+        """이전 스키마 DB에 stat 컬럼 추가"""
+        legacy_path = str(Path(self.test_dir) / "legacy.db")
+        with sqlite3.connect(legacy_path) as conn:
+            conn.execute("""
+                CREATE TABLE processed_files (
+                    file_hash TEXT PRIMARY KEY, filename TEXT, file_size INTEGER,
+                    folder_name TEXT, category TEXT, reason TEXT,
+                    timestamp DATETIME DEFAULT CURRENT_TIMESTAMP
+                )
+            """)
+
+        legacy = ProcessingHistory(legacy_path)
+        try:
+            with sqlite3.connect(legacy_path) as conn:
+                columns = {row[1] for row in conn.execute("PRAGMA table_info(processed_files)")}
+            self.assertTrue({"path", "st_size", "st_mtime_ns", "st_ino"} <= columns)
+        finally:
+            legacy.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
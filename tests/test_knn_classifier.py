@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+"""
+유사 파일 분류기 테스트
+
+처리 이력 기반 최근접 이웃 분류와 분류기 연동을 검증합니다.
+"""
+
+import asyncio
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+import sys
+
+# 프로젝트 루트를 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from modules.classifier import FileClassifier
+from modules.history_db import ProcessingHistory
+from modules.knn_classifier import NearestNeighborClassifier
+
+HISTORY = [
+    ("2023년_3월_급여명세서.pdf", "급여 명세서 지급 내역 기본급 식대", "급여명세서", "문서"),
+    ("2023년_4월_급여명세서.pdf", "급여 명세서 지급 내역 기본급 식대", "급여명세서", "문서"),
+    ("2023년_5월_급여명세서.pdf", "급여 명세서 지급 내역 기본급 식대", "급여명세서", "문서"),
+    ("주간회의록_0105.docx", "회의 안건 참석자 결정 사항", "회의록", "문서"),
+    ("주간회의록_0112.docx", "회의 안건 참석자 결정 사항", "회의록", "문서"),
+]
+
+
+class TestNearestNeighborClassifier(unittest.TestCase):
+    """최근접 이웃 분류 테스트"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.knn = NearestNeighborClassifier(threshold=0.6)
+        self.knn.load(HISTORY)
+
+    def test_recurring_document_is_classified(self):
+        """반복되는 문서는 이력의 폴더로 분류"""
+        result = self.knn.classify("2024년_1월_급여명세서.pdf", "급여 명세서 지급 내역 기본급 식대")
+
+        self.assertIsNotNone(result)
+        self.assertEqual(result["folder_name"], "급여명세서")
+        self.assertGreaterEqual(result["confidence"], 0.6)
+
+    def test_unrelated_file_is_not_classified(self):
+        """이력과 다른 파일은 분류하지 않음"""
+        self.assertIsNone(self.knn.classify("vacation_photo_list.txt", "beach sunset"))
+
+    def test_added_results_are_used_immediately(self):
+        """새로 추가한 결과가 바로 반영"""
+        self.knn.add("견적서_A사.xlsx", "견적 금액 단가 수량", "견적서", "문서")
+
+        result = self.knn.classify("견적서_B사.xlsx", "견적 금액 단가 수량")
+
+        self.assertEqual(result["folder_name"], "견적서")
+
+    def test_full_index_evicts_oldest(self):
+        """색인이 가득 차면 가장 오래된 이력부터 빼고 새 결과를 추가"""
+        knn = NearestNeighborClassifier(threshold=0.5, k=1, max_documents=len(HISTORY))
+        knn.load(HISTORY)
+
+        knn.add("견적서_A사.xlsx", "견적 금액 단가 수량", "견적서", "문서")
+        knn.add("견적서_B사.xlsx", "견적 금액 단가 수량", "견적서", "문서")
+
+        self.assertEqual(len(knn), len(HISTORY))
+        self.assertEqual(knn.classify("견적서_C사.xlsx", "견적 금액 단가 수량")["folder_name"], "견적서")
+        # 최신순 이력의 마지막(가장 오래된) 두 항목이 빠짐
+        self.assertNotIn(HISTORY[-1][2:4], knn._index.labels.values())
+        self.assertEqual(sum(knn._index.doc_freq.values()),
+                         sum(len(features) for features in knn._index._doc_features.values()))
+
+    def test_load_from_history_db_skips_fallbacks(self):
+        """이력 DB에서 색인하되 폴백 결과는 제외"""
+        test_dir = tempfile.mkdtemp()
+        history = ProcessingHistory(str(Path(test_dir) / "history.db"))
+        try:
+            history.save_result("h1", "주간회의록_0105.docx", 1, {"folder_name": "회의록", "category": "문서"},
+                                snippet="회의 안건")
+            history.save_result("h2", "unknown.bin", 1, {"folder_name": "기타", "reason": "폴백 분류 (오류: x)"})
+            history.flush(timeout=5)
+
+            knn = NearestNeighborClassifier()
+            knn.load(history.iter_training_rows(exclude_reason_prefix="폴백 분류"))
+
+            self.assertEqual(len(knn), 1)
+        finally:
+            history.close()
+            shutil.rmtree(test_dir, ignore_errors=True)
+
+
+class TestClassifierKnnStage(unittest.TestCase):
+    """분류기의 유사 파일 분류 단계 테스트"""
+
+    def test_similar_history_skips_api_call(self):
+        """비슷한 이력이 있으면 API를 호출하지 않음"""
+        classifier = FileClassifier(api_key="test_key")
+        classifier.knn_classifier = NearestNeighborClassifier(threshold=0.6)
+        classifier.knn_classifier.load(HISTORY)
+        classifier._lookup_cache_async = AsyncMock(return_value=(None, None))
+        classifier.llm_client = MagicMock()
+        classifier.llm_client.call_async = AsyncMock()
+
+        result = asyncio.run(classifier.classify_file_async(
+            "2024년_2월_급여명세서.pdf", "pdf", "급여 명세서 지급 내역 기본급 식대"
+        ))
+
+        self.assertEqual(result["folder_name"], "급여명세서")
+        classifier.llm_client.call_async.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+"""
+LLM 클라이언트 테스트
+
+각 공급자 클라이언트가 네이티브 비동기 API를 사용하는지 검증합니다.
+"""
+
+import asyncio
+import unittest
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+import sys
+
+# 프로젝트 루트를 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from modules.llm.claude_client import ClaudeClient
+from modules.llm.gemini_client import GeminiClient
+from modules.llm.openai_client import OpenAIClient
+
+
+class TestNativeAsyncClients(unittest.TestCase):
+    """네이티브 비동기 호출 테스트"""
+
+    def setUp(self):
+        """테스트 설정 (응답 캐시 비활성화)"""
+        patcher = patch("modules.llm.base.get_response_cache", return_value=None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_claude_uses_async_client(self):
+        """Claude: AsyncAnthropic으로 호출"""
+        client = ClaudeClient("key", "claude-3-haiku-20240307", 0.0, 100)
+        message = MagicMock()
+        message.content = [MagicMock(text='{"folder_name": "청구서"}')]
+        client.async_client = MagicMock()
+        client.async_client.messages.create = AsyncMock(return_value=message)
+        client.client = MagicMock()
+
+        with patch("asyncio.to_thread") as to_thread:
+            text = asyncio.run(client.call_async("prompt"))
+
+        self.assertEqual(text, '{"folder_name": "청구서"}')
+        to_thread.assert_not_called()
+        client.client.messages.create.assert_not_called()
+
+    def test_gemini_uses_generate_content_async(self):
+        """Gemini: generate_content_async로 호출"""
+        client = GeminiClient("key", "gemini-pro", 0.0, 100)
+        client.model = MagicMock()
+        client.model.generate_content_async = AsyncMock(return_value=MagicMock(text="ok"))
+
+        text = asyncio.run(client.call_async("prompt"))
+
+        self.assertEqual(text, "ok")
+        client.model.generate_content_async.assert_awaited_once()
+        client.model.generate_content.assert_not_called()
+
+    def test_openai_reads_first_choice(self):
+        """OpenAI: 첫 번째 choice의 내용을 반환"""
+        client = OpenAIClient("key", "https://api.openai.com/v1", "gpt-4", 0.0, 100, 30)
+        response = MagicMock()
+        response.choices = [MagicMock()]
+        response.choices[0].message.content = "ok"
+        client.async_client = MagicMock()
+        client.async_client.chat.completions.create = AsyncMock(return_value=response)
+
+        self.assertEqual(asyncio.run(client.call_async("prompt")), "ok")
+
+    def test_openai_vision_uses_async_client(self):
+        """OpenAI: Vision 비동기 호출은 스레드 없이 AsyncOpenAI 사용"""
+        client = OpenAIClient("key", "https://api.openai.com/v1", "gpt-4o", 0.0, 100, 30)
+        response = MagicMock()
+        response.choices = [MagicMock()]
+        response.choices[0].message.content = "ok"
+        client.async_client = MagicMock()
+        client.async_client.chat.completions.create = AsyncMock(return_value=response)
+        client.client = MagicMock()
+
+        with patch("asyncio.to_thread") as to_thread:
+            text = asyncio.run(client.call_vision_async("prompt", "aGVsbG8=", "image/png"))
+
+        self.assertEqual(text, "ok")
+        to_thread.assert_not_called()
+        client.client.chat.completions.create.assert_not_called()
+        messages = client.async_client.chat.completions.create.call_args.kwargs["messages"]
+        self.assertIn("data:image/png;base64,aGVsbG8=", str(messages))
+
+
+if __name__ == "__main__":
+    unittest.main()
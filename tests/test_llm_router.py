@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+"""
+단계별 모델 라우팅 테스트
+
+빠른 모델 우선 분류와 상위 모델 재분류 조건을 검증합니다.
+"""
+
+import asyncio
+import unittest
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+import sys
+
+# 프로젝트 루트를 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import config.config as cfg
+from modules.classifier import FileClassifier
+from modules.llm.router import TieredLLMClient, TIER_STRONG
+
+CONFIDENT = '{"folder_name": "회의록", "category": "문서", "confidence": 0.95, "reason": "r"}'
+UNSURE = '{"folder_name": "회의록", "category": "문서", "confidence": 0.3, "reason": "r"}'
+BAD_FOLDER = '{"folder_name": "x", "category": "문서", "confidence": 0.95, "reason": "r"}'
+STRONG = '{"folder_name": "계약서류", "category": "문서", "confidence": 0.9, "reason": "r"}'
+
+
+def make_client(reply):
+    client = MagicMock()
+    client.provider = "openai"
+    client.model_name = "model"
+    client.call_async = AsyncMock(return_value=reply)
+    return client
+
+
+class TestTieredLLMClient(unittest.TestCase):
+    """라우터 단독 동작 테스트"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.classifier = FileClassifier(api_key="test_key")
+
+    def route(self, fast_reply):
+        fast, strong = make_client(fast_reply), make_client(STRONG)
+        router = TieredLLMClient(fast, strong, accept=self.classifier._accept_fast_response)
+        return asyncio.run(router.call_async("prompt")), strong
+
+    def test_confident_fast_answer_is_used(self):
+        """확신도가 충분하면 빠른 모델 응답 사용"""
+        response, strong = self.route(CONFIDENT)
+        self.assertEqual(response, CONFIDENT)
+        strong.call_async.assert_not_called()
+
+    def test_low_confidence_escalates(self):
+        """확신도가 낮으면 상위 모델로 재분류"""
+        response, strong = self.route(UNSURE)
+        self.assertEqual(response, STRONG)
+
+    def test_invalid_folder_or_json_escalates(self):
+        """폴더명이 유효하지 않거나 JSON이 아니면 상위 모델로 재분류"""
+        self.assertEqual(self.route(BAD_FOLDER)[0], STRONG)
+        self.assertEqual(self.route("not json")[0], STRONG)
+
+    def test_explicit_strong_tier_skips_fast_model(self):
+        """tier=strong이면 빠른 모델을 건너뜀"""
+        fast, strong = make_client(CONFIDENT), make_client(STRONG)
+        router = TieredLLMClient(fast, strong)
+
+        self.assertEqual(asyncio.run(router.call_async("prompt", tier=TIER_STRONG)), STRONG)
+        fast.call_async.assert_not_called()
+
+
+class TestFastModelResolution(unittest.TestCase):
+    """빠른 모델 선택 테스트"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.classifier = FileClassifier(api_key="test_key")
+
+    def test_requires_explicit_fast_model(self):
+        """LLM_FAST_MODEL을 지정하지 않으면 라우팅하지 않음"""
+        with patch.object(cfg, "TIERED_ROUTING_ENABLED", True), patch.object(cfg, "LLM_FAST_MODEL", ""):
+            self.assertIsNone(self.classifier._resolve_fast_model(cfg.CREDENTIAL_SOURCE, "gpt-3.5-turbo"))
+
+    def test_explicit_fast_model_for_primary_only(self):
+        """지정한 빠른 모델은 주 공급자에만 적용"""
+        other = "claude" if cfg.CREDENTIAL_SOURCE != "claude" else "gemini"
+        with patch.object(cfg, "TIERED_ROUTING_ENABLED", True), patch.object(cfg, "LLM_FAST_MODEL", "fast-model"):
+            self.assertEqual(self.classifier._resolve_fast_model(cfg.CREDENTIAL_SOURCE, "strong-model"), "fast-model")
+            self.assertIsNone(self.classifier._resolve_fast_model(other, "strong-model"))
+
+
+class TestTieredBatchClassification(unittest.TestCase):
+    """배치 분류의 항목별 재분류 테스트"""
+
+    def test_only_unsure_batch_entries_escalate(self):
+        """배치에서 확신도가 낮은 항목만 상위 모델로 개별 분류"""
+        classifier = FileClassifier(api_key="test_key")
+        classifier.history_db = MagicMock()
+        fast = make_client("""[
+            {"index": 0, "folder_name": "회의록", "category": "문서", "confidence": 0.95, "reason": "r"},
+            {"index": 1, "folder_name": "기타", "category": "문서", "confidence": 0.2, "reason": "r"}
+        ]""")
+        strong = make_client(STRONG)
+        classifier.llm_client = TieredLLMClient(fast, strong, accept=classifier._accept_fast_response)
+        items = [
+            {"filename": "a_data.txt", "file_type": "txt", "content": "A"},
+            {"filename": "b_data.txt", "file_type": "txt", "content": "B"},
+        ]
+
+        results = asyncio.run(classifier.classify_files_batch_async(items))
+
+        fast.call_async.assert_called_once()
+        strong.call_async.assert_called_once()
+        self.assertEqual(results[0]["folder_name"], "회의록")
+        self.assertEqual(results[1]["folder_name"], "계약서류")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -88,6 +88,16 @@ class TestFileMover(unittest.TestCase):
         self.assertTrue(folder_path.exists())
         self.assertTrue(folder_path.is_dir())
     
+    def test_destination_folders_tracked(self):
+        """대상 폴더가 감시 제외용 집합에 기록되는지 테스트"""
+        test_file = self._create_test_file("tracked.txt")
+
+        result = self.mover.move_file(str(test_file), "기록폴더")
+
+        self.assertEqual(result["status"], "success")
+        expected = os.path.normcase(os.path.abspath(self.base_path / "기록폴더"))
+        self.assertIn(expected, self.mover.destination_folders)
+    
     def test_duplicate_file_handling_rename(self):
         """중복 파일 처리 (번호 추가) 테스트"""
         # 준비
@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+"""
+DOCX/ODT 문단 읽기 테스트
+
+zip 안의 본문 XML에서 문단을 흘려 읽고, 앞/뒤 문단만 보관하는지 검증합니다.
+"""
+
+import shutil
+import tempfile
+import unittest
+import zipfile
+from pathlib import Path
+import sys
+
+# 프로젝트 루트를 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from modules.extractor import FileExtractor
+from modules.office_reader import iter_paragraphs, read_paragraphs
+
+W_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+MC_NS = "http://schemas.openxmlformats.org/markup-compatibility/2006"
+WPS_NS = "http://schemas.microsoft.com/office/word/2010/wordprocessingShape"
+V_NS = "urn:schemas-microsoft-com:vml"
+
+
+def write_docx(path, paragraphs, table_cell=None):
+    """문단(과 선택적으로 표 하나)이 있는 최소 DOCX 생성"""
+    body = "".join(f"<w:p><w:r><w:t>{text}</w:t></w:r></w:p>" for text in paragraphs)
+    if table_cell is not None:
+        body += f"<w:tbl><w:tr><w:tc><w:p><w:r><w:t>{table_cell}</w:t></w:r></w:p></w:tc></w:tr></w:tbl>"
+    xml = f'<?xml version="1.0" encoding="UTF-8"?><w:document xmlns:w="{W_NS}"><w:body>{body}</w:body></w:document>'
+    with zipfile.ZipFile(path, "w") as archive:
+        archive.writestr("[Content_Types].xml", "<Types/>")
+        archive.writestr("word/document.xml", xml)
+
+
+class TestOfficeReader(unittest.TestCase):
+    """문단 읽기 테스트"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.test_dir = tempfile.mkdtemp()
+        self.extractor = FileExtractor(use_process_pool=False)
+
+    def tearDown(self):
+        """테스트 정리"""
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def _path(self, name):
+        return str(Path(self.test_dir) / name)
+
+    def test_docx_paragraphs_in_order(self):
+        """문단과 표 안의 문단을 문서 순서대로 읽음"""
+        path = self._path("a.docx")
+        write_docx(path, ["회의록", "안건"], table_cell="참석자")
+
+        self.assertEqual(list(iter_paragraphs(path)), ["회의록", "안건", "참석자"])
+
+    def test_docx_runs_tabs_and_breaks(self):
+        """여러 run, 탭, 줄바꿈을 합침"""
+        path = self._path("b.docx")
+        xml = (f'<w:document xmlns:w="{W_NS}"><w:body><w:p>'
+               '<w:r><w:t>가</w:t><w:tab/><w:t>나</w:t></w:r><w:r><w:br/><w:t>다</w:t></w:r>'
+               '</w:p></w:body></w:document>')
+        with zipfile.ZipFile(path, "w") as archive:
+            archive.writestr("word/document.xml", xml)
+
+        self.assertEqual(list(iter_paragraphs(path)), ["가\t나\n다"])
+
+    def test_docx_text_box_paragraphs(self):
+        """텍스트 상자 안의 문단을 잃지 않고, VML 대체본은 중복으로 읽지 않음"""
+        path = self._path("box.docx")
+        box = "<w:txbxContent><w:p><w:r><w:t>상자1</w:t></w:r></w:p><w:p><w:r><w:t>상자2</w:t></w:r></w:p></w:txbxContent>"
+        xml = (f'<w:document xmlns:w="{W_NS}" xmlns:mc="{MC_NS}" xmlns:wps="{WPS_NS}" xmlns:v="{V_NS}"><w:body>'
+               '<w:p><w:r><w:t>앞</w:t></w:r><w:r><mc:AlternateContent>'
+               f'<mc:Choice Requires="wps"><w:drawing><wps:wsp><wps:txbx>{box}</wps:txbx></wps:wsp></w:drawing></mc:Choice>'
+               f'<mc:Fallback><w:pict><v:shape><v:textbox>{box}</v:textbox></v:shape></w:pict></mc:Fallback>'
+               '</mc:AlternateContent></w:r><w:r><w:t>뒤</w:t></w:r></w:p>'
+               '<w:p><w:r><w:t>다음</w:t></w:r></w:p>'
+               '</w:body></w:document>')
+        with zipfile.ZipFile(path, "w") as archive:
+            archive.writestr("word/document.xml", xml)
+
+        self.assertEqual(list(iter_paragraphs(path)), ["앞뒤", "상자1", "상자2", "다음"])
+
+    def test_odt_paragraphs(self):
+        """ODT의 제목/문단과 공백 요소를 읽음"""
+        path = self._path("c.odt")
+        xml = ('<office:document-content xmlns:office="urn:oasis:names:tc:opendocument:xmlns:office:1.0" '
+               'xmlns:text="urn:oasis:names:tc:opendocument:xmlns:text:1.0"><office:body><office:text>'
+               '<text:h>계약서</text:h><text:p>갑<text:s text:c="2"/>을 <text:span>서명</text:span></text:p>'
+               '</office:text></office:body></office:document-content>')
+        with zipfile.ZipFile(path, "w") as archive:
+            archive.writestr("mimetype", "application/vnd.oasis.opendocument.text")
+            archive.writestr("content.xml", xml)
+
+        self.assertEqual(list(iter_paragraphs(path)), ["계약서", "갑  을 서명"])
+
+    def test_head_and_tail_are_bounded(self):
+        """앞/뒤 문단만 보관하고 전체 수는 셈"""
+        path = self._path("long.docx")
+        write_docx(path, [f"p{i}" for i in range(300)])
+
+        summary = read_paragraphs(path, head=3, tail=2)
+
+        self.assertEqual(summary.head, ["p0", "p1", "p2"])
+        self.assertEqual(summary.tail, ["p298", "p299"])
+        self.assertEqual(summary.total, 300)
+
+    def test_extractor_summarizes_long_document(self):
+        """문단이 100개를 넘으면 앞 50개와 뒤 50개만 사용"""
+        path = self._path("report.docx")
+        write_docx(path, [f"p{i}" for i in range(150)])
+
+        result = self.extractor.extract_text_from_docx(path)
+
+        self.assertEqual(result["metadata"]["paragraph_count"], 150)
+        self.assertIn("[중간 문단 생략]", result["content"])
+
+    def test_legacy_doc_returns_none(self):
+        """zip이 아닌 예전 .doc 파일은 None"""
+        path = self._path("old.doc")
+        Path(path).write_bytes(b"\xd0\xcf\x11\xe0" + b"\x00" * 100)
+
+        self.assertIsNone(self.extractor.extract_text_from_docx(path))
+
+
+if __name__ == "__main__":
+    unittest.main()
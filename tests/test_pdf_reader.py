@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+"""
+지연 PDF 읽기 테스트
+
+/Count 기반 페이지 수, 필요한 페이지만 찾기, 글자 수 한도에서의 추출 중단을 검증합니다.
+"""
+
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+import sys
+
+# 프로젝트 루트를 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from PyPDF2 import PageObject, PdfReader, PdfWriter
+from PyPDF2.generic import DecodedStreamObject, DictionaryObject, NameObject
+
+from modules.extractor import FileExtractor
+from modules.pdf_reader import LazyPdfReader
+
+
+def write_pdf(path, page_texts):
+    """페이지마다 한 줄의 텍스트가 있는 PDF 생성"""
+    writer = PdfWriter()
+    font = writer._add_object(DictionaryObject({
+        NameObject("/Type"): NameObject("/Font"),
+        NameObject("/Subtype"): NameObject("/Type1"),
+        NameObject("/BaseFont"): NameObject("/Helvetica"),
+    }))
+    for text in page_texts:
+        page = PageObject.create_blank_page(None, 600, 200)
+        page[NameObject("/Resources")] = DictionaryObject({
+            NameObject("/Font"): DictionaryObject({NameObject("/F1"): font}),
+        })
+        stream = DecodedStreamObject()
+        stream.set_data(f"BT /F1 10 Tf 10 100 Td ({text}) Tj ET".encode("latin-1"))
+        page[NameObject("/Contents")] = writer._add_object(stream)
+        writer.add_page(page)
+    with open(path, "wb") as f:
+        writer.write(f)
+
+
+class TestLazyPdfReader(unittest.TestCase):
+    """LazyPdfReader 테스트"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.test_dir = tempfile.mkdtemp()
+        self.path = str(Path(self.test_dir) / "doc.pdf")
+        write_pdf(self.path, [f"page {i}" for i in range(8)])
+
+    def tearDown(self):
+        """테스트 정리"""
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def test_page_count_without_flattening(self):
+        """페이지 트리를 펼치지 않고 페이지 수를 읽음"""
+        with patch.object(PdfReader, "_flatten") as flatten:
+            with LazyPdfReader(self.path) as pdf:
+                self.assertEqual(pdf.page_count, 8)
+        flatten.assert_not_called()
+
+    def test_page_lookup(self):
+        """원하는 페이지의 텍스트를 읽음"""
+        with LazyPdfReader(self.path) as pdf:
+            self.assertIn("page 6", pdf.page(6).extract_text())
+            with self.assertRaises(IndexError):
+                pdf.page(8)
+
+    def test_extraction_stops_at_limit(self):
+        """글자 수 한도에 도달하면 남은 페이지는 읽지 않음"""
+        with LazyPdfReader(self.path) as pdf:
+            pages = pdf.extract_pages(range(8), max_chars=10)
+
+        self.assertEqual([index for index, _ in pages], [0, 1])
+
+
+class TestPdfExtraction(unittest.TestCase):
+    """FileExtractor의 PDF 추출 테스트"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.test_dir = tempfile.mkdtemp()
+        self.extractor = FileExtractor(use_process_pool=False)
+
+    def tearDown(self):
+        """테스트 정리"""
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def test_long_document_reads_front_and_rear_pages(self):
+        """긴 문서는 앞 2쪽과 뒤 2쪽만 추출"""
+        path = str(Path(self.test_dir) / "long.pdf")
+        write_pdf(path, [f"page {i}" for i in range(10)])
+
+        with patch.object(PageObject, "extract_text", autospec=True, side_effect=lambda page: "text") as extract:
+            result = self.extractor.extract_text_from_pdf(path)
+
+        self.assertEqual(extract.call_count, 4)
+        self.assertEqual(result["metadata"]["page_count"], 10)
+        self.assertIn("[중간 페이지 생략]", result["content"])
+
+    def test_short_document_reads_all_pages(self):
+        """짧은 문서는 모든 페이지를 순서대로 추출"""
+        path = str(Path(self.test_dir) / "short.pdf")
+        write_pdf(path, ["alpha", "beta", "gamma"])
+
+        content = self.extractor.extract_text_from_pdf(path)["content"]
+
+        self.assertLess(content.index("alpha"), content.index("beta"))
+        self.assertLess(content.index("beta"), content.index("gamma"))
+        self.assertNotIn("생략", content)
+
+    def test_budget_limits_pages_read(self):
+        """앞부분이 한도를 채우면 나머지 앞쪽 페이지는 건너뜀"""
+        path = str(Path(self.test_dir) / "dense.pdf")
+        write_pdf(path, ["x"] * 5)
+
+        with patch("modules.extractor.cfg.MAX_CONTENT_LENGTH", 100), \
+                patch.object(PageObject, "extract_text", autospec=True, side_effect=lambda page: "y" * 80) as extract:
+            result = self.extractor.extract_text_from_pdf(path)
+
+        # 앞 1쪽 + 뒤 1쪽에서 각각 한도의 절반(50자)을 넘김
+        self.assertEqual(extract.call_count, 2)
+        self.assertIn("[중간 페이지 생략]", result["content"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+"""
+프롬프트 내용 압축 테스트
+
+공급자별 토큰 추정, 공백/반복 줄 정리, 토큰 예산 적용을 검증합니다.
+"""
+
+import unittest
+from pathlib import Path
+import sys
+
+# 프로젝트 루트를 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from modules.classifier import FileClassifier
+from modules.llm.tokens import estimate_tokens
+from modules.prompt_builder import PromptBuilder, normalize_whitespace, strip_boilerplate
+
+
+class TestEstimateTokens(unittest.TestCase):
+    """토큰 추정 테스트"""
+
+    def test_korean_costs_more_than_english(self):
+        """같은 글자 수라면 한국어가 영어보다 토큰이 많음"""
+        self.assertGreater(estimate_tokens("가" * 400, "openai"), estimate_tokens("a" * 400, "openai"))
+
+    def test_provider_specific_ratios(self):
+        """공급자마다 한국어 토큰 추정이 다름"""
+        text = "세금계산서 발행 내역" * 20
+        self.assertGreater(estimate_tokens(text, "claude"), estimate_tokens(text, "openai"))
+
+
+class TestContentCleanup(unittest.TestCase):
+    """공백 및 반복 줄 정리 테스트"""
+
+    def test_normalize_whitespace(self):
+        """연속 공백과 빈 줄을 합침"""
+        self.assertEqual(normalize_whitespace("a   b\t c\n\n\n\nd  \n\n"), "a b c\n\nd")
+
+    def test_strip_headers_footers_and_page_numbers(self):
+        """반복되는 머리글과 쪽 번호, 구분선 제거"""
+        text = "ACME 내부 문서\n본문 1\nPage 1 of 2\n-----\nACME 내부 문서\n본문 2\n- 2 -"
+
+        self.assertEqual(strip_boilerplate(text), "ACME 내부 문서\n본문 1\n본문 2")
+
+    def test_strip_numbered_footers(self):
+        """쪽 번호만 다른 긴 바닥글은 제거하고 짧은 번호 줄은 유지"""
+        text = "\n".join(f"제 {i} 조\nACME 기밀 문서 - {i}쪽 / 전체 3쪽" for i in range(1, 4))
+
+        self.assertEqual(strip_boilerplate(text), "제 1 조\nACME 기밀 문서 - 1쪽 / 전체 3쪽\n제 2 조\n제 3 조")
+
+
+class TestPromptBuilder(unittest.TestCase):
+    """토큰 예산 압축 테스트"""
+
+    def test_short_content_is_kept(self):
+        """예산 안의 내용은 공백만 정리"""
+        self.assertEqual(PromptBuilder("openai", 100).compress("회의록   안건\n\n\n결정 사항"), "회의록 안건\n\n결정 사항")
+
+    def test_content_fits_budget(self):
+        """긴 내용은 예산 안으로 줄어듦"""
+        builder = PromptBuilder("claude", 50)
+        paragraphs = [f"{i}번째 단락 고유단어{i} 내용 설명 " * 5 for i in range(20)]
+
+        compressed = builder.compress("\n\n".join(paragraphs))
+
+        self.assertLessEqual(builder.count(compressed), 50)
+        self.assertTrue(compressed.startswith("0번째 단락"))
+
+    def test_informative_sections_are_preferred(self):
+        """반복 단락보다 새 정보가 있는 단락을 선택"""
+        builder = PromptBuilder("openai", 60)
+        text = "\n\n".join(["계약서 제목", "같은 내용 반복 " * 12, "같은 내용 반복 " * 12, "지급 조건 위약금 해지 사유"])
+
+        compressed = builder.compress(text)
+
+        self.assertIn("계약서 제목", compressed)
+        self.assertIn("지급 조건 위약금 해지 사유", compressed)
+        self.assertIn("...", compressed)
+
+    def test_single_block_is_truncated(self):
+        """단락이 하나뿐이면 예산에 맞춰 자름"""
+        builder = PromptBuilder("openai", 20)
+
+        compressed = builder.compress("word " * 200)
+
+        self.assertLessEqual(builder.count(compressed), 20)
+        self.assertTrue(compressed.endswith("..."))
+
+    def test_classifier_prompt_uses_budget(self):
+        """분류 프롬프트의 내용이 예산에 맞게 압축됨"""
+        classifier = FileClassifier(api_key="test_key")
+        classifier.prompt_builder = PromptBuilder("openai", 30)
+
+        prompt = classifier._prepare_classification_prompt("a.txt", "txt", "긴 내용입니다 " * 200)
+
+        self.assertLess(len(prompt), 600)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+"""
+API 속도 제한기 테스트
+
+토큰 버킷, AIMD 동시성 조절, Retry-After 처리를 검증합니다.
+"""
+
+import asyncio
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+import sys
+
+# 프로젝트 루트를 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from modules.llm.openai_client import OpenAIClient
+from modules.llm.rate_limiter import (
+    AdaptiveRateLimiter,
+    RateLimitExceeded,
+    TokenBucket,
+    is_rate_limit_error,
+    parse_retry_after,
+)
+
+
+class RateLimitedError(Exception):
+    """429 응답을 흉내 내는 예외"""
+
+    def __init__(self, headers):
+        super().__init__("Too Many Requests")
+        self.status_code = 429
+        self.response = MagicMock(status_code=429, headers=headers)
+
+
+class TestTokenBucket(unittest.TestCase):
+    """토큰 버킷 테스트"""
+
+    def test_reserve_beyond_budget_returns_wait(self):
+        """예산을 넘는 예약은 보충 시간만큼 대기"""
+        bucket = TokenBucket(per_minute=60)
+        now = bucket.updated
+
+        self.assertEqual(bucket.reserve(60, now), 0.0)
+        self.assertAlmostEqual(bucket.reserve(2, now), 2.0)
+
+    def test_zero_budget_is_unlimited(self):
+        """0이면 제한하지 않음"""
+        bucket = TokenBucket(per_minute=0)
+        self.assertEqual(bucket.reserve(10 ** 6, time.monotonic()), 0.0)
+
+
+class TestAdaptiveRateLimiter(unittest.TestCase):
+    """AIMD 동시성 조절 테스트"""
+
+    def test_rate_limit_halves_concurrency_and_blocks(self):
+        """429 발생 시 동시성 절반 감소 및 Retry-After 동안 차단"""
+        limiter = AdaptiveRateLimiter("test", max_concurrency=8)
+
+        limiter.on_rate_limited(retry_after=30)
+
+        self.assertEqual(limiter.concurrency_limit, 4)
+        self.assertGreater(limiter._try_enter(0), 29)
+
+    def test_success_grows_concurrency(self):
+        """성공이 이어지면 동시성이 다시 증가"""
+        limiter = AdaptiveRateLimiter("test", max_concurrency=4)
+        limiter.on_rate_limited(retry_after=0)
+        self.assertEqual(limiter.concurrency_limit, 2)
+
+        for _ in range(2):
+            limiter.on_success()
+
+        self.assertEqual(limiter.concurrency_limit, 3)
+
+    def test_acquire_respects_concurrency_limit(self):
+        """동시 실행 수가 한도를 넘지 않음"""
+        limiter = AdaptiveRateLimiter("test", max_concurrency=2)
+        peak = 0
+
+        async def task():
+            nonlocal peak
+            async with limiter.acquire():
+                peak = max(peak, limiter.in_flight)
+                await asyncio.sleep(0.02)
+
+        async def run():
+            await asyncio.gather(*(task() for _ in range(6)))
+
+        asyncio.run(run())
+
+        self.assertEqual(peak, 2)
+        self.assertEqual(limiter.in_flight, 0)
+
+
+class TestRetryAfter(unittest.TestCase):
+    """Retry-After 해석 테스트"""
+
+    def test_parse_seconds_and_milliseconds(self):
+        """초 단위와 밀리초 단위 헤더 해석"""
+        self.assertEqual(parse_retry_after(RateLimitedError({"retry-after": "7"})), 7.0)
+        self.assertEqual(parse_retry_after(RateLimitedError({"retry-after-ms": "1500"})), 1.5)
+        self.assertIsNone(parse_retry_after(RateLimitedError({})))
+
+    def test_detects_rate_limit_by_status(self):
+        """상태 코드로 속도 제한 판별"""
+        self.assertTrue(is_rate_limit_error(RateLimitedError({})))
+        self.assertFalse(is_rate_limit_error(ValueError("bad json")))
+
+
+class TestClientRateLimiting(unittest.TestCase):
+    """클라이언트 공통 속도 제한 경로 테스트"""
+
+    def test_client_raises_rate_limit_exceeded(self):
+        """429 응답은 RateLimitExceeded로 변환되고 리미터에 반영"""
+        limiter = AdaptiveRateLimiter("openai", max_concurrency=4)
+        client = OpenAIClient("key", "https://api.openai.com/v1", "gpt-4", 0.0, 100, 30)
+        client.async_client = MagicMock()
+        client.async_client.chat.completions.create = AsyncMock(
+            side_effect=RateLimitedError({"retry-after": "0"})
+        )
+
+        with patch("modules.llm.base.get_rate_limiter", return_value=limiter), \
+             patch("modules.llm.base.get_response_cache", return_value=None):
+            with self.assertRaises(RateLimitExceeded) as ctx:
+                asyncio.run(client.call_async("prompt"))
+
+        self.assertEqual(ctx.exception.retry_after, 0.0)
+        self.assertEqual(limiter.concurrency_limit, 2)
+        self.assertEqual(limiter.in_flight, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
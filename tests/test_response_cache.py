@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+"""
+LLM 응답 캐시 테스트
+
+프롬프트 단위 캐시의 LRU 동작, 디스크 영속성, 클라이언트 연동을 검증합니다.
+"""
+
+import asyncio
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+import sys
+
+# 프로젝트 루트를 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from modules.llm.openai_client import OpenAIClient
+from modules.llm.rate_limiter import AdaptiveRateLimiter
+from modules.llm.response_cache import LLMResponseCache, make_cache_key
+from modules.prompts import CLASSIFICATION_PROMPT, EXISTING_FOLDERS_HINT
+
+
+class TestLLMResponseCache(unittest.TestCase):
+    """응답 캐시 테스트"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.temp_dir, "llm_cache.db")
+
+    def tearDown(self):
+        """테스트 정리"""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_key_depends_on_model_and_temperature(self):
+        """모델이나 temperature가 다르면 다른 키"""
+        base = make_cache_key("openai", "gpt-4", 0.0, "prompt")
+        self.assertEqual(base, make_cache_key("openai", "gpt-4", 0, "prompt"))
+        self.assertNotEqual(base, make_cache_key("openai", "gpt-4o", 0.0, "prompt"))
+        self.assertNotEqual(base, make_cache_key("openai", "gpt-4", 0.7, "prompt"))
+
+    def test_key_ignores_existing_folders_hint(self):
+        """기존 폴더 목록이 달라도 같은 캐시 키"""
+        client = OpenAIClient("key", "https://api.openai.com/v1", "gpt-4", 0.0, 100, 30)
+        prompt = CLASSIFICATION_PROMPT.format(filename="a.pdf", file_type="pdf", content="내용", existing_folders="{hint}")
+
+        with_hint = prompt.replace("{hint}", EXISTING_FOLDERS_HINT.format(folders="청구서, 회의록"))
+        other_hint = prompt.replace("{hint}", EXISTING_FOLDERS_HINT.format(folders="회의록"))
+
+        self.assertEqual(client.cache_key(with_hint), client.cache_key(prompt.replace("{hint}", "")))
+        self.assertEqual(client.cache_key(with_hint), client.cache_key(other_hint))
+
+    def test_memory_lru_eviction(self):
+        """메모리 계층은 가장 오래 사용하지 않은 항목부터 제거"""
+        cache = LLMResponseCache(None, memory_size=2)
+        cache.put("a", "1")
+        cache.put("b", "2")
+        cache.get("a")
+        cache.put("c", "3")
+
+        self.assertEqual(cache.get("a"), "1")
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("c"), "3")
+
+    def test_disk_tier_survives_restart(self):
+        """디스크 계층은 재시작 후에도 유지"""
+        cache = LLMResponseCache(self.db_path)
+        cache.put("key", "response")
+        cache.close()
+
+        reopened = LLMResponseCache(self.db_path)
+        self.assertEqual(reopened.get("key"), "response")
+        reopened.invalidate("key")
+        self.assertIsNone(reopened.get("key"))
+        reopened.close()
+
+    def test_async_disk_tier_runs_off_event_loop(self):
+        """비동기 조회/저장의 디스크 계층은 이벤트 루프 밖의 스레드에서 실행"""
+        cache = LLMResponseCache(self.db_path, memory_size=0)
+        loop_threads = []
+        disk_threads = []
+        original_get, original_put = cache._get_disk, cache._put_disk
+
+        def get_disk(key):
+            disk_threads.append(threading.get_ident())
+            return original_get(key)
+
+        def put_disk(key, response):
+            disk_threads.append(threading.get_ident())
+            original_put(key, response)
+
+        cache._get_disk, cache._put_disk = get_disk, put_disk
+
+        async def run():
+            loop_threads.append(threading.get_ident())
+            await cache.put_async("key", "response")
+            return await cache.get_async("key")
+
+        self.assertEqual(asyncio.run(run()), "response")
+        self.assertEqual(len(disk_threads), 2)
+        self.assertNotIn(loop_threads[0], disk_threads)
+        cache.close()
+
+    def test_identical_prompts_call_api_once(self):
+        """같은 프롬프트는 API를 한 번만 호출"""
+        cache = LLMResponseCache(self.db_path)
+        client = OpenAIClient("key", "https://api.openai.com/v1", "gpt-4", 0.0, 100, 30)
+        response = MagicMock()
+        response.choices = [MagicMock()]
+        response.choices[0].message.content = "ok"
+        client.async_client = MagicMock()
+        client.async_client.chat.completions.create = AsyncMock(return_value=response)
+
+        async def run():
+            return [await client.call_async("same prompt") for _ in range(3)]
+
+        with patch("modules.llm.base.get_response_cache", return_value=cache), \
+             patch("modules.llm.base.get_rate_limiter", return_value=AdaptiveRateLimiter("openai")):
+            results = asyncio.run(run())
+
+        self.assertEqual(results, ["ok", "ok", "ok"])
+        client.async_client.chat.completions.create.assert_awaited_once()
+        cache.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
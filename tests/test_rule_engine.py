@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+"""
+규칙 엔진 테스트
+
+Aho-Corasick 매칭, 규칙 우선순위, 사용자 규칙 파일 재로드를 검증합니다.
+"""
+
+import json
+import os
+import shutil
+import tempfile
+import time
+import unittest
+from pathlib import Path
+import sys
+
+# 프로젝트 루트를 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from modules.rule_engine import AhoCorasick, Rule, RuleEngine
+
+
+class TestAhoCorasick(unittest.TestCase):
+    """Aho-Corasick 오토마톤 테스트"""
+
+    def test_finds_overlapping_patterns(self):
+        """겹치는 패턴을 모두 찾음"""
+        automaton = AhoCorasick(["he", "she", "his", "hers"])
+        self.assertEqual(automaton.find("ushers"), {"he", "she", "hers"})
+
+    def test_no_match(self):
+        """일치하는 패턴이 없으면 빈 집합"""
+        self.assertEqual(AhoCorasick(["invoice"]).find("photo"), set())
+
+
+class TestRuleEngine(unittest.TestCase):
+    """규칙 엔진 테스트"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.test_dir = tempfile.mkdtemp()
+        self.rules_path = os.path.join(self.test_dir, "user_rules.json")
+
+    def tearDown(self):
+        """테스트 정리"""
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def write_rules(self, rules):
+        with open(self.rules_path, "w", encoding="utf-8") as f:
+            json.dump({"rules": rules}, f, ensure_ascii=False)
+
+    def test_default_rules_keep_keyword_over_extension(self):
+        """기본 규칙: 키워드가 확장자보다 우선"""
+        engine = RuleEngine()
+
+        _, result = engine.match("invoice_scan.png", "png")
+
+        self.assertEqual(result["folder_name"], "청구서")
+        self.assertEqual(result["reason"], "파일명 키워드 매칭 ('invoice')")
+
+    def test_user_rules_with_priority(self):
+        """사용자 규칙은 우선순위에 따라 적용"""
+        self.write_rules([
+            {"folder": "세금계산서", "keyword": "세금계산서"},
+            {"folder": "스캔", "glob": "scan_*.pdf", "priority": 300},
+            {"folder": "주문서", "regex": r"^po-\d{6}"},
+        ])
+        engine = RuleEngine(self.rules_path)
+
+        self.assertEqual(engine.match("2024_세금계산서.pdf", "pdf")[1]["folder_name"], "세금계산서")
+        self.assertEqual(engine.match("scan_invoice.pdf", "pdf")[1]["folder_name"], "스캔")
+        self.assertEqual(engine.match("PO-123456.xlsx", "xlsx")[1]["folder_name"], "주문서")
+        self.assertIsNone(engine.match("notes.txt", "txt"))
+
+    def test_glob_with_character_class(self):
+        """문자 클래스가 있는 glob도 fnmatch와 같이 매칭"""
+        engine = RuleEngine()
+        engine.add_rules([Rule("분기 보고서", glob="[abcd]ef*", priority=300)])
+
+        self.assertEqual(engine.match("aef.xyz", "xyz")[1]["folder_name"], "분기 보고서")
+        self.assertIsNone(engine.match("xef.xyz", "xyz"))
+
+    def test_size_rule(self):
+        """파일 크기 조건"""
+        engine = RuleEngine()
+        engine.add_rules([Rule("대용량 영상", extensions=["mp4"], min_size=1000, priority=200)])
+
+        self.assertEqual(engine.match("a.mp4", "mp4", file_size=5000)[1]["folder_name"], "대용량 영상")
+        self.assertEqual(engine.match("a.mp4", "mp4", file_size=10)[1]["folder_name"], "비디오")
+
+    def test_hot_reload_on_change(self):
+        """규칙 파일이 바뀌면 다시 로드"""
+        self.write_rules([{"folder": "견적서", "keyword": "quote"}])
+        engine = RuleEngine(self.rules_path, reload_interval=0)
+        self.assertEqual(engine.match("quote_a.txt", "txt")[1]["folder_name"], "견적서")
+
+        self.write_rules([{"folder": "견적 문서", "keyword": "quote"}])
+        stat = os.stat(self.rules_path)
+        os.utime(self.rules_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        self.assertEqual(engine.match("quote_a.txt", "txt")[1]["folder_name"], "견적 문서")
+
+    def test_invalid_rule_file_keeps_defaults(self):
+        """손상된 규칙 파일이면 기본 규칙 유지"""
+        with open(self.rules_path, "w", encoding="utf-8") as f:
+            f.write("{not json")
+        engine = RuleEngine(self.rules_path)
+
+        self.assertEqual(engine.match("photo.jpg", "jpg")[1]["folder_name"], "이미지")
+
+    def test_many_keyword_rules(self):
+        """규칙이 많아도 올바르게 매칭"""
+        engine = RuleEngine()
+        engine.add_rules(Rule(f"고객{i}", keyword=f"customer{i:05d}") for i in range(5000))
+
+        started = time.perf_counter()
+        _, result = engine.match("report_customer04321_q3.xlsx", "xlsx")
+        elapsed = time.perf_counter() - started
+
+        self.assertEqual(result["folder_name"], "고객4321")
+        self.assertLess(elapsed, 0.05)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+"""
+규칙 자동 승격 테스트
+
+처리 이력에서 파일명 토큰 -> 폴더 규칙을 채굴, 승격, 취소하는 과정을 검증합니다.
+"""
+
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+import sys
+
+# 프로젝트 루트를 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from modules.history_db import ProcessingHistory
+from modules.rule_engine import RuleEngine
+from modules.rule_miner import RuleMiner, tokenize
+
+
+def invoice_rows(count, folder="세금계산서"):
+    return [(f"세금계산서_{2024000 + i}_A사.pdf", None, folder, "문서") for i in range(count)]
+
+
+class TestTokenize(unittest.TestCase):
+    """파일명 토큰 분리 테스트"""
+
+    def test_digits_and_separators_are_dropped(self):
+        """숫자와 구분자는 토큰에서 제외"""
+        tokens, extension = tokenize("2024년_3월_세금계산서(A사).PDF")
+
+        self.assertEqual(tokens, {"세금계산서", "a사"})
+        self.assertEqual(extension, "pdf")
+
+
+class TestRuleMiner(unittest.TestCase):
+    """규칙 채굴 테스트"""
+
+    def test_stable_token_is_mined(self):
+        """충분히 반복되고 일관된 토큰만 후보가 됨"""
+        miner = RuleMiner(None, min_support=20, min_consistency=0.95)
+        rows = invoice_rows(30) + [(f"memo_{i}.txt", None, f"메모{i % 3}", "문서") for i in range(30)]
+
+        mined = miner.mine(rows)
+
+        self.assertEqual([(m["keyword"], m["extension"], m["folder_name"]) for m in mined],
+                         [("세금계산서", "pdf", "세금계산서")])
+        self.assertEqual(mined[0]["support"], 30)
+
+    def test_inconsistent_token_is_not_mined(self):
+        """폴더가 엇갈리는 토큰은 후보가 되지 않음"""
+        miner = RuleMiner(None, min_support=20, min_consistency=0.95)
+        rows = invoice_rows(25) + invoice_rows(5, folder="영수증")
+
+        self.assertEqual(miner.mine(rows), [])
+
+    def test_below_support_is_not_mined(self):
+        """이력이 부족하면 후보가 되지 않음"""
+        miner = RuleMiner(None, min_support=20)
+
+        self.assertEqual(miner.mine(invoice_rows(19)), [])
+
+
+class TestRulePromotion(unittest.TestCase):
+    """이력 DB 기반 승격, 감사, 취소 테스트"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.test_dir = tempfile.mkdtemp()
+        self.history = ProcessingHistory(str(Path(self.test_dir) / "history.db"))
+        for i, (filename, _, folder, category) in enumerate(invoice_rows(25)):
+            self.history.save_result(f"h{i}", filename, 1, {"folder_name": folder, "category": category})
+        self.history.save_result("fb", "세금계산서_x.pdf", 1, {"folder_name": "기타", "reason": "폴백 분류 (오류: x)"})
+        self.history.flush(timeout=5)
+        self.miner = RuleMiner(self.history, min_support=20, exclude_reason_prefix="폴백 분류")
+
+    def tearDown(self):
+        """테스트 정리"""
+        self.miner.stop()
+        self.history.close()
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def test_promoted_rule_is_used_by_engine(self):
+        """승격된 규칙이 규칙 엔진에서 적용됨"""
+        added = self.miner.promote()
+        engine = RuleEngine()
+        engine.set_promoted_rules(self.miner.active_rules())
+
+        self.assertEqual(len(added), 1)
+        rule, result = engine.match("세금계산서_2025_B사.pdf", "pdf")
+        self.assertEqual(result["folder_name"], "세금계산서")
+        self.assertIn("학습된 규칙", result["reason"])
+        self.assertIsNone(engine.match("세금계산서_2025_B사.hwp", "hwp"))
+        self.assertIsNone(engine.match("가세금계산서들.pdf", "pdf"))
+
+    def test_promotion_is_idempotent(self):
+        """같은 규칙은 한 번만 승격"""
+        self.miner.promote()
+
+        self.assertEqual(self.miner.promote(), [])
+        self.assertEqual(len(self.history.get_promoted_rules()), 1)
+
+    def test_revoked_rule_stays_revoked(self):
+        """취소된 규칙은 목록에 남고 다시 승격되지 않음"""
+        rule_id = self.miner.promote()[0]["id"]
+
+        self.assertTrue(self.history.revoke_promoted_rule(rule_id))
+        self.assertFalse(self.history.revoke_promoted_rule(rule_id))
+        self.assertEqual(self.miner.promote(), [])
+        self.assertEqual(self.miner.active_rules(), [])
+        audit = self.history.get_promoted_rules(include_revoked=True)
+        self.assertEqual(audit[0]["status"], "revoked")
+        self.assertIsNotNone(audit[0]["revoked_at"])
+
+    def test_background_job_updates_engine(self):
+        """백그라운드 채굴이 규칙 엔진을 갱신"""
+        engine = RuleEngine()
+        self.miner.start(interval=60, on_update=engine.set_promoted_rules)
+
+        for _ in range(100):
+            if engine.match("세금계산서_1.pdf", "pdf"):
+                break
+            self.miner._stop.wait(0.02)
+
+        self.assertEqual(engine.match("세금계산서_1.pdf", "pdf")[1]["folder_name"], "세금계산서")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+"""
+디렉토리 스캔 모듈 테스트
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+import sys
+
+# 프로젝트 루트를 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from modules.scanner import iter_files, next_chunk
+from modules.history_db import ProcessingHistory
+
+
+class TestIterFiles(unittest.TestCase):
+    """iter_files 테스트"""
+
+    def setUp(self):
+        """테스트 폴더 구성"""
+        self.test_dir = tempfile.mkdtemp()
+        root = Path(self.test_dir)
+        (root / "a.txt").write_text("a", encoding="utf-8")
+        (root / ".hidden").write_text("h", encoding="utf-8")
+        (root / "sub").mkdir()
+        (root / "sub" / "b.txt").write_text("bb", encoding="utf-8")
+
+    def tearDown(self):
+        """테스트 폴더 삭제"""
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def test_non_recursive_skips_hidden_and_subfolders(self):
+        """하위 폴더와 숨김 파일 제외"""
+        names = [os.path.basename(path) for path, _ in iter_files(self.test_dir)]
+        self.assertEqual(names, ["a.txt"])
+
+    def test_recursive_scan(self):
+        """하위 폴더 포함 스캔"""
+        names = sorted(os.path.basename(path) for path, _ in iter_files(self.test_dir, recursive=True))
+        self.assertEqual(names, ["a.txt", "b.txt"])
+
+    def test_signature_matches_os_stat(self):
+        """DirEntry 기반 시그니처가 os.stat 기반 시그니처와 동일"""
+        for path, signature in iter_files(self.test_dir, recursive=True):
+            self.assertEqual(signature, ProcessingHistory.get_stat_signature(path))
+
+    def test_next_chunk(self):
+        """청크 단위로 가져오기"""
+        scanner = iter_files(self.test_dir, recursive=True)
+        self.assertEqual(len(next_chunk(scanner, 1)), 1)
+        self.assertEqual(len(next_chunk(scanner, 10)), 1)
+        self.assertEqual(next_chunk(scanner, 10), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,205 @@
+# -*- coding: utf-8 -*-
+"""
+구조화 출력 테스트
+
+공급자별 JSON 스키마 요청, 미지원 시 하위 모드로의 전환, 잘리거나 설명이 섞인
+응답의 복구 파싱을 검증합니다.
+"""
+
+import asyncio
+import unittest
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+import sys
+
+# 프로젝트 루트를 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from google.api_core import exceptions as google_exceptions
+from openai import BadRequestError
+
+from modules.classifier import FileClassifier
+from modules.llm.claude_client import ClaudeClient
+from modules.llm.gemini_client import GeminiClient
+from modules.llm.openai_client import OpenAIClient
+from modules.llm.structured import (
+    CLASSIFICATION_SCHEMA,
+    StreamingJSONParser,
+    parse_json_lenient,
+    strip_unsupported_keys,
+)
+
+
+def _bad_request(message, param=None):
+    """응답 객체 없이 만든 BadRequestError"""
+    error = BadRequestError.__new__(BadRequestError)
+    Exception.__init__(error, message)
+    error.param = param
+    return error
+
+
+class TestLenientParsing(unittest.TestCase):
+    """복구 파싱 테스트"""
+
+    def test_fenced_json_with_prose(self):
+        """코드 블록과 설명이 섞인 응답"""
+        text = '결과입니다:\n```json\n{"folder_name": "청구서", "confidence": 0.9}\n```\n참고하세요.'
+
+        self.assertEqual(parse_json_lenient(text), {"folder_name": "청구서", "confidence": 0.9})
+
+    def test_truncated_object_keeps_complete_members(self):
+        """잘린 응답은 완성된 필드까지 복구"""
+        text = '{"folder_name": "회의록", "category": "문서", "reason": "회의 내'
+
+        self.assertEqual(parse_json_lenient(text), {"folder_name": "회의록", "category": "문서"})
+
+    def test_truncated_batch_keeps_complete_entries(self):
+        """잘린 배치 응답은 완성된 항목까지 복구"""
+        text = '{"results": [{"index": 0, "folder_name": "청구서"}, {"index": 1, "folder_na'
+
+        self.assertEqual(parse_json_lenient(text), {"results": [{"index": 0, "folder_name": "청구서"}, {"index": 1}]})
+
+    def test_trailing_comma(self):
+        """끝의 쉼표 무시"""
+        self.assertEqual(parse_json_lenient('{"folder_name": "사진",}'), {"folder_name": "사진"})
+
+    def test_not_json_raises(self):
+        """JSON이 없으면 ValueError"""
+        with self.assertRaises(ValueError):
+            parse_json_lenient("This is not JSON")
+
+    def test_streaming_chunks(self):
+        """조각 단위로 넣어도 같은 결과"""
+        parser = StreamingJSONParser()
+        for chunk in ('{"folder_', 'name": "계약', '서", "confid', 'ence": 0.8}'):
+            parser.feed(chunk)
+
+        self.assertEqual(parser.value(), {"folder_name": "계약서", "confidence": 0.8})
+
+    def test_strip_unsupported_keys(self):
+        """Gemini용 스키마에서 additionalProperties 제거"""
+        schema = strip_unsupported_keys(CLASSIFICATION_SCHEMA["schema"])
+
+        self.assertNotIn("additionalProperties", schema)
+        self.assertIn("folder_name", schema["properties"])
+
+
+class TestProviderStructuredOutput(unittest.TestCase):
+    """공급자별 구조화 출력 요청 테스트"""
+
+    def setUp(self):
+        """테스트 설정 (응답 캐시 비활성화)"""
+        patcher = patch("modules.llm.base.get_response_cache", return_value=None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _openai_client(self, create):
+        client = OpenAIClient("key", "https://api.openai.com/v1", "gpt-4o-mini", 0.0, 100, 30)
+        client.client = MagicMock()
+        client.client.chat.completions.create = create
+        return client
+
+    def test_openai_requests_json_schema(self):
+        """OpenAI: response_format에 json_schema 전달"""
+        reply = MagicMock()
+        reply.choices = [MagicMock(message=MagicMock(content='{"folder_name": "청구서"}'))]
+        create = MagicMock(return_value=reply)
+        client = self._openai_client(create)
+
+        client.call("prompt", response_schema=CLASSIFICATION_SCHEMA)
+
+        response_format = create.call_args.kwargs["response_format"]
+        self.assertEqual(response_format["type"], "json_schema")
+        self.assertTrue(response_format["json_schema"]["strict"])
+
+    def test_openai_downgrades_when_rejected(self):
+        """OpenAI: json_schema를 거부하면 json_object로 재시도하고 기억"""
+        reply = MagicMock()
+        reply.choices = [MagicMock(message=MagicMock(content='{"folder_name": "청구서"}'))]
+        create = MagicMock(side_effect=[_bad_request("json_schema is not supported", "response_format"), reply, reply])
+        client = self._openai_client(create)
+
+        self.assertEqual(client.call("prompt", response_schema=CLASSIFICATION_SCHEMA), '{"folder_name": "청구서"}')
+        client.call("other prompt", response_schema=CLASSIFICATION_SCHEMA)
+
+        formats = [call.kwargs["response_format"]["type"] for call in create.call_args_list]
+        self.assertEqual(formats, ["json_schema", "json_object", "json_object"])
+
+    def test_openai_keeps_mode_on_unrelated_json_error(self):
+        """OpenAI: response_format과 무관한 오류는 구조화 출력 모드를 바꾸지 않음"""
+        create = MagicMock(side_effect=_bad_request("Invalid JSON in messages", "messages"))
+        client = self._openai_client(create)
+
+        with self.assertRaises(BadRequestError):
+            client.call("prompt", response_schema=CLASSIFICATION_SCHEMA)
+
+        self.assertEqual(client._structured_mode, 0)
+
+    def test_openai_plain_call_has_no_response_format(self):
+        """OpenAI: 스키마가 없으면 response_format 없이 호출"""
+        reply = MagicMock()
+        reply.choices = [MagicMock(message=MagicMock(content="ok"))]
+        create = MagicMock(return_value=reply)
+
+        self._openai_client(create).call("prompt")
+
+        self.assertNotIn("response_format", create.call_args.kwargs)
+
+    def test_claude_reads_forced_tool_input(self):
+        """Claude: 강제된 도구 호출의 입력을 JSON 문자열로 반환"""
+        client = ClaudeClient("key", "claude-3-haiku-20240307", 0.0, 100)
+        block = MagicMock(type="tool_use", input={"folder_name": "회의록", "confidence": 0.9})
+        message = MagicMock(content=[block])
+        client.async_client = MagicMock()
+        client.async_client.messages.create = AsyncMock(return_value=message)
+
+        text = asyncio.run(client.call_async("prompt", response_schema=CLASSIFICATION_SCHEMA))
+
+        self.assertEqual(parse_json_lenient(text), {"folder_name": "회의록", "confidence": 0.9})
+        kwargs = client.async_client.messages.create.call_args.kwargs
+        self.assertEqual(kwargs["tool_choice"], {"type": "tool", "name": CLASSIFICATION_SCHEMA["name"]})
+
+    def test_gemini_disables_json_mode_only_when_rejected(self):
+        """Gemini: JSON 모드 필드를 거부할 때만 일반 출력으로 전환"""
+        client = GeminiClient("key", "gemini-1.5-flash", 0.0, 100)
+        reply = MagicMock(text='{"folder_name": "청구서"}')
+        client.model = MagicMock()
+        client.model.generate_content = MagicMock(side_effect=[
+            google_exceptions.InvalidArgument("Request payload size exceeds the limit"),
+            google_exceptions.InvalidArgument("response_mime_type is not supported for this model"),
+            reply,
+        ])
+
+        with self.assertRaises(google_exceptions.InvalidArgument):
+            client.call("prompt", response_schema=CLASSIFICATION_SCHEMA)
+        self.assertTrue(client._structured_output)
+
+        self.assertEqual(client.call("prompt", response_schema=CLASSIFICATION_SCHEMA), '{"folder_name": "청구서"}')
+        self.assertFalse(client._structured_output)
+
+
+class TestClassifierParsing(unittest.TestCase):
+    """분류기의 응답 파싱 테스트"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.classifier = FileClassifier(api_key="test_key")
+
+    def test_missing_folder_name_raises(self):
+        """folder_name이 없으면 파싱 실패"""
+        with self.assertRaises(ValueError):
+            self.classifier._parse_response('{"category": "문서"}')
+
+    def test_batch_results_wrapper(self):
+        """배치 응답의 results 배열을 읽고 folder_name 없는 항목은 건너뜀"""
+        text = '{"results": [{"index": 1, "folder_name": "사진"}, {"index": 0, "category": "문서"}]}'
+
+        entries = self.classifier._parse_batch_response(text, 2)
+
+        self.assertIsNone(entries[0])
+        self.assertEqual(entries[1]["folder_name"], "사진")
+
+
+if __name__ == "__main__":
+    unittest.main()